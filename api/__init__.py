@@ -0,0 +1,6 @@
+"""
+ProjectTracker JSON API
+- Streamlit 과 별도 프로세스로 실행하는 ASGI(Starlette) 서비스 - 자동화 스크립트 / 외부 도구용
+- 기존 컨트롤러를 그대로 호출 (View 대신 JSON 응답)
+- python -m api 로 멀티 워커 실행 (uvicorn)
+"""
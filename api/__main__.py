@@ -0,0 +1,36 @@
+"""
+API 서버 실행 - uvicorn 멀티 워커 (Streamlit 과 별도 포트)
+
+예시:
+    python -m api
+    python -m api --host 0.0.0.0 --port 8000 --workers 4
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+import uvicorn
+
+import config
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_WORKERS = 2
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m api", description="ProjectTracker JSON API 서버")
+    parser.add_argument("--host", default=getattr(config, "API_HOST", DEFAULT_HOST))
+    parser.add_argument("--port", type=int, default=getattr(config, "API_PORT", DEFAULT_PORT))
+    parser.add_argument("--workers", type=int, default=getattr(config, "API_WORKERS", DEFAULT_WORKERS),
+                        help="워커 프로세스 수 (SQLite WAL - 읽기는 병렬, 쓰기는 잠금 대기 후 순서대로)")
+    args = parser.parse_args(argv)
+
+    # 워커가 앱 모듈을 각자 import 하도록 문자열로 전달 (이 부모 프로세스는 DB 를 열지 않음)
+    uvicorn.run("api.app:app", host=args.host, port=args.port, workers=args.workers, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
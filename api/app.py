@@ -0,0 +1,89 @@
+"""
+ASGI 앱 구성 - 라우트 + 미들웨어(토큰 인증, gzip) + 오류 응답
+uvicorn 이 워커마다 이 모듈을 import 하므로 DB 연결 / 컨트롤러는 워커 프로세스별로 생성됨
+"""
+
+import hmac
+import logging
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.exceptions import HTTPException
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.requests import Request
+
+import config
+from .responses import ApiJSONResponse
+from .routes import routes
+
+DEFAULT_GZIP_MIN_BYTES = 1000       # 이보다 작은 응답은 압축 이득보다 비용이 큼
+
+logger = logging.getLogger(__name__)
+
+# 인증 없이 열어 두는 경로 (로드밸런서 / 컨테이너 헬스 체크)
+PUBLIC_PATHS = ("/api/health",)
+
+
+class TokenAuthMiddleware(BaseHTTPMiddleware):
+    """config.API_TOKEN 이 있으면 Authorization: Bearer <토큰> 필수"""
+
+    def __init__(self, app, token: str):
+        super().__init__(app)
+        self.token = token
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path not in PUBLIC_PATHS:
+            scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+            if scheme.lower() != "bearer" or not hmac.compare_digest(credentials, self.token):
+                return ApiJSONResponse({'error': "인증 토큰이 필요합니다"}, status_code=401,
+                                       headers={"WWW-Authenticate": "Bearer"})
+        return await call_next(request)
+
+
+# ===== 오류 응답 =====
+async def _handle_value_error(request: Request, exc: ValueError) -> ApiJSONResponse:
+    """입력 오류 → 400 (서비스 메시지의 표시용 접두어 제거)"""
+    return ApiJSONResponse({'error': str(exc).replace("⚙️❌ ", "")}, status_code=400)
+
+
+async def _handle_http_exception(request: Request, exc: HTTPException) -> ApiJSONResponse:
+    return ApiJSONResponse({'error': exc.detail}, status_code=exc.status_code, headers=exc.headers)
+
+
+async def _handle_error(request: Request, exc: Exception) -> ApiJSONResponse:
+    """그 밖의 오류 → 500 (컨트롤러에서 이미 로그를 남김)"""
+    logger.error(f"❌ API 요청 실패: {request.method} {request.url.path} - {str(exc)}")
+    return ApiJSONResponse({'error': str(exc).replace("⚙️❌ ", "")}, status_code=500)
+
+
+@asynccontextmanager
+async def _lifespan(app: Starlette):
+    from config import setup_logging
+    setup_logging()
+    logger.info("🚀 ProjectTracker API 워커 시작")
+    yield
+
+
+def create_app() -> Starlette:
+    """API 앱 생성"""
+    middleware = []
+    token = getattr(config, "API_TOKEN", None)
+    if token:
+        middleware.append(Middleware(TokenAuthMiddleware, token=token))
+    middleware.append(Middleware(GZipMiddleware, minimum_size=getattr(config, "API_GZIP_MIN_BYTES", DEFAULT_GZIP_MIN_BYTES)))
+
+    return Starlette(
+        routes=routes,
+        middleware=middleware,
+        exception_handlers={
+            ValueError: _handle_value_error,
+            HTTPException: _handle_http_exception,
+            Exception: _handle_error,
+        },
+        lifespan=_lifespan,
+    )
+
+
+app = create_app()
@@ -0,0 +1,143 @@
+"""
+API 응답 헬퍼 - JSON 직렬화, 데이터 버전 기반 ETag, 페이지 / 쿼리 파라미터 파싱
+"""
+
+import dataclasses
+import functools
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+import config
+from models.database.connection import db_manager
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_MAX_PAGE_SIZE = 500
+
+# 캐시해도 되지만 매번 ETag 로 재검증 (다른 클라이언트 / UI 의 쓰기가 바로 보이도록)
+CACHE_CONTROL = "private, no-cache"
+
+
+class ApiJSONResponse(JSONResponse):
+    """date / numpy / dataclass 를 그대로 받는 JSON 응답 (한글은 이스케이프하지 않음)"""
+
+    def render(self, content: Any) -> bytes:
+        return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    raise TypeError(f"JSON 으로 변환할 수 없는 값: {type(value).__name__}")
+
+
+def frame_records(frame: pd.DataFrame, columns: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    DataFrame → JSON 행 목록
+
+    Args:
+        columns: {DataFrame 컬럼: 응답 필드} - 여기 없는 컬럼(표시용 문자열 등)은 제외
+    """
+    selected = frame[list(columns)].rename(columns=columns)
+    # NaN 은 JSON 표준이 아니므로 null 로
+    return selected.astype(object).where(selected.notna(), None).to_dict('records')
+
+
+# ===== ETag =====
+def versioned(handler: Callable[[Request], Response]) -> Callable[[Request], Response]:
+    """
+    GET 핸들러에 데이터 버전 기반 ETag 적용
+    - ETag = 데이터 버전 + 오늘 날짜(D-Day 등 날짜 의존 값) + URL
+    - If-None-Match 가 같으면 핸들러(쿼리)를 실행하지 않고 304
+    - 버전은 핸들러 실행 전에 읽음 → 실행 중 쓰기가 있으면 다음 요청에서 새로 받음
+    """
+    @functools.wraps(handler)
+    def wrapper(request: Request) -> Response:
+        url_digest = hashlib.sha1(f"{request.url.path}?{request.url.query}".encode("utf-8")).hexdigest()[:16]
+        etag = f'W/"{db_manager.get_data_version()}-{date.today():%Y%m%d}-{url_digest}"'
+
+        if _matches_etag(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+        response = handler(request)
+        if response.status_code == 200:
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = CACHE_CONTROL
+        return response
+
+    return wrapper
+
+
+def _matches_etag(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+# ===== 쿼리 파라미터 =====
+def query_date(request: Request, name: str, default: Optional[date] = None) -> Optional[date]:
+    """YYYY-MM-DD 쿼리 파라미터"""
+    value = request.query_params.get(name)
+    if not value:
+        return default
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{name} 은 YYYY-MM-DD 형식이어야 합니다: {value}")
+
+
+def query_int(request: Request, name: str, default: Optional[int] = None) -> Optional[int]:
+    """정수 쿼리 파라미터"""
+    value = request.query_params.get(name)
+    if value is None or value == "":
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} 은 정수여야 합니다: {value}")
+
+
+def query_int_list(request: Request, name: str) -> Optional[List[int]]:
+    """반복 / 쉼표 구분 정수 목록 (?project_id=1&project_id=2 또는 ?project_id=1,2) - 없으면 None"""
+    values = [part for value in request.query_params.getlist(name) for part in value.split(",") if part]
+    if not values:
+        return None
+    try:
+        return [int(value) for value in values]
+    except ValueError:
+        raise ValueError(f"{name} 은 정수 목록이어야 합니다")
+
+
+def page_params(request: Request) -> Tuple[int, int]:
+    """(page, page_size) - page 는 1부터, page_size 는 config.API_MAX_PAGE_SIZE 이하"""
+    max_page_size = getattr(config, "API_MAX_PAGE_SIZE", DEFAULT_MAX_PAGE_SIZE)
+    page = query_int(request, "page", 1)
+    page_size = query_int(request, "page_size", DEFAULT_PAGE_SIZE)
+    if page < 1:
+        raise ValueError("page 는 1 이상이어야 합니다")
+    if not 1 <= page_size <= max_page_size:
+        raise ValueError(f"page_size 는 1 ~ {max_page_size} 사이여야 합니다")
+    return page, page_size
+
+
+def paginate(items: Sequence[Any], page: int, page_size: int) -> Dict[str, Any]:
+    """메모리 목록 오프셋 페이지 (프로젝트 목록처럼 전체가 작은 결과용)"""
+    start = (page - 1) * page_size
+    return {
+        'items': list(items[start:start + page_size]),
+        'page': page,
+        'page_size': page_size,
+        'total_count': len(items),
+        'has_next': start + page_size < len(items)
+    }
@@ -0,0 +1,259 @@
+"""
+API 엔드포인트 - 기존 컨트롤러를 그대로 호출하고 결과만 JSON 으로 변환
+- 핸들러는 동기 함수 (SQLite 접근은 블로킹) → Starlette 가 스레드 풀에서 실행
+- 조회(GET)는 데이터 버전 ETag 적용, 쓰기(POST)는 저장 후 새 데이터 버전 반환
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.routing import Route
+
+import config
+from controllers.dashboard_controller import DashboardController
+from controllers.project_controller import ProjectController
+from controllers.work_log_controller import WorkLogController
+from models.database.connection import db_manager
+from models.entities.work_log import MEMO_MAX_LENGTH
+from models.services.work_log_service import normalize_work_log
+from .responses import (
+    ApiJSONResponse, frame_records, page_params, paginate, query_date, query_int_list, versioned
+)
+
+DEFAULT_MAX_BATCH_SIZE = 5000
+DEFAULT_RANGE_DAYS = 30
+
+# 서비스 표시용 프레임 컬럼 → 응답 필드
+PAST_WORK_FIELDS = {
+    'project_id': 'project_id', 'work_date': 'work_date', '프로젝트명': 'project_name',
+    '진행량': 'progress_added', '작업시간': 'hours_spent', '메모': 'memo'
+}
+TODAY_WORK_FIELDS = {
+    'project_id': 'project_id', 'work_date': 'work_date', '프로젝트명': 'project_name', 'D-Day': 'd_day',
+    '목표치': 'target_value', '현재값': 'current_progress',
+    '진행량': 'progress_added', '작업시간': 'hours_spent', '메모': 'memo'
+}
+MEMO_SEARCH_FIELDS = {
+    'project_id': 'project_id', 'work_date': 'work_date', '프로젝트명': 'project_name',
+    '진행량': 'progress_added', '작업시간': 'hours_spent', '메모': 'snippet_html'
+}
+BURNUP_FIELDS = {
+    'work_date': 'work_date', 'progress_added': 'progress_added', 'hours_spent': 'hours_spent',
+    'cumulative_progress': 'cumulative_progress', 'cumulative_hours': 'cumulative_hours',
+    'remaining_work': 'remaining_work', 'target_value': 'target_value'
+}
+
+# 워커 프로세스당 1벌 (컨트롤러 → 서비스 → 리포지토리는 상태 없음)
+project_controller = ProjectController()
+work_log_controller = WorkLogController()
+dashboard_controller = DashboardController()
+
+
+# ===== 상태 =====
+def health(request: Request) -> ApiJSONResponse:
+    """헬스 체크 (DB 연결 + 현재 데이터 버전)"""
+    return ApiJSONResponse({'status': 'ok', 'data_version': db_manager.get_data_version()})
+
+
+# ===== 프로젝트 =====
+@versioned
+def list_projects(request: Request) -> ApiJSONResponse:
+    """프로젝트 목록 - status=active(기본) | archived | all"""
+    status = request.query_params.get("status", "active")
+    page, page_size = page_params(request)
+
+    if status == "active":
+        projects = project_controller.get_active_projects()
+    elif status == "archived":
+        projects = project_controller.get_archived_projects()
+    elif status == "all":
+        projects = project_controller.get_active_projects() + project_controller.get_archived_projects()
+    else:
+        raise ValueError(f"status 는 active / archived / all 중 하나여야 합니다: {status}")
+
+    return ApiJSONResponse(paginate(projects, page, page_size))
+
+
+@versioned
+def project_burnup(request: Request) -> ApiJSONResponse:
+    """프로젝트 번업 이력 (날짜순 누적 진행량 / 작업시간)"""
+    burnup = project_controller.get_project_burnup(request.path_params["project_id"])
+    return ApiJSONResponse({'items': frame_records(burnup, BURNUP_FIELDS)})
+
+
+# ===== 작업 로그 =====
+@versioned
+def list_work_logs(request: Request) -> ApiJSONResponse:
+    """
+    기간 작업 로그 키셋 페이지 (최신순)
+    - start / end: 기본 최근 30일, cursor: 이전 응답의 next_cursor ("YYYY-MM-DD:project_id")
+    """
+    start_date, end_date = _date_range(request)
+    _, page_size = page_params(request)
+    cursor = _parse_cursor(request.query_params.get("cursor"))
+
+    page = work_log_controller.get_past_work_page(start_date, end_date, page_size, cursor)
+    next_cursor = f"{page.next_cursor[0].isoformat()}:{page.next_cursor[1]}" if page.has_next else None
+    return ApiJSONResponse({
+        'items': frame_records(page.frame, PAST_WORK_FIELDS),
+        'page_size': page_size,
+        'next_cursor': next_cursor
+    })
+
+
+@versioned
+def today_work_logs(request: Request) -> ApiJSONResponse:
+    """오늘 작업 현황 (진행 중 프로젝트별 1행)"""
+    rows = work_log_controller.get_today_work_data()
+    return ApiJSONResponse({'items': [{field: row[key] for key, field in TODAY_WORK_FIELDS.items()} for row in rows]})
+
+
+@versioned
+def work_log_summary(request: Request) -> ApiJSONResponse:
+    """기간 작업 로그 집계 (전체 행 수 / 작업일수 / 총 작업시간 / 프로젝트 수)"""
+    start_date, end_date = _date_range(request)
+    summary = work_log_controller.get_past_work_summary(start_date, end_date)
+    return ApiJSONResponse({'start_date': start_date, 'end_date': end_date, **summary})
+
+
+@versioned
+def search_work_logs(request: Request) -> ApiJSONResponse:
+    """메모 전문 검색 (관련도순, 일치 부분은 <mark> 로 감싼 HTML 발췌)"""
+    page, page_size = page_params(request)
+    result = work_log_controller.search_memos(
+        request.query_params.get("q", ""), page, page_size,
+        query_date(request, "start"), query_date(request, "end"), query_int_list(request, "project_id")
+    )
+    return ApiJSONResponse({
+        'items': frame_records(result.frame, MEMO_SEARCH_FIELDS),
+        'page': result.page,
+        'page_size': result.page_size,
+        'total_count': result.total_count,
+        'has_next': result.has_next
+    })
+
+
+async def upsert_work_logs(request: Request) -> ApiJSONResponse:
+    """
+    작업 로그 일괄 upsert - 본문: {"work_logs": [{project_id, work_date, progress_added, hours_spent, memo}, ...]}
+    - 같은 (project_id, work_date) 가 있으면 덮어씀, 한 행이라도 잘못되면 전체 저장 안 함
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        raise ValueError("본문이 올바른 JSON 이 아닙니다")
+
+    rows = body.get("work_logs") if isinstance(body, dict) else body
+    if not isinstance(rows, list):
+        raise ValueError("work_logs 목록이 필요합니다")
+
+    max_batch_size = getattr(config, "API_MAX_BATCH_SIZE", DEFAULT_MAX_BATCH_SIZE)
+    if len(rows) > max_batch_size:
+        raise ValueError(f"한 번에 {max_batch_size}개까지 저장할 수 있습니다")
+
+    work_logs = [_parse_work_log(row, index) for index, row in enumerate(rows)]
+
+    # 저장은 블로킹 I/O - 이벤트 루프를 막지 않도록 스레드 풀에서
+    saved_count = await run_in_threadpool(work_log_controller.upsert_work_logs, work_logs)
+    return ApiJSONResponse({'saved_count': saved_count, 'data_version': db_manager.get_data_version()})
+
+
+# ===== 대시보드 =====
+@versioned
+def dashboard_summary(request: Request) -> ApiJSONResponse:
+    """오늘 / 이번주 작업시간 요약"""
+    return ApiJSONResponse(dashboard_controller.get_work_log_summary())
+
+
+@versioned
+def dashboard_projects(request: Request) -> ApiJSONResponse:
+    """프로젝트 현황 (진행률, 예상 필요시간 / 마감일, 최근 속도)"""
+    page, page_size = page_params(request)
+    return ApiJSONResponse(paginate(dashboard_controller.get_projects_summary(), page, page_size))
+
+
+@versioned
+def dashboard_deadline_risks(request: Request) -> ApiJSONResponse:
+    """프로젝트별 마감 리스크 (몬테카를로 P50 / P90, 마감 초과 확률)"""
+    return ApiJSONResponse({'items': dashboard_controller.get_deadline_risks()})
+
+
+@versioned
+def dashboard_timeline(request: Request) -> ApiJSONResponse:
+    """기간별 프로젝트 작업시간 추이 - granularity: auto(기본) | day | week | month"""
+    start_date, end_date = _date_range(request)
+    timeline = dashboard_controller.get_timeline_data(
+        start_date, end_date, request.query_params.get("granularity", "auto")
+    )
+    matrix = timeline.matrix
+    return ApiJSONResponse({
+        'granularity': timeline.granularity,
+        'start_date': timeline.start_date,
+        'end_date': timeline.end_date,
+        'total_hours': timeline.total_hours,
+        'avg_hours_per_day': timeline.avg_hours_per_day,
+        'worked_projects': timeline.worked_projects,
+        'periods': [period.date() if hasattr(period, 'date') else period for period in matrix.index],
+        'series': {str(name): matrix[name].tolist() for name in matrix.columns}
+    })
+
+
+# ===== 내부 헬퍼 =====
+def _date_range(request: Request) -> Tuple[date, date]:
+    """start / end 쿼리 (기본: 오늘까지 최근 30일)"""
+    end_date = query_date(request, "end", date.today())
+    start_date = query_date(request, "start", end_date - timedelta(days=DEFAULT_RANGE_DAYS - 1))
+    return start_date, end_date
+
+
+def _parse_cursor(value: Optional[str]) -> Optional[Tuple[date, int]]:
+    """"YYYY-MM-DD:project_id" → (work_date, project_id)"""
+    if not value:
+        return None
+    try:
+        work_date, project_id = value.split(":")
+        return date.fromisoformat(work_date), int(project_id)
+    except ValueError:
+        raise ValueError(f"잘못된 cursor 입니다: {value}")
+
+
+def _parse_work_log(row: Any, index: int) -> Dict[str, Any]:
+    """요청 행 → 서비스 저장 형식 (work_date 는 date, memo 는 기본 빈 문자열, 규칙은 서비스와 같은 검증)"""
+    if not isinstance(row, dict):
+        raise ValueError(f"{index}번째 행이 객체가 아닙니다")
+    try:
+        parsed = {
+            'project_id': row['project_id'],
+            'work_date': date.fromisoformat(row['work_date']),
+            'progress_added': row.get('progress_added', 0),
+            'hours_spent': row.get('hours_spent', 0.0),
+            'memo': row.get('memo') or ""
+        }
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"{index}번째 행: project_id 와 work_date(YYYY-MM-DD) 가 필요합니다")
+
+    work_log = normalize_work_log(parsed)
+    if work_log is None:
+        raise ValueError(
+            f"{index}번째 행: project_id 는 양의 정수, progress_added 는 0 이상 정수, hours_spent 는 0 이상 숫자, "
+            f"work_date 는 오늘 이전, memo 는 {MEMO_MAX_LENGTH}자 이내 문자열이어야 합니다"
+        )
+    return work_log
+
+
+routes: List[Route] = [
+    Route("/api/health", health),
+    Route("/api/projects", list_projects),
+    Route("/api/projects/{project_id:int}/burnup", project_burnup),
+    Route("/api/work-logs", list_work_logs),
+    Route("/api/work-logs", upsert_work_logs, methods=["POST"]),
+    Route("/api/work-logs/today", today_work_logs),
+    Route("/api/work-logs/summary", work_log_summary),
+    Route("/api/work-logs/search", search_work_logs),
+    Route("/api/dashboard/summary", dashboard_summary),
+    Route("/api/dashboard/projects", dashboard_projects),
+    Route("/api/dashboard/deadline-risks", dashboard_deadline_risks),
+    Route("/api/dashboard/timeline", dashboard_timeline),
+]
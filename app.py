@@ -1,6 +1,9 @@
 import streamlit as st
+import time
 from datetime import datetime
 
+from utils import metrics
+
 @st.cache_resource
 def initialize_app():
     """애플리케이션 초기화 - 로깅 설정 + DB 초기화"""
@@ -18,6 +21,30 @@ def initialize_app():
     # 3. DB 매니저 초기화
     from models.database.connection import db_manager
 
+    # 4. 메트릭 익스포터 시작 (로컬 포트, Prometheus 텍스트 포맷)
+    import config
+    if getattr(config, "METRICS_ENABLED", True):
+        from utils.metrics import start_metrics_server
+        start_metrics_server(
+            host=getattr(config, "METRICS_HOST", "127.0.0.1"),
+            port=getattr(config, "METRICS_PORT", 9464)
+        )
+
+    # 5. 주기 온라인 백업 시작 (백그라운드 스레드)
+    if getattr(config, "BACKUP_ENABLED", True):
+        from models.database.backup import start_backup_scheduler
+        start_backup_scheduler(
+            interval_hours=getattr(config, "BACKUP_INTERVAL_HOURS", 24),
+            backup_dir=getattr(config, "BACKUP_DIR", None),
+            keep=getattr(config, "BACKUP_KEEP", 7),
+            compress=getattr(config, "BACKUP_COMPRESS", True)
+        )
+
+    # 6. DB 유지보수 스케줄러 시작 (체크포인트 / 통계 갱신)
+    if getattr(config, "MAINTENANCE_ENABLED", True):
+        from models.database.maintenance import start_maintenance_scheduler
+        start_maintenance_scheduler()
+
     return {
         "db_manager": db_manager,
         "initialized_at": datetime.now()
@@ -44,15 +71,17 @@ def main():
 
         page = st.radio(
             "📋 페이지 선택",
-            options=["대시보드", "작업 로그", "프로젝트 관리"],
+            options=["대시보드", "작업 로그", "작업 캘린더", "프로젝트 관리"],
             format_func=lambda x: {
                 "대시보드": "📈 대시보드",
                 "작업 로그": "✏️ 작업 로그",
+                "작업 캘린더": "🗓️ 작업 캘린더",
                 "프로젝트 관리": "📋 프로젝트 관리"
             }[x]
         )
 
     # 페이지별로 지연 import
+    render_start = time.perf_counter()
     try:
         if page == "대시보드":
             from views.dashboard_view import DashboardView
@@ -64,6 +93,11 @@ def main():
             work_log_view = WorkLogView()
             work_log_view.render()
 
+        elif page == "작업 캘린더":
+            from views.calendar_view import CalendarView
+            calendar_view = CalendarView()
+            calendar_view.render()
+
         elif page == "프로젝트 관리":
             from views.project_view import ProjectView
             project_view = ProjectView()
@@ -73,5 +107,9 @@ def main():
         st.error(f"❌ 페이지 로딩 중 오류: {e}")
         st.exception(e)
 
+    finally:
+        # 페이지별 rerun 소요 시간 기록 (st.rerun()으로 중단된 경우도 포함)
+        metrics.page_render_seconds.observe(time.perf_counter() - render_start, page=page)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
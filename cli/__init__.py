@@ -0,0 +1,4 @@
+"""
+CLI 패키지 - Streamlit 없이 실행하는 관리 명령
+사용법: python -m cli <명령> [옵션]
+"""
@@ -0,0 +1,61 @@
+"""
+주요 화면 조회 벤치마크 - 컨트롤러를 화면과 같은 인자로 반복 호출해 지연 시간 측정
+- 첫 호출(cold)과 이후 호출(warm)을 따로 집계 (서비스 캐시 효과 확인용)
+"""
+
+from typing import Callable, Dict, List, Tuple
+from datetime import date, timedelta
+import statistics
+import time
+
+
+def _scenarios() -> List[Tuple[str, Callable[[], object]]]:
+    """(이름, 호출) 목록 - 각 페이지가 첫 렌더링 때 부르는 조회"""
+    from controllers.calendar_controller import CalendarController
+    from controllers.dashboard_controller import DashboardController
+    from controllers.project_controller import ProjectController
+    from controllers.work_log_controller import WorkLogController
+
+    project_controller = ProjectController()
+    work_log_controller = WorkLogController()
+    dashboard_controller = DashboardController()
+    calendar_controller = CalendarController()
+
+    today = date.today()
+    month_ago = today - timedelta(days=30)
+    year_ago = today - timedelta(days=364)
+
+    return [
+        ("projects.active", project_controller.get_active_projects),
+        ("work_log.past_page", lambda: work_log_controller.get_past_work_page(month_ago, today, 100)),
+        ("work_log.past_summary", lambda: work_log_controller.get_past_work_summary(month_ago, today)),
+        ("dashboard.summary", dashboard_controller.get_projects_summary),
+        ("dashboard.risks", dashboard_controller.get_deadline_risks),
+        ("dashboard.timeline", lambda: dashboard_controller.get_timeline_data(year_ago, today)),
+        ("calendar.heatmap", lambda: calendar_controller.get_calendar_heatmap(year_ago, today)),
+    ]
+
+
+def run_benchmarks(repeat: int) -> List[Dict]:
+    """
+    시나리오별 repeat 회 실행
+
+    Returns:
+        [{'name', 'cold_ms', 'warm_median_ms', 'warm_p95_ms'}]
+    """
+    results = []
+    for name, call in _scenarios():
+        durations = []
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            call()
+            durations.append((time.perf_counter() - started) * 1000)
+
+        warm = sorted(durations[1:]) or durations
+        results.append({
+            'name': name,
+            'cold_ms': durations[0],
+            'warm_median_ms': statistics.median(warm),
+            'warm_p95_ms': warm[min(len(warm) - 1, int(round(0.95 * (len(warm) - 1))))]
+        })
+    return results
@@ -0,0 +1,395 @@
+"""
+ProjectTracker 관리 CLI
+- Streamlit을 import하지 않으므로 cron / 서버 셸에서 그대로 실행 가능
+- 기본으로 낮은 CPU 우선순위(nice)와 긴 잠금 대기(busy_timeout)로 실행 → UI 세션과 경합하지 않고 양보
+
+예시:
+    python -m cli sync
+    python -m cli stats --json
+    python -m cli rebuild
+    python -m cli vacuum
+    python -m cli maintain --force
+    python -m cli audit-plans
+    python -m cli archive --dry-run
+    python -m cli compact --after-days 7
+    python -m cli bench --repeat 20
+    python -m cli backup
+    python -m cli restore data/backups/ProjectTracker-20250101-030000.db.gz
+    python -m cli export --dataset work_logs --format parquet --output work_logs.parquet
+    python -m cli export --dataset project_stats --format csv --output -
+    python -m cli import --input old_tracker.csv --dry-run
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from datetime import date
+from typing import List, Optional
+
+DEFAULT_NICE = 10
+DEFAULT_BUSY_TIMEOUT_MS = 30000
+
+
+def _parse_date(value: str) -> date:
+    """YYYY-MM-DD 문자열 → date (argparse type)"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜 형식이 올바르지 않습니다 (YYYY-MM-DD): {value}")
+
+
+# ===== 명령 핸들러 =====
+def _cmd_sync(args: argparse.Namespace) -> int:
+    """노션 프로젝트 동기화"""
+    from controllers.project_controller import ProjectController
+
+    result = ProjectController().sync_with_notion()
+    print(
+        f"✅ 노션 동기화 완료: 신규 {result.get('created', 0)}개, "
+        f"수정 {result.get('updated', 0)}개, 삭제 {result.get('deleted', 0)}개",
+        file=sys.stderr
+    )
+    return 0
+
+
+def _cmd_stats(args: argparse.Namespace) -> int:
+    """데이터 / 저장소 현황 출력"""
+    from models.services.admin_service import AdminService
+
+    stats = AdminService().get_stats()
+    if args.json:
+        print(json.dumps(stats, ensure_ascii=False, indent=2, default=str))
+        return 0
+
+    projects = stats['projects']
+    work_logs = stats['work_logs']
+    storage = stats['storage']
+    print(f"프로젝트      {sum(projects.values())}개 ("
+          + ", ".join(f"{status} {count}" for status, count in sorted(projects.items())) + ")")
+    print(f"작업 로그     {work_logs['total_count']}개 / 작업일 {work_logs['work_days']}일 / "
+          f"{work_logs['total_hours']:.1f}시간")
+    print(f"DB 파일       {storage['db_bytes']:,} bytes (WAL {storage['wal_bytes']:,} bytes)")
+    print(f"페이지        {storage['page_count']:,} × {storage['page_size']} bytes "
+          f"(빈 페이지 {storage['freelist_count']:,})")
+    print(f"데이터 버전   {storage['data_version']} (스키마 v{storage['schema_version']})")
+    archive = stats['archive']
+    if archive['attached']:
+        print(f"보관소        {archive['log_count']:,}개 / 프로젝트 {archive['project_count']}개 / "
+              f"~{archive['last_work_date'] or '-'} ({storage['archive_bytes']:,} bytes)")
+    return 0
+
+
+def _cmd_rebuild(args: argparse.Namespace) -> int:
+    """인덱스 / 플래너 통계 재구성"""
+    from models.services.admin_service import AdminService
+
+    elapsed = AdminService().rebuild()
+    print(f"✅ 인덱스/통계 재구성 완료 ({elapsed:.2f}s)", file=sys.stderr)
+    return 0
+
+
+def _cmd_vacuum(args: argparse.Namespace) -> int:
+    """VACUUM (+ ANALYZE)"""
+    from models.services.admin_service import AdminService
+
+    if args.incremental:
+        from models.database.maintenance import enable_incremental_vacuum
+        enable_incremental_vacuum()
+        print("✅ auto_vacuum=INCREMENTAL 전환 완료", file=sys.stderr)
+        return 0
+
+    result = AdminService().vacuum(analyze=not args.no_analyze)
+    print(f"✅ VACUUM 완료: {result['before_bytes']:,} → {result['after_bytes']:,} bytes", file=sys.stderr)
+    return 0
+
+
+def _cmd_analyze(args: argparse.Namespace) -> int:
+    """플래너 통계 갱신"""
+    from models.database.connection import db_manager
+
+    db_manager.analyze()
+    print("✅ ANALYZE 완료", file=sys.stderr)
+    return 0
+
+
+def _cmd_maintain(args: argparse.Namespace) -> int:
+    """유지보수 1회 실행 (체크포인트 / 통계 / incremental vacuum)"""
+    from models.database.maintenance import MaintenanceScheduler
+
+    records = MaintenanceScheduler().run_pending(force=args.force)
+    if not records:
+        print("실행할 유지보수 작업이 없습니다 (--force 로 전체 실행)", file=sys.stderr)
+    for record in records:
+        print(f"{'✅' if record.success else '❌'} {record.task:<20} {record.duration_seconds:>8.3f}s  {record.detail}")
+    return 0 if all(record.success for record in records) else 1
+
+
+def _cmd_audit_plans(args: argparse.Namespace) -> int:
+    """리포지토리 쿼리 플랜 점검 (인덱스 미사용 / 전체 스캔 시 실패)"""
+    from models.repositories.plan_audit import run_plan_audit
+
+    results = run_plan_audit()
+    for result in results:
+        print(f"{'✅' if result.ok else '❌'} {result.name}")
+        for problem in result.problems:
+            print(f"     {problem}")
+        if args.verbose or not result.ok:
+            for plan in result.plans:
+                print("     └ " + " | ".join(plan))
+
+    failed = sum(not result.ok for result in results)
+    print(f"{len(results) - failed}/{len(results)} 통과", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def _cmd_archive(args: argparse.Namespace) -> int:
+    """보관 정책대로 작업 로그를 보관소로 이동"""
+    from models.services.admin_service import AdminService
+
+    result = AdminService().archive(
+        after_months=args.after_months,
+        include_completed=False if args.no_completed else None,
+        dry_run=args.dry_run
+    )
+    cutoff = result.cutoff_date or "-"
+    if result.dry_run:
+        print(f"보관 대상: 작업 로그 {result.moved_count:,}건 (프로젝트 {result.project_count}개, 기준일 {cutoff})")
+    else:
+        print(f"✅ 작업 로그 {result.moved_count:,}건 보관 완료 (프로젝트 {result.project_count}개, 기준일 {cutoff}, "
+              f"정리 {result.reconciled_count}건)", file=sys.stderr)
+    return 0
+
+
+def _cmd_compact(args: argparse.Namespace) -> int:
+    """지난 날짜의 빈 작업 로그 정리"""
+    from models.services.admin_service import AdminService
+
+    result = AdminService().compact(after_days=args.after_days, dry_run=args.dry_run)
+    if result.dry_run:
+        print(f"정리 대상: 빈 작업 로그 {result.removed_count:,}건 ({result.before_date} 이전, 보관소 제외)")
+    else:
+        print(f"✅ 빈 작업 로그 {result.removed_count:,}건 정리 완료 (보관소 {result.archived_removed_count:,}건, "
+              f"{result.before_date} 이전)", file=sys.stderr)
+    return 0
+
+
+def _cmd_backup(args: argparse.Namespace) -> int:
+    """온라인 백업 생성 / 목록"""
+    import config
+    from models.database import backup
+
+    backup_dir = args.dir or getattr(config, "BACKUP_DIR", None)
+    if args.list:
+        for prefix in (backup.BACKUP_PREFIX, backup.PRERESTORE_PREFIX):
+            for item in backup.list_backups(backup_dir, prefix):
+                print(f"{item['created_at']:%Y-%m-%d %H:%M:%S}  {item['bytes']:>12,}  {item['path']}")
+        return 0
+
+    path = backup.create_backup(
+        backup_dir,
+        keep=args.keep if args.keep is not None else getattr(config, "BACKUP_KEEP", backup.DEFAULT_KEEP),
+        compress=not args.no_compress and getattr(config, "BACKUP_COMPRESS", True)
+    )
+    print(f"✅ 백업 완료: {path}", file=sys.stderr)
+    return 0
+
+
+def _cmd_restore(args: argparse.Namespace) -> int:
+    """백업본 검증 후 복원"""
+    from models.database import backup
+
+    safety_path = backup.restore_backup(args.backup, verify_only=args.verify_only)
+    if args.verify_only:
+        print(f"✅ 백업본 정상: {args.backup}", file=sys.stderr)
+    else:
+        print(f"✅ 복원 완료 (복원 전 DB: {safety_path})", file=sys.stderr)
+    return 0
+
+
+def _cmd_bench(args: argparse.Namespace) -> int:
+    """주요 조회 벤치마크"""
+    from cli.bench import run_benchmarks
+
+    # 반복 호출마다 찍히는 컨트롤러 INFO 로그 생략
+    logging.getLogger("controllers").setLevel(logging.WARNING)
+    results = run_benchmarks(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'시나리오':<24}{'cold(ms)':>10}{'warm p50':>10}{'warm p95':>10}")
+    for result in results:
+        print(f"{result['name']:<24}{result['cold_ms']:>10.1f}"
+              f"{result['warm_median_ms']:>10.1f}{result['warm_p95_ms']:>10.1f}")
+    return 0
+
+
+def _cmd_export(args: argparse.Namespace) -> int:
+    """데이터셋 스트리밍 내보내기"""
+    from models.services.export_service import ExportService
+
+    # "-" 는 표준출력 (바이너리)
+    output = sys.stdout.buffer if args.output == "-" else args.output
+    row_count = ExportService().export(
+        args.dataset,
+        args.format,
+        output,
+        start_date=args.start,
+        end_date=args.end,
+        chunk_size=args.chunk_size
+    )
+    print(f"✅ {args.dataset} {row_count}행 내보내기 완료", file=sys.stderr)
+    return 0
+
+
+def _cmd_import(args: argparse.Namespace) -> int:
+    """작업 로그 파일 일괄 가져오기"""
+    from models.services.import_service import ImportService
+
+    result = ImportService().import_work_logs(
+        args.input,
+        fmt=args.format,
+        chunk_size=args.chunk_size,
+        dry_run=args.dry_run
+    )
+    print(
+        f"{'🔍 검증' if result.dry_run else '✅ 가져오기'} 완료: "
+        f"{result.total_rows}행 중 {result.imported_rows}행 저장, "
+        f"검증 실패 {result.invalid_rows}행, 프로젝트 미확인 {result.unresolved_rows}행 "
+        f"({result.chunk_count}청크, {result.elapsed_seconds:.2f}s, {result.rows_per_second:,.0f} rows/s)",
+        file=sys.stderr
+    )
+    return 0 if result.skipped_rows == 0 else 2
+
+
+# ===== 파서 구성 =====
+def build_parser() -> argparse.ArgumentParser:
+    from models.services.export_service import DEFAULT_CHUNK_SIZE, EXPORT_DATASETS, EXPORT_FORMATS
+    from models.services.import_service import IMPORT_FORMATS
+
+    parser = argparse.ArgumentParser(prog="python -m cli", description="ProjectTracker 관리 CLI")
+    parser.add_argument("--nice", type=int, default=DEFAULT_NICE,
+                        help=f"CPU 우선순위 낮춤 정도 (기본 {DEFAULT_NICE}, 0 = 그대로)")
+    parser.add_argument("--busy-timeout", type=int, default=DEFAULT_BUSY_TIMEOUT_MS,
+                        help=f"DB 잠금 대기 시간 ms (기본 {DEFAULT_BUSY_TIMEOUT_MS})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # sync
+    sync_parser = subparsers.add_parser("sync", help="노션 프로젝트 동기화")
+    sync_parser.set_defaults(handler=_cmd_sync)
+
+    # stats
+    stats_parser = subparsers.add_parser("stats", help="데이터 / 저장소 현황")
+    stats_parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    stats_parser.set_defaults(handler=_cmd_stats)
+
+    # rebuild
+    rebuild_parser = subparsers.add_parser("rebuild", help="누락 인덱스 생성 + REINDEX + ANALYZE")
+    rebuild_parser.set_defaults(handler=_cmd_rebuild)
+
+    # vacuum / analyze
+    vacuum_parser = subparsers.add_parser("vacuum", help="VACUUM (빈 페이지 회수) + ANALYZE")
+    vacuum_parser.add_argument("--no-analyze", action="store_true", help="VACUUM 후 ANALYZE 생략")
+    vacuum_parser.add_argument("--incremental", action="store_true",
+                               help="auto_vacuum=INCREMENTAL 로 전환 (이후 유지보수 스케줄러가 조금씩 회수)")
+    vacuum_parser.set_defaults(handler=_cmd_vacuum)
+
+    analyze_parser = subparsers.add_parser("analyze", help="쿼리 플래너 통계 갱신")
+    analyze_parser.set_defaults(handler=_cmd_analyze)
+
+    # maintain
+    maintain_parser = subparsers.add_parser("maintain", help="WAL 체크포인트 / 통계 갱신 / incremental vacuum 1회 실행")
+    maintain_parser.add_argument("--force", action="store_true", help="주기·크기 조건과 무관하게 전체 실행")
+    maintain_parser.set_defaults(handler=_cmd_maintain)
+
+    # audit-plans
+    audit_parser = subparsers.add_parser("audit-plans", help="리포지토리 쿼리 플랜 점검 (의도한 인덱스 사용 여부)")
+    audit_parser.add_argument("--verbose", action="store_true", help="통과한 쿼리의 플랜도 출력")
+    audit_parser.set_defaults(handler=_cmd_audit_plans)
+
+    # archive
+    archive_parser = subparsers.add_parser("archive", help="오래된 / 완료 프로젝트 작업 로그를 보관소로 이동")
+    archive_parser.add_argument("--after-months", type=int, default=None,
+                                help="이보다 오래된 로그 보관 (기본: config.ARCHIVE_AFTER_MONTHS, 0 = 날짜 기준 안 씀)")
+    archive_parser.add_argument("--no-completed", action="store_true", help="완료 프로젝트 로그는 기간 기준만 적용")
+    archive_parser.add_argument("--dry-run", action="store_true", help="옮기지 않고 대상 수만 출력")
+    archive_parser.set_defaults(handler=_cmd_archive)
+
+    # compact
+    compact_parser = subparsers.add_parser(
+        "compact", help="지난 날짜의 빈 작업 로그(0 / 0 / 메모 없음) 삭제 (sparse 모드가 아니면 삭제한 날은 편집 화면에 안 나옴)"
+    )
+    compact_parser.add_argument("--after-days", type=int, default=None,
+                                help="오늘로부터 이 일수보다 지난 로그만 (기본: config.WORK_LOG_COMPACT_AFTER_DAYS)")
+    compact_parser.add_argument("--dry-run", action="store_true", help="지우지 않고 대상 수만 출력")
+    compact_parser.set_defaults(handler=_cmd_compact)
+
+    # backup / restore
+    backup_parser = subparsers.add_parser("backup", help="온라인 백업 (앱 실행 중 가능)")
+    backup_parser.add_argument("--dir", help="백업 디렉토리 (기본: config.BACKUP_DIR 또는 data/backups)")
+    backup_parser.add_argument("--keep", type=int, help="보관할 백업 수 (기본: config.BACKUP_KEEP)")
+    backup_parser.add_argument("--no-compress", action="store_true", help="gzip 압축 안 함")
+    backup_parser.add_argument("--list", action="store_true", help="백업 목록만 출력")
+    backup_parser.set_defaults(handler=_cmd_backup)
+
+    restore_parser = subparsers.add_parser("restore", help="백업본 무결성 검사 후 복원 (현재 DB 는 먼저 백업)")
+    restore_parser.add_argument("backup", help="백업 파일 (.db 또는 .db.gz)")
+    restore_parser.add_argument("--verify-only", action="store_true", help="무결성 검사만")
+    restore_parser.set_defaults(handler=_cmd_restore)
+
+    # bench
+    bench_parser = subparsers.add_parser("bench", help="주요 화면 조회 벤치마크")
+    bench_parser.add_argument("--repeat", type=int, default=10, help="시나리오별 반복 횟수")
+    bench_parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    bench_parser.set_defaults(handler=_cmd_bench)
+
+    # export
+    export_parser = subparsers.add_parser("export", help="작업 로그 / 프로젝트 통계 내보내기 (CSV, Parquet)")
+    export_parser.add_argument("--dataset", choices=EXPORT_DATASETS, default="work_logs")
+    export_parser.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    export_parser.add_argument("--output", required=True, help="출력 파일 경로 ('-' = 표준출력)")
+    export_parser.add_argument("--start", type=_parse_date, help="작업 로그 시작일 (YYYY-MM-DD)")
+    export_parser.add_argument("--end", type=_parse_date, help="작업 로그 종료일 (YYYY-MM-DD)")
+    export_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="청크당 행 수")
+    export_parser.set_defaults(handler=_cmd_export)
+
+    # import
+    import_parser = subparsers.add_parser(
+        "import",
+        help="작업 로그 일괄 가져오기 (CSV, Parquet / 같은 프로젝트·날짜는 덮어씀)"
+    )
+    import_parser.add_argument("--input", required=True, help="입력 파일 경로")
+    import_parser.add_argument("--format", choices=IMPORT_FORMATS, help="입력 형식 (기본: 확장자로 판단)")
+    import_parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="청크당 행 수")
+    import_parser.add_argument("--dry-run", action="store_true", help="검증만 하고 저장하지 않음")
+    import_parser.set_defaults(handler=_cmd_import)
+
+    return parser
+
+
+def _yield_to_ui(args: argparse.Namespace) -> None:
+    """UI 세션에 양보 - CPU 우선순위 낮춤 + 잠금 충돌 시 실패 대신 대기"""
+    if args.nice > 0 and hasattr(os, "nice"):
+        os.nice(args.nice)
+
+    from models.database.connection import db_manager
+    db_manager.set_busy_timeout(args.busy_timeout)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI 진입점 - 종료 코드 반환"""
+    from config import setup_logging
+    setup_logging()
+
+    try:
+        # 파서 구성 시 서비스 모듈을 import 하면서 DB 초기화(마이그레이션 포함)가 일어남
+        parser = build_parser()
+        args = parser.parse_args(argv)
+
+        _yield_to_ui(args)
+        return args.handler(args)
+    except Exception as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
@@ -1,17 +1,116 @@
 # config.example.py
+import atexit
+import gzip
 import logging
+import logging.handlers
 import os
+import queue
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 NOTION_API_KEY = "your_notion_api_key_here"
 NOTION_DATABASE_ID = "your_database_id_here"
 
+DATABASE_PATH = None                # SQLite DB 파일 (None = data/ProjectTracker.db)
+
+# =============================================================================
+# 메트릭 설정 (Prometheus 텍스트 포맷, 로컬 전용)
+# =============================================================================
+
+METRICS_ENABLED = True
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9464
+
+# =============================================================================
+# 예측 설정
+# =============================================================================
+
+FORECAST_WINDOW_DAYS = 30           # 예상 마감일 계산에 쓸 최근 구간 (0 = 전체 이력)
+FORECAST_MIN_WINDOW_SAMPLES = 5     # 최근 구간 효율성 표본이 이보다 적으면 전체 이력 사용
+
+# =============================================================================
+# 백업 설정 (앱 실행 중 온라인 백업, python -m cli restore 로 복원)
+# =============================================================================
+
+BACKUP_ENABLED = True
+BACKUP_INTERVAL_HOURS = 24      # 백업 주기
+BACKUP_DIR = None               # 백업 디렉토리 (None = data/backups)
+BACKUP_KEEP = 7                 # 보관할 백업 수 (초과분은 오래된 것부터 삭제)
+BACKUP_COMPRESS = True          # gzip 압축 여부
+
+# =============================================================================
+# DB 유지보수 설정 (체크포인트 / 통계 / incremental vacuum)
+# =============================================================================
+
+MAINTENANCE_ENABLED = True
+MAINTENANCE_INTERVAL_SECONDS = 60                   # 점검 주기
+WAL_CHECKPOINT_PASSIVE_BYTES = 4 * 1024 * 1024      # WAL 이 이보다 크면 PASSIVE 체크포인트 (유휴 중이면 TRUNCATE)
+WAL_CHECKPOINT_TRUNCATE_BYTES = 64 * 1024 * 1024    # WAL 이 이보다 크면 TRUNCATE 체크포인트
+OPTIMIZE_INTERVAL_HOURS = 6                         # PRAGMA optimize 주기
+ANALYZE_INTERVAL_HOURS = 24                         # 전체 ANALYZE 주기
+INCREMENTAL_VACUUM_ENABLED = False                  # 유휴 시 빈 페이지 회수 (auto_vacuum=INCREMENTAL 필요)
+INCREMENTAL_VACUUM_IDLE_SECONDS = 300               # 이 시간 동안 쿼리가 없으면 유휴로 판단
+INCREMENTAL_VACUUM_PAGES = 256                      # 한 번에 회수할 최대 페이지 수
+
+# =============================================================================
+# 빈 작업 로그 설정 (진행량 0, 작업시간 0, 메모 없음)
+# =============================================================================
+
+WORK_LOG_SPARSE = False             # 켜면 빈 날은 저장하지 않음 (편집 화면에는 빈 칸으로 표시, 비우고 저장하면 삭제)
+WORK_LOG_COMPACT_AFTER_DAYS = 14    # sparse 모드에서 이보다 지난 빈 로그를 유휴 시간에 삭제 (0 = 자동 정리 안 함)
+WORK_LOG_COMPACT_INTERVAL_HOURS = 24  # 자동 정리 주기
+                                    # sparse 모드가 아니면 자동 정리하지 않음 - 정리된 날은 과거 편집 화면에서
+                                    # 사라져 다시 입력할 수 없으므로 python -m cli compact 로 직접 실행할 때만
+
+# =============================================================================
+# 작업 로그 보관 설정 (오래된 로그를 ATTACH 한 별도 SQLite 파일로 이동, python -m cli archive)
+# =============================================================================
+
+ARCHIVE_ENABLED = False             # 켜면 보관소 파일을 ATTACH 하고 유지보수 스케줄러가 주기적으로 보관
+ARCHIVE_PATH = None                 # 보관소 파일 (None = DB 파일과 같은 디렉토리의 ProjectTracker-archive.db, 백업 대상 아님 - 따로 복사)
+ARCHIVE_AFTER_MONTHS = 12           # 이보다 오래된 로그 보관 (0 = 날짜 기준 사용 안 함)
+ARCHIVE_COMPLETED_PROJECTS = True   # 완료 프로젝트의 로그는 기간과 무관하게 보관 (오늘 로그 제외)
+ARCHIVE_INTERVAL_HOURS = 24         # 자동 보관 주기 (유휴 시간에만 실행)
+
+# =============================================================================
+# JSON API 설정 (자동화 클라이언트용, python -m api 로 Streamlit 과 별도 실행)
+# =============================================================================
+
+API_HOST = "127.0.0.1"              # 외부에 열 때는 0.0.0.0 + API_TOKEN 설정
+API_PORT = 8000
+API_WORKERS = 2                     # uvicorn 워커 프로세스 수
+API_TOKEN = None                    # 설정하면 Authorization: Bearer <토큰> 필수 (/api/health 제외)
+API_MAX_PAGE_SIZE = 500             # 목록 조회 page_size 최대값
+API_MAX_BATCH_SIZE = 5000           # 작업 로그 일괄 upsert 한 요청당 최대 행 수
+API_GZIP_MIN_BYTES = 1000           # 이보다 큰 응답만 gzip 압축
+
 # =============================================================================
 # 로깅 설정
 # =============================================================================
 
+LOG_LEVEL = "INFO"              # 루트 로거 레벨 (DEBUG 레코드는 생성 전에 걸러짐)
+LOG_QUEUE_SIZE = 0              # 로그 큐 최대 크기 (0 = 무제한, 가득 차면 새 레코드는 버리고 개수만 셈)
+
+# 로그 파일 로테이션
+LOG_ROTATION = "size"           # "size" (용량 기준) | "time" (시간 기준) | None (로테이션 없음)
+LOG_MAX_BYTES = 10 * 1024 * 1024    # size 모드: 파일당 최대 크기 (10MB)
+LOG_ROTATE_WHEN = "midnight"    # time 모드: 로테이션 주기 단위 (TimedRotatingFileHandler when)
+LOG_ROTATE_INTERVAL = 1         # time 모드: 로테이션 주기
+LOG_BACKUP_COUNT = 7            # 보관할 로테이션 파일 수
+LOG_COMPRESS = True             # 로테이션된 파일 gzip 압축 여부
+
+# 백그라운드 로그 리스너 (포맷팅 + 파일 I/O 담당)
+_log_listener = None
+# 로테이션 파일 압축 워커 (리스너 스레드도 막지 않도록 별도 스레드)
+_compress_executor = None
+_compress_future = None
+# 종료 시 플러시 등록 여부 (setup_logging 을 여러 번 불러도 1번만)
+_stop_logging_registered = False
+
 def setup_logging():
-    """종류별 로그 파일 분리 설정"""
+    """종류별 로그 파일 분리 설정 - 큐 핸들러 + 백그라운드 리스너"""
+    global _log_listener, _stop_logging_registered
 
     # 1: 로그 디렉토리 생성
     log_dir = "logs"
@@ -25,35 +124,53 @@ def setup_logging():
     log_format = "%(asctime)s | %(levelname)-8s | %(name)-20s | %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
 
-    # 4. 루트 로거 기본 설정
+    # 4. 루트 로거 기본 설정 (레벨 미달 레코드는 LogRecord 생성 전에 폐기)
     root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(LOG_LEVEL)
 
-    # 5: 기존 핸들러 제거 (중복 방지)
+    # 5: 기존 핸들러/리스너 제거 (중복 방지)
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
     root_logger.handlers.clear()
 
     # 6: 핸들러별 설정
     formatter = logging.Formatter(log_format, date_format)
 
     # (INFO 이상 → info.log)
-    info_handler = logging.FileHandler(info_log, encoding='utf-8')
+    info_handler = _create_file_handler(info_log)
     info_handler.setLevel(logging.INFO)
     info_handler.setFormatter(formatter)
-    root_logger.addHandler(info_handler)
 
     # (ERROR 이상 → error.log)
-    error_handler = logging.FileHandler(error_log, encoding='utf-8')
+    error_handler = _create_file_handler(error_log)
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(formatter)
-    root_logger.addHandler(error_handler)
 
     # (콘솔 출력 (개발 시))
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
 
-    # 7. 외부 라이브러리 노이즈 제거
+    # 7: 큐 핸들러만 루트에 연결 (요청 스레드는 큐에 넣기만 함)
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    queue_handler = _DroppingQueueHandler(log_queue)
+    root_logger.addHandler(queue_handler)
+
+    # 8: 백그라운드 리스너가 포맷팅 + 파일/콘솔 출력 처리
+    _log_listener = logging.handlers.QueueListener(
+        log_queue,
+        info_handler,
+        error_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    _log_listener.start()
+    if not _stop_logging_registered:
+        atexit.register(_stop_logging)
+        _stop_logging_registered = True
+
+    # 9. 외부 라이브러리 노이즈 제거
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("notion_client").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -61,6 +178,112 @@ def setup_logging():
     logging.getLogger("sqlalchemy.pool").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.orm").setLevel(logging.WARNING)
 
+def _create_file_handler(log_path: str) -> logging.Handler:
+    """설정에 따른 로그 파일 핸들러 생성 (용량/시간 로테이션 + 압축)"""
+    # 1: 로테이션 방식별 핸들러 생성
+    if LOG_ROTATION == "size":
+        handler = _CompressingRotatingFileHandler(
+            log_path,
+            maxBytes=LOG_MAX_BYTES,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8'
+        )
+    elif LOG_ROTATION == "time":
+        handler = _CompressingTimedRotatingFileHandler(
+            log_path,
+            when=LOG_ROTATE_WHEN,
+            interval=LOG_ROTATE_INTERVAL,
+            backupCount=LOG_BACKUP_COUNT,
+            encoding='utf-8'
+        )
+    else:
+        return logging.FileHandler(log_path, encoding='utf-8')
+
+    # 2: 로테이션 파일 gzip 압축 (이름 변경만 즉시, 압축은 백그라운드)
+    if LOG_COMPRESS:
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+
+    return handler
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    큐가 가득 차면 레코드를 버리는 큐 핸들러 (LOG_QUEUE_SIZE > 0 일 때)
+    - 기본 QueueHandler 는 queue.Full 을 handleError 로 넘겨 매번 트레이스백을 출력함
+    - 버린 개수는 dropped 에 누적
+    """
+
+    dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class _CompressionWaitMixin:
+    """
+    로테이션 직전에 이전 압축 작업 완료 대기
+    - 번호/날짜 파일 이동이 아직 만들어지지 않은 .gz 파일을 놓치지 않도록 보장
+    - 리스너 스레드에서만 호출되므로 요청 스레드는 영향 없음
+    """
+
+    def doRollover(self):
+        _wait_for_compression()
+        super().doRollover()
+
+class _CompressingRotatingFileHandler(_CompressionWaitMixin, logging.handlers.RotatingFileHandler):
+    pass
+
+class _CompressingTimedRotatingFileHandler(_CompressionWaitMixin, logging.handlers.TimedRotatingFileHandler):
+    pass
+
+def _gzip_namer(default_name: str) -> str:
+    """로테이션 파일명에 .gz 확장자 추가"""
+    return f"{default_name}.gz"
+
+def _gzip_rotator(source: str, dest: str):
+    """로그 파일을 임시 이름으로 옮긴 뒤 압축은 워커 스레드에 위임"""
+    global _compress_executor, _compress_future
+
+    # 1: 이름 변경은 즉시 (새 로그 파일이 바로 열릴 수 있도록)
+    pending = f"{dest}.pending"
+    os.replace(source, pending)
+
+    # 2: 압축 워커 지연 생성 후 작업 제출
+    if _compress_executor is None:
+        _compress_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-compress")
+    try:
+        _compress_future = _compress_executor.submit(_compress_log_file, pending, dest)
+    except RuntimeError:
+        # 인터프리터 종료 중에는 워커 제출 불가 → 리스너 스레드에서 직접 압축
+        _compress_log_file(pending, dest)
+
+def _compress_log_file(pending: str, dest: str):
+    """임시 파일을 gzip으로 압축 후 삭제"""
+    try:
+        with open(pending, 'rb') as src, gzip.open(dest, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(pending)
+    except OSError:
+        # 압축 실패 시 원본(.pending)은 남겨둠
+        pass
+
+def _wait_for_compression():
+    """진행 중인 압축 작업이 있으면 완료까지 대기"""
+    if _compress_future is not None:
+        _compress_future.result()
+
+def _stop_logging():
+    """프로세스 종료 시 큐에 남은 로그 플러시 + 진행 중인 압축 완료 대기"""
+    global _log_listener, _compress_executor
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    if _compress_executor is not None:
+        _compress_executor.shutdown(wait=True)
+        _compress_executor = None
+
 # =============================================================================
 def get_logger(name: str):
     """모듈별 로거 생성 헬퍼 함수"""
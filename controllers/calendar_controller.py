@@ -0,0 +1,39 @@
+from typing import List, Optional
+import logging
+from datetime import date
+
+from models.dto import CalendarHeatmap, ProjectRecord
+from models.services.calendar_service import CalendarService
+from utils import metrics
+
+
+class CalendarController:
+    def __init__(self):
+        self.calendar_service = CalendarService()
+        self.logger = logging.getLogger(__name__)
+
+    # ===== View에서 호출하는 메서드들 =====
+    @metrics.track_controller
+    def get_calendar_heatmap(self, start_date: date, end_date: date,
+                             project_ids: Optional[List[int]] = None) -> CalendarHeatmap:
+        """캘린더 히트맵 데이터 조회"""
+        try:
+            heatmap = self.calendar_service.get_calendar_heatmap(start_date, end_date, project_ids)
+            self.logger.info(f"🎮✅ 캘린더 데이터 조회 성공: {heatmap.active_days}일 작업")
+            return heatmap
+
+        except Exception as e:
+            self.logger.error(f"🎮❌ 캘린더 데이터 조회 실패: {str(e)}")
+            raise e
+
+    @metrics.track_controller
+    def get_project_options(self) -> List[ProjectRecord]:
+        """필터용 프로젝트 목록 조회"""
+        try:
+            projects = self.calendar_service.get_project_options()
+            self.logger.info(f"🎮✅ 필터용 프로젝트 목록 조회 성공: {len(projects)}개")
+            return projects
+
+        except Exception as e:
+            self.logger.error(f"🎮❌ 필터용 프로젝트 목록 조회 실패: {str(e)}")
+            raise e
@@ -2,7 +2,11 @@ from typing import List, Dict, Any
 import logging
 from datetime import date
 
+from models.dto.deadline_risk import DeadlineRisk
+from models.dto.project_summary import ProjectSummary
+from models.dto.timeline import TimelineData
 from models.services.dashboard_service import DashboardService
+from utils import metrics
 
 
 class DashboardController:
@@ -11,6 +15,7 @@ class DashboardController:
         self.logger = logging.getLogger(__name__)
 
     # ===== View에서 호출하는 메서드들 =====
+    @metrics.track_controller
     def get_work_log_summary(self) -> Dict[str, Any]:
         """상단 3개 메트릭 데이터 조회"""
         try:
@@ -22,7 +27,8 @@ class DashboardController:
             self.logger.error(f"🎮❌ 작업로그 요약 조회 실패: {str(e)}")
             raise e
 
-    def get_projects_summary(self) -> List[Dict[str, Any]]:
+    @metrics.track_controller
+    def get_projects_summary(self) -> List[ProjectSummary]:
         """프로젝트 현황 테이블 데이터 조회"""
         try:
             projects_data = self.dashboard_service.get_projects_summary()
@@ -33,7 +39,8 @@ class DashboardController:
             self.logger.error(f"🎮❌ 프로젝트 현황 조회 실패: {str(e)}")
             raise e
 
-    def get_chart_data(self) -> List[Dict[str, Any]]:
+    @metrics.track_controller
+    def get_chart_data(self) -> List[ProjectSummary]:
         """프로젝트별 사용시간 vs 필요시간 차트 데이터 조회"""
         try:
             usage_data = self.dashboard_service.get_chart_data()
@@ -44,11 +51,26 @@ class DashboardController:
             self.logger.error(f"🎮❌ 프로젝트 시각화 차트 데이터 조회 실패: {str(e)}")
             raise e
 
-    def get_timeline_data(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+    @metrics.track_controller
+    def get_deadline_risks(self) -> List[DeadlineRisk]:
+        """프로젝트별 마감 리스크 (몬테카를로 시뮬레이션) 조회"""
+        try:
+            risks = self.dashboard_service.get_deadline_risks()
+            self.logger.info(f"🎮✅ 마감 리스크 조회 성공: {len(risks)}개")
+            return risks
+
+        except Exception as e:
+            self.logger.error(f"🎮❌ 마감 리스크 조회 실패: {str(e)}")
+            raise e
+
+    @metrics.track_controller
+    def get_timeline_data(self, start_date: date, end_date: date, granularity: str = "auto") -> TimelineData:
         """기간별 프로젝트 작업시간 추이 데이터 조회"""
         try:
-            timeline_data = self.dashboard_service.get_timeline_data(start_date, end_date)
-            self.logger.info(f"🎮✅ 작업시간 추이 데이터 조회 성공: {len(timeline_data)}개 레코드")
+            timeline_data = self.dashboard_service.get_timeline_data(start_date, end_date, granularity)
+            self.logger.info(
+                f"🎮✅ 작업시간 추이 데이터 조회 성공: {timeline_data.matrix.shape} ({timeline_data.granularity})"
+            )
             return timeline_data
 
         except Exception as e:
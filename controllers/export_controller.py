@@ -0,0 +1,25 @@
+from typing import Optional
+import logging
+from datetime import date
+
+from models.services.export_service import ExportService
+from utils import metrics
+
+
+class ExportController:
+    def __init__(self):
+        self.export_service = ExportService()
+        self.logger = logging.getLogger(__name__)
+
+    # ===== View에서 호출하는 메서드들 =====
+    @metrics.track_controller
+    def export_bytes(self, dataset: str, fmt: str, start_date: Optional[date] = None,
+                     end_date: Optional[date] = None) -> bytes:
+        """데이터셋 내보내기 (다운로드용 바이트)"""
+        try:
+            data = self.export_service.export_bytes(dataset, fmt, start_date, end_date)
+            self.logger.info(f"🎮✅ 데이터 내보내기 성공: {dataset}.{fmt} ({len(data)} bytes)")
+            return data
+        except Exception as e:
+            self.logger.error(f"🎮❌ 데이터 내보내기 실패: {str(e)}")
+            raise e
@@ -1,16 +1,23 @@
 from typing import List, Dict, Any
 import logging
 
+import pandas as pd
+
+from models.dto import ProjectRecord
 from models.services.project_service import ProjectService
+from models.services.work_log_service import WorkLogService
+from utils import metrics
 
 
 class ProjectController:
     def __init__(self):
         self.project_service = ProjectService()
+        self.work_log_service = WorkLogService()
         self.logger = logging.getLogger(__name__)
 
     # ===== View에서 호출하는 메서드들 =====
-    def get_active_projects(self) -> List[Dict[str, Any]]:
+    @metrics.track_controller
+    def get_active_projects(self) -> List[ProjectRecord]:
         """진행 중 프로젝트 목록 조회"""
         try:
             projects = self.project_service.get_active_projects()
@@ -20,7 +27,8 @@ class ProjectController:
             self.logger.error(f"🎮❌ 진행 중 프로젝트 목록 조회 실패: {str(e)}")
             raise e
 
-    def get_archived_projects(self) -> List[Dict[str, Any]]:
+    @metrics.track_controller
+    def get_archived_projects(self) -> List[ProjectRecord]:
         """아카이브 프로젝트 목록 조회"""
         try:
             projects = self.project_service.get_archived_projects()
@@ -30,6 +38,18 @@ class ProjectController:
             self.logger.error(f"🎮❌ 아카이브 프로젝트 목록 조회 실패: {str(e)}")
             raise e
 
+    @metrics.track_controller
+    def get_project_burnup(self, project_id: int) -> pd.DataFrame:
+        """프로젝트 번업/번다운 이력 조회"""
+        try:
+            burnup = self.work_log_service.get_project_burnup(project_id)
+            self.logger.info(f"🎮✅ 프로젝트 번업 이력 조회 성공: {len(burnup)}개")
+            return burnup
+        except Exception as e:
+            self.logger.error(f"🎮❌ 프로젝트 번업 이력 조회 실패: {str(e)}")
+            raise e
+
+    @metrics.track_controller
     def bulk_update_projects(self, changes: List[Dict]) -> int:
         """프로젝트 진행률 일괄 업데이트"""
         try:
@@ -40,15 +60,22 @@ class ProjectController:
             self.logger.error(f"🎮❌ 프로젝트 진행률 일괄 업데이트 실패: {str(e)}")
             raise e
 
+    @metrics.track_controller
     def sync_with_notion(self) -> Dict[str, int]:
         """노션과 동기화 - 모든 프로젝트 대상"""
         try:
-            sync_result = self.project_service.sync_with_notion()
+            with metrics.notion_sync_seconds.time():
+                sync_result = self.project_service.sync_with_notion()
             created = sync_result.get('created', 0)
             updated = sync_result.get('updated', 0)
             deleted = sync_result.get('deleted', 0)
+            metrics.notion_sync_total.inc(result="success")
+            metrics.notion_sync_projects_total.inc(created, action="created")
+            metrics.notion_sync_projects_total.inc(updated, action="updated")
+            metrics.notion_sync_projects_total.inc(deleted, action="deleted")
             self.logger.info(f"🎮✅ 노션 동기화 완료: 신규 {created}개, 수정 {updated}개, 삭제 {deleted}개")
             return sync_result
         except Exception as e:
+            metrics.notion_sync_total.inc(result="failure")
             self.logger.error(f"🎮❌ 노션 동기화 실패: {str(e)}")
             raise e
\ No newline at end of file
@@ -1,9 +1,13 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import date, datetime
 import logging
 
+import pandas as pd
+
+from models.dto import MemoSearchPage, WorkLogPage
 from models.services.work_log_service import WorkLogService
 from models.services.project_service import ProjectService
+from utils import metrics
 
 
 class WorkLogController:
@@ -12,6 +16,7 @@ class WorkLogController:
         self.logger = logging.getLogger(__name__)
 
     # ===== View에서 호출하는 메서드들 =====
+    @metrics.track_controller
     def get_today_work_data(self) -> List[Dict[str, Any]]:
         """오늘 작업 로그 조회"""
         try:
@@ -22,7 +27,8 @@ class WorkLogController:
             self.logger.error(f"🎮❌ 오늘 작업 로그 조회 실패: {str(e)}")
             raise e
 
-    def get_past_work_data(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+    @metrics.track_controller
+    def get_past_work_data(self, start_date: date, end_date: date) -> pd.DataFrame:
         """과거 작업 로그 조회"""
         try:
             past_work_data = self.work_log_service.get_past_work_data(start_date, end_date)
@@ -32,6 +38,54 @@ class WorkLogController:
             self.logger.error(f"🎮❌ 과거 작업 로그 조회 실패: {str(e)}")
             raise e
 
+    @metrics.track_controller
+    def get_past_work_page(self, start_date: date, end_date: date, page_size: int,
+                           cursor: Optional[Tuple[date, int]] = None) -> WorkLogPage:
+        """과거 작업 로그 페이지 조회"""
+        try:
+            page = self.work_log_service.get_past_work_page(start_date, end_date, page_size, cursor)
+            self.logger.info(f"🎮✅ 과거 작업 로그 페이지 조회 성공: {len(page.frame)}개")
+            return page
+        except Exception as e:
+            self.logger.error(f"🎮❌ 과거 작업 로그 페이지 조회 실패: {str(e)}")
+            raise e
+
+    @metrics.track_controller
+    def upsert_work_logs(self, rows: List[Dict[str, Any]]) -> int:
+        """작업 로그 일괄 upsert (없으면 생성)"""
+        try:
+            saved_count = self.work_log_service.upsert_work_logs(rows)
+            self.logger.info(f"🎮✅ 작업 로그 일괄 저장 성공: {saved_count}개")
+            return saved_count
+        except Exception as e:
+            self.logger.error(f"🎮❌ 작업 로그 일괄 저장 실패: {str(e)}")
+            raise e
+
+    @metrics.track_controller
+    def search_memos(self, text: str, page: int = 1, page_size: int = 20,
+                     start_date: Optional[date] = None, end_date: Optional[date] = None,
+                     project_ids: Optional[List[int]] = None) -> MemoSearchPage:
+        """메모 전문 검색"""
+        try:
+            result = self.work_log_service.search_memos(text, page, page_size, start_date, end_date, project_ids)
+            self.logger.info(f"🎮✅ 메모 검색 성공: {len(result.frame)}/{result.total_count}개")
+            return result
+        except Exception as e:
+            self.logger.error(f"🎮❌ 메모 검색 실패: {str(e)}")
+            raise e
+
+    @metrics.track_controller
+    def get_past_work_summary(self, start_date: date, end_date: date) -> Dict[str, Any]:
+        """과거 작업 로그 기간 집계 조회"""
+        try:
+            summary = self.work_log_service.get_past_work_summary(start_date, end_date)
+            self.logger.info(f"🎮✅ 과거 작업 로그 집계 조회 성공: {summary['total_count']}개")
+            return summary
+        except Exception as e:
+            self.logger.error(f"🎮❌ 과거 작업 로그 집계 조회 실패: {str(e)}")
+            raise e
+
+    @metrics.track_controller
     def update_work_logs(self, changes: List[Dict[str, Any]]) -> int:
         """작업 로그 업데이트"""
         try:
@@ -0,0 +1,21 @@
+"""
+Analytics 패키지 초기화
+NumPy 기반 배치 계산 엔진 제공
+"""
+
+from .calendar import CalendarGrid, build_calendar_grid, longest_streak
+from .forecasting import CompletionForecast, forecast_completion
+from .simulation import SimulationResult, simulate_completion
+from .timeline import build_timeline_matrix, resolve_granularity
+
+__all__ = [
+    "CalendarGrid",
+    "build_calendar_grid",
+    "longest_streak",
+    "CompletionForecast",
+    "forecast_completion",
+    "SimulationResult",
+    "simulate_completion",
+    "build_timeline_matrix",
+    "resolve_granularity"
+]
@@ -0,0 +1,61 @@
+"""
+캘린더 히트맵 그리드 - 일별 작업시간을 (요일 × 주) 배열로 배치
+- 주는 월요일 시작, 기간 밖 칸은 NaN (히트맵에서 빈 칸)
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CalendarGrid:
+    """요일(행 0=월 ~ 6=일) × 주(열) 그리드"""
+
+    hours: np.ndarray           # (7, 주 수) 일별 작업시간, 기간 밖 NaN
+    dates: np.ndarray           # (7, 주 수) 칸별 날짜 (datetime64[D])
+    week_starts: np.ndarray     # (주 수,) 주 시작 월요일 (datetime64[D])
+    daily_hours: np.ndarray     # (기간 일수,) 기간 내 일별 작업시간 (0 채움)
+
+
+def build_calendar_grid(work_dates, hours, start_date: date, end_date: date) -> CalendarGrid:
+    """
+    일별 작업시간 목록 → 캘린더 그리드 (벡터 연산)
+
+    Args:
+        work_dates: 작업 날짜 배열 (같은 날짜가 여러 번 나오면 합산)
+        hours: 작업시간 배열
+    """
+    # 1: 기간 내 일별 합계 (기간 시작 기준 일 오프셋으로 누적)
+    start = np.datetime64(start_date, 'D')
+    day_count = (end_date - start_date).days + 1
+    offsets = (np.asarray(work_dates, dtype='datetime64[D]') - start).astype(np.int64)
+    values = np.asarray(hours, dtype=np.float64)
+    in_range = (offsets >= 0) & (offsets < day_count)
+
+    daily = np.zeros(day_count, dtype=np.float64)
+    np.add.at(daily, offsets[in_range], values[in_range])
+
+    # 2: 그리드 배치 - 첫 주 월요일 기준 오프셋 → (요일, 주)
+    lead_days = start_date.weekday()
+    first_monday = np.datetime64(start_date - timedelta(days=lead_days), 'D')
+    week_count = (lead_days + day_count + 6) // 7
+
+    grid = np.full(7 * week_count, np.nan)
+    grid[lead_days:lead_days + day_count] = daily
+    grid = grid.reshape(week_count, 7).T
+
+    cell_dates = (first_monday + np.arange(7 * week_count)).reshape(week_count, 7).T
+    week_starts = first_monday + np.arange(week_count) * 7
+
+    return CalendarGrid(hours=grid, dates=cell_dates, week_starts=week_starts, daily_hours=daily)
+
+
+def longest_streak(daily_hours: np.ndarray) -> int:
+    """작업시간 > 0 인 날의 최장 연속 일수"""
+    active = np.concatenate(([0], (np.asarray(daily_hours) > 0).astype(np.int8), [0]))
+    edges = np.diff(active)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return int((ends - starts).max()) if len(starts) else 0
@@ -0,0 +1,119 @@
+"""
+완료 예측 엔진 - 모든 프로젝트를 NumPy 배열로 한 번에 계산
+- 남은 작업량 / 필요시간 / 예상 마감일
+- 로그별 효율성 분산 기반 신뢰구간 (평균 효율성의 표준오차)
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional
+
+import numpy as np
+
+# 95% 신뢰구간 z-값
+DEFAULT_Z_SCORE = 1.96
+
+
+@dataclass(frozen=True)
+class CompletionForecast:
+    """
+    프로젝트별 예측 결과 (입력 순서와 같은 인덱스의 배열)
+    - 계산 불가 값은 NaN / NaT
+    """
+
+    remaining_work: np.ndarray          # 남은 작업량
+    required_hours: np.ndarray          # 예상 필요시간 (평균 효율성 기준)
+    required_hours_low: np.ndarray      # 필요시간 하한 (효율성 상한 기준)
+    required_hours_high: np.ndarray     # 필요시간 상한 (효율성 하한 기준, 하한 ≤ 0 이면 NaN)
+    completion_date: np.ndarray         # 예상 마감일 (datetime64[D])
+    completion_date_low: np.ndarray     # 가장 빠른 예상 마감일
+    completion_date_high: np.ndarray    # 가장 늦은 예상 마감일
+
+    @staticmethod
+    def to_dates(values: np.ndarray) -> List[Optional[date]]:
+        """datetime64[D] 배열 → date 리스트 (NaT → None)"""
+        return [None if np.isnat(value) else value.astype(object) for value in values]
+
+    @staticmethod
+    def to_floats(values: np.ndarray) -> List[Optional[float]]:
+        """float 배열 → float 리스트 (NaN → None)"""
+        return [None if np.isnan(value) else float(value) for value in values]
+
+
+def forecast_completion(
+    target_values: np.ndarray,
+    current_progress: np.ndarray,
+    avg_efficiency: np.ndarray,
+    efficiency_std: np.ndarray,
+    efficiency_count: np.ndarray,
+    avg_hours_per_day: np.ndarray,
+    today: date,
+    z_score: float = DEFAULT_Z_SCORE
+) -> CompletionForecast:
+    """
+    전체 프로젝트 완료 예측 (벡터 연산 1회)
+
+    규칙 (기존 대시보드 계산과 동일):
+    - 남은 작업량 0 → 필요시간 0, 예상 마감일 = 오늘
+    - 평균 효율성 0 (데이터 없음) → 필요시간/마감일 없음
+    - 일평균 작업시간 0 → 마감일 없음
+    """
+    # 1: 입력 정규화
+    target = np.asarray(target_values, dtype=np.float64)
+    progress = np.asarray(current_progress, dtype=np.float64)
+    efficiency = np.asarray(avg_efficiency, dtype=np.float64)
+    std = np.asarray(efficiency_std, dtype=np.float64)
+    count = np.asarray(efficiency_count, dtype=np.float64)
+    hours_per_day = np.asarray(avg_hours_per_day, dtype=np.float64)
+
+    # 2: 남은 작업량 및 상태 마스크
+    remaining = np.maximum(target - progress, 0.0)
+    done = remaining == 0
+    has_efficiency = efficiency > 0
+
+    # 3: 평균 효율성 신뢰구간 (표준오차 = std / sqrt(n))
+    standard_error = np.divide(std, np.sqrt(count), out=np.zeros_like(std), where=count > 0)
+    efficiency_low = efficiency - z_score * standard_error
+    efficiency_high = efficiency + z_score * standard_error
+
+    # 4: 필요시간 = 남은 작업량 / 효율성
+    with np.errstate(divide='ignore', invalid='ignore'):
+        required = np.where(has_efficiency, remaining / efficiency, np.nan)
+        required_low = np.where(has_efficiency, remaining / efficiency_high, np.nan)
+        required_high = np.where(has_efficiency & (efficiency_low > 0), remaining / efficiency_low, np.nan)
+
+    required = np.where(done, 0.0, required)
+    required_low = np.where(done, 0.0, required_low)
+    required_high = np.where(done, 0.0, required_high)
+
+    # 5: 예상 마감일 = 오늘 + (필요시간 / 일평균 작업시간) 일
+    today_64 = np.datetime64(today, 'D')
+    completion = _hours_to_dates(required, hours_per_day, done, today_64)
+    completion_low = _hours_to_dates(required_low, hours_per_day, done, today_64)
+    completion_high = _hours_to_dates(required_high, hours_per_day, done, today_64)
+
+    return CompletionForecast(
+        remaining_work=remaining,
+        required_hours=required,
+        required_hours_low=required_low,
+        required_hours_high=required_high,
+        completion_date=completion,
+        completion_date_low=completion_low,
+        completion_date_high=completion_high
+    )
+
+
+def _hours_to_dates(required_hours: np.ndarray, hours_per_day: np.ndarray,
+                    done: np.ndarray, today: np.datetime64) -> np.ndarray:
+    """필요시간 배열 → 예상 마감일 배열 (계산 불가 → NaT)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        days = np.where(hours_per_day > 0, required_hours / hours_per_day, np.nan)
+    days = np.where(done, 0.0, days)
+
+    valid = np.isfinite(days)
+    offsets = np.zeros(days.shape, dtype='timedelta64[D]')
+    offsets[valid] = np.floor(days[valid]).astype(np.int64).astype('timedelta64[D]')
+
+    dates = today + offsets
+    dates[~valid] = np.datetime64('NaT')
+    return dates
@@ -0,0 +1,165 @@
+"""
+몬테카를로 마감 리스크 시뮬레이션
+- 프로젝트별 과거 일일 작업시간 / 로그별 효율성을 복원추출 (하루 진행량 = 작업시간 × 효율성)
+- 전체 프로젝트 × 시행을 한 번에 벡터 연산으로 진행
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_TRIALS = 1000
+DEFAULT_HORIZON_DAYS = 730
+INITIAL_BLOCK_DAYS = 7
+MAX_PAIR_SAMPLES = 4096
+
+
+@dataclass(frozen=True)
+class SimulationResult:
+    """
+    프로젝트별 시뮬레이션 결과 (입력 순서와 같은 인덱스의 배열)
+    - 완료 일수는 오늘 기준 경과 일수, 계산 불가/기간 초과는 NaN
+    """
+
+    p50_days: np.ndarray            # 50% 확률로 완료되는 일수
+    p90_days: np.ndarray            # 90% 확률로 완료되는 일수
+    miss_probability: np.ndarray    # 마감일 초과 확률 (0~1, 데이터 없으면 NaN)
+    trials: int
+
+
+def simulate_completion(
+    remaining_work: Sequence[float],
+    days_until_deadline: Sequence[int],
+    daily_hours_samples: List[np.ndarray],
+    efficiency_samples: List[np.ndarray],
+    trials: int = DEFAULT_TRIALS,
+    horizon_days: int = DEFAULT_HORIZON_DAYS,
+    seed: Optional[int] = 0
+) -> SimulationResult:
+    """
+    전체 프로젝트 완료 시점 시뮬레이션
+
+    Args:
+        remaining_work: 프로젝트별 남은 작업량
+        days_until_deadline: 프로젝트별 마감일까지 남은 일수 (오늘 = 0)
+        daily_hours_samples: 프로젝트별 과거 일일 작업시간 (작업 안 한 날 0 포함)
+        efficiency_samples: 프로젝트별 로그 효율성 (작업시간 > 0 인 로그만)
+        trials: 프로젝트당 시행 횟수
+        horizon_days: 최대 시뮬레이션 일수 (초과 시 미완료 처리)
+        seed: 난수 시드 (같은 입력 → 같은 결과)
+    """
+    rng = np.random.default_rng(seed)
+    project_count = len(remaining_work)
+
+    remaining = np.asarray(remaining_work, dtype=np.float64)
+    deadline_days = np.asarray(days_until_deadline, dtype=np.float64)
+
+    # 1: 일일 진행량 표본 = 작업시간 표본 × 효율성 표본 (하루당 난수 1회로 추출)
+    progress_samples = [
+        _daily_progress_samples(rng, hours, efficiency)
+        for hours, efficiency in zip(daily_hours_samples, efficiency_samples)
+    ]
+    pool, offsets, lengths = _flatten(progress_samples)
+
+    # 2: 시뮬레이션 대상 선별
+    # - 표본 없음 → 계산 불가
+    # - 평균 진행 속도로도 기간의 2배를 넘기는 프로젝트 → 시뮬레이션 없이 기간 초과 처리
+    done = remaining <= 0
+    has_samples = lengths > 0
+    mean_daily = np.array([values.mean() if len(values) else 0.0 for values in progress_samples])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expected_days = np.where(mean_daily > 0, remaining / mean_daily, np.inf)
+    simulatable = ~done & has_samples & (expected_days <= 2 * horizon_days)
+
+    completion_days = np.full((project_count, trials), np.inf)
+    completion_days[done] = 0.0
+
+    # 3: (프로젝트, 시행) 쌍을 1차원 행으로 펼침
+    row_project = np.repeat(np.flatnonzero(simulatable), trials)
+    row_trial = np.tile(np.arange(trials), int(simulatable.sum()))
+    row_progress = np.zeros(len(row_project), dtype=np.float32)
+
+    # 4: 블록 단위로 일수를 늘려가며 미완료 행만 계속 시뮬레이션
+    elapsed = 0
+    block_days = INITIAL_BLOCK_DAYS
+    while len(row_project) > 0 and elapsed < horizon_days:
+        block_days = min(block_days, horizon_days - elapsed)
+
+        # 4-1: 표본 복원추출 (평탄화된 표본 배열의 프로젝트 구간 내 인덱스)
+        sample_idx = _draw_indices(rng, offsets[row_project], lengths[row_project], block_days)
+        cumulative = np.cumsum(pool[sample_idx], axis=1)
+        cumulative += row_progress[:, None]
+        reached = cumulative >= remaining[row_project][:, None]
+        finished = reached[:, -1]
+
+        # 4-2: 이번 블록에서 완료된 행 기록 (완료 일수 = 경과 + 첫 도달일)
+        first_day = reached[finished].argmax(axis=1)
+        completion_days[row_project[finished], row_trial[finished]] = elapsed + first_day + 1
+
+        # 4-3: 미완료 행만 남기고 다음 블록은 두 배 길이로
+        keep = ~finished
+        row_project = row_project[keep]
+        row_trial = row_trial[keep]
+        row_progress = cumulative[keep, -1]
+        elapsed += block_days
+        block_days *= 2
+
+    # 5: 분위수 및 마감 초과 확률 (미완료 시행은 기간 밖 값으로 두고 분위수 계산)
+    completion_days[np.isinf(completion_days)] = horizon_days + 1
+    p50 = np.quantile(completion_days, 0.5, axis=1, method='higher')
+    p90 = np.quantile(completion_days, 0.9, axis=1, method='higher')
+    miss = (completion_days > deadline_days[:, None]).mean(axis=1)
+
+    p50[p50 > horizon_days] = np.inf
+    p90[p90 > horizon_days] = np.inf
+
+    unknown = ~(done | has_samples)
+    p50 = np.where(np.isfinite(p50) & ~unknown, p50, np.nan)
+    p90 = np.where(np.isfinite(p90) & ~unknown, p90, np.nan)
+    miss = np.where(unknown, np.nan, miss)
+
+    return SimulationResult(
+        p50_days=p50,
+        p90_days=p90,
+        miss_probability=miss,
+        trials=trials
+    )
+
+
+def _daily_progress_samples(rng: np.random.Generator, hours: np.ndarray, efficiency: np.ndarray) -> np.ndarray:
+    """
+    작업시간 × 효율성 조합 표본
+    - 조합 수가 MAX_PAIR_SAMPLES 이하면 전체 조합, 넘으면 무작위 조합으로 축소
+    """
+    if len(hours) == 0 or len(efficiency) == 0:
+        return np.empty(0, dtype=np.float32)
+
+    hours = np.asarray(hours, dtype=np.float32)
+    efficiency = np.asarray(efficiency, dtype=np.float32)
+    if len(hours) * len(efficiency) <= MAX_PAIR_SAMPLES:
+        return np.outer(hours, efficiency).ravel()
+
+    return (
+        hours[rng.integers(0, len(hours), MAX_PAIR_SAMPLES)] *
+        efficiency[rng.integers(0, len(efficiency), MAX_PAIR_SAMPLES)]
+    )
+
+
+def _flatten(samples: List[np.ndarray]):
+    """프로젝트별 표본 배열 → (평탄화 배열, 시작 오프셋, 길이)"""
+    lengths = np.array([len(values) for values in samples], dtype=np.int64)
+    offsets = np.zeros(len(samples), dtype=np.int64)
+    if len(samples) > 1:
+        offsets[1:] = np.cumsum(lengths)[:-1]
+    pool = np.concatenate(samples).astype(np.float32) if samples else np.empty(0, dtype=np.float32)
+    return pool, offsets, lengths
+
+
+def _draw_indices(rng: np.random.Generator, offsets: np.ndarray, lengths: np.ndarray, days: int) -> np.ndarray:
+    """행별 [offset, offset + length) 구간에서 days개씩 균등 복원추출"""
+    uniform = rng.random((len(offsets), days), dtype=np.float32)
+    local = (uniform * lengths[:, None]).astype(np.int64)
+    # float32 반올림으로 length와 같아지는 경우 방지
+    np.minimum(local, lengths[:, None] - 1, out=local)
+    return offsets[:, None] + local
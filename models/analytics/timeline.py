@@ -0,0 +1,116 @@
+"""
+타임라인 엔진
+- 집계 단위(일/주/월) 결정: 기간 길이에 따라 자동 선택, 시리즈당 최대 포인트 수를 넘으면 한 단계 올림
+- 구간 × 프로젝트 밀집 행렬: 기록 없는 구간은 0으로 채워 선/영역/히트맵/누적이 같은 데이터를 사용
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+DAY = "day"
+WEEK = "week"
+MONTH = "month"
+AUTO = "auto"
+
+GRANULARITIES = (DAY, WEEK, MONTH)
+
+# 자동 선택 기준 (기간 일수 이하이면 해당 단위)
+AUTO_DAY_MAX_DAYS = 92
+AUTO_WEEK_MAX_DAYS = 731
+
+# 집계 단위별 pandas 구간 빈도 (주는 월요일 시작, 월은 1일 시작)
+_FREQUENCIES = {DAY: "D", WEEK: "W-MON", MONTH: "MS"}
+
+# 시리즈(프로젝트)당 최대 포인트 수
+MAX_POINTS_PER_SERIES = 366
+
+
+def bucket_count(start_date: date, end_date: date, granularity: str) -> int:
+    """기간을 주어진 단위로 나눴을 때의 구간 수 (주는 월요일 시작)"""
+    days = (end_date - start_date).days + 1
+    if granularity == DAY:
+        return days
+    if granularity == WEEK:
+        return (start_date.weekday() + days + 6) // 7
+    if granularity == MONTH:
+        return (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
+    raise ValueError(f"지원하지 않는 집계 단위: {granularity}")
+
+
+def resolve_granularity(start_date: date, end_date: date, requested: str = AUTO,
+                        max_points: int = MAX_POINTS_PER_SERIES) -> str:
+    """
+    실제 사용할 집계 단위 결정
+
+    Args:
+        requested: auto / day / week / month
+        max_points: 시리즈당 최대 포인트 수 (넘으면 더 큰 단위로)
+    """
+    if requested == AUTO:
+        days = (end_date - start_date).days + 1
+        if days <= AUTO_DAY_MAX_DAYS:
+            requested = DAY
+        elif days <= AUTO_WEEK_MAX_DAYS:
+            requested = WEEK
+        else:
+            requested = MONTH
+
+    if requested not in GRANULARITIES:
+        raise ValueError(f"지원하지 않는 집계 단위: {requested}")
+
+    # 포인트 상한 초과 시 단계적으로 올림 (월 단위가 마지막)
+    for granularity in GRANULARITIES[GRANULARITIES.index(requested):]:
+        if bucket_count(start_date, end_date, granularity) <= max_points:
+            return granularity
+    return MONTH
+
+
+def bucket_index(start_date: date, end_date: date, granularity: str) -> pd.DatetimeIndex:
+    """기간 전체 구간 시작일 인덱스 (SQL 구간 규칙과 동일: 일 / 주 월요일 / 월 1일)"""
+    if granularity == DAY:
+        first = start_date
+    elif granularity == WEEK:
+        first = start_date - timedelta(days=start_date.weekday())
+    elif granularity == MONTH:
+        first = start_date.replace(day=1)
+    else:
+        raise ValueError(f"지원하지 않는 집계 단위: {granularity}")
+
+    return pd.date_range(first, end_date, freq=_FREQUENCIES[granularity], name="날짜")
+
+
+def build_timeline_matrix(buckets, projects, hours, start_date: date, end_date: date,
+                          granularity: str) -> pd.DataFrame:
+    """
+    (구간, 프로젝트, 작업시간) 목록 → 구간 × 프로젝트 밀집 행렬
+
+    Args:
+        buckets: 구간 시작일 배열 (date / 문자열 / datetime64)
+        projects: 프로젝트명 배열
+        hours: 작업시간 배열
+
+    Returns:
+        DataFrame (index: 전체 구간 시작일 DatetimeIndex, columns: 프로젝트명 - 총 작업시간 내림차순)
+        기록 없는 구간은 0.0
+    """
+    index = bucket_index(start_date, end_date, granularity)
+    long = pd.DataFrame({
+        "날짜": pd.to_datetime(pd.Series(buckets, dtype=object)),
+        "프로젝트명": pd.Series(projects, dtype=object),
+        "작업시간": pd.Series(hours, dtype=np.float64)
+    })
+
+    # 1: 구간 × 프로젝트로 펼친 뒤 전체 구간으로 재색인 (빈 구간 0 채움)
+    matrix = (
+        long.pivot_table(index="날짜", columns="프로젝트명", values="작업시간", aggfunc="sum")
+        .reindex(index, fill_value=0.0)
+        .fillna(0.0)
+    )
+
+    # 2: 프로젝트 순서 = 총 작업시간 내림차순 (범례/누적 영역 순서 고정)
+    order = np.argsort(-matrix.to_numpy().sum(axis=0), kind="stable")
+    matrix = matrix.iloc[:, order]
+    matrix.columns.name = "프로젝트명"
+    return matrix
@@ -0,0 +1,335 @@
+"""
+작업 로그 보관소 (cold storage)
+- 오래된 로그 / 완료 프로젝트 로그를 ATTACH 한 보관소 DB(archive.archived_work_logs)로 옮겨 메인 work_logs 를 작게 유지
+- 보관 로그는 프로젝트별 집계(archive.work_log_rollups)로 요약 → 진행도 / 효율성 통계는 보관 로그를 읽지 않고 합산
+- 기간 / 프로젝트 조회는 요청 범위가 보관소에 닿을 때만 UNION ALL
+- 이동은 "보관소 쓰기 → 메인 삭제" 두 트랜잭션 (WAL 에서는 DB 간 커밋이 원자적이지 않으므로 손실 없는 순서)
+  중간에 멈춰 양쪽에 남은 행은 다음 실행 때 메인 기준으로 정리
+"""
+
+import calendar
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import Float, and_, delete, exists, func, insert, or_, select, tuple_, union_all, update
+
+import config
+from .connection import DatabaseError, db_manager
+from ..entities.archived_work_log import archived_work_log_rollups, archived_work_logs
+from ..entities.project import Project
+from ..entities.work_log import WorkLog
+
+DEFAULT_AFTER_MONTHS = 12
+DEFAULT_BATCH_SIZE = 2000       # 한 번에 옮기는 로그 수 (트랜잭션당 잠금 시간 제한)
+COMPLETED_STATUS = "완료"
+
+# UNION 양쪽 공통 컬럼 (work_logs 와 같은 이름)
+_LOG_COLUMNS = ("id", "project_id", "work_date", "progress_added", "hours_spent", "memo")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ArchiveResult:
+    """보관 실행 결과"""
+
+    cutoff_date: Optional[date]     # 이 날짜 이전 로그 보관 (None = 날짜 기준 없음)
+    moved_count: int                # 옮긴(dry_run 이면 옮길) 로그 수
+    project_count: int
+    reconciled_count: int           # 메인에 다시 생겨 보관소에서 지운 로그 수
+    dry_run: bool
+
+
+# ===== 조회 지원 =====
+def archive_reaches(conn, start_date: Optional[date] = None, project_ids: Optional[List[int]] = None) -> bool:
+    """
+    요청 범위에 보관 로그가 있는지 (집계 테이블만 확인 - 보관 로그는 읽지 않음)
+
+    Args:
+        conn: Session 또는 Connection
+        start_date: 조회 시작일 (None = 전체 기간)
+        project_ids: 대상 프로젝트 (None = 전체)
+    """
+    if not db_manager.archive_attached:
+        return False
+
+    stmt = select(func.max(archived_work_log_rollups.c.last_work_date))
+    if project_ids is not None:
+        stmt = stmt.where(archived_work_log_rollups.c.project_id.in_(project_ids))
+    last_archived = conn.execute(stmt).scalar()
+    return last_archived is not None and (start_date is None or last_archived >= start_date)
+
+
+def work_logs_source(conn, filters: Callable, start_date: Optional[date] = None,
+                     project_ids: Optional[List[int]] = None):
+    """
+    조회 대상 작업 로그 FROM 절
+    - 범위가 보관소에 닿지 않으면 메인 work_logs 테이블 그대로
+    - 닿으면 양쪽에 같은 조건을 건 UNION ALL 서브쿼리 (각자 인덱스 사용)
+
+    Args:
+        filters: table → 조건 리스트 (메인 / 보관소 / 반환값 어디에나 같은 컬럼명으로 적용)
+    """
+    if not archive_reaches(conn, start_date, project_ids):
+        return WorkLog.__table__
+
+    arms = [
+        select(*(table.c[name] for name in _LOG_COLUMNS)).where(*filters(table))
+        for table in (WorkLog.__table__, archived_work_logs)
+    ]
+    return union_all(*arms).subquery("all_work_logs")
+
+
+def get_rollups(conn, project_ids: List[int]) -> Dict[int, object]:
+    """프로젝트별 보관 로그 집계 행 (보관소가 없으면 빈 dict)"""
+    if not db_manager.archive_attached or not project_ids:
+        return {}
+
+    rows = conn.execute(
+        select(archived_work_log_rollups).where(archived_work_log_rollups.c.project_id.in_(project_ids))
+    ).all()
+    return {row.project_id: row for row in rows}
+
+
+def get_summary() -> Dict[str, object]:
+    """
+    보관소 현황 (집계 테이블 기준)
+
+    Returns:
+        {'attached', 'path', 'log_count', 'project_count', 'last_work_date'}
+    """
+    summary = {'attached': db_manager.archive_attached, 'path': db_manager.archive_path,
+               'log_count': 0, 'project_count': 0, 'last_work_date': None}
+    if not db_manager.archive_attached:
+        return summary
+
+    rollups = archived_work_log_rollups.c
+    with db_manager.get_session_context() as session:
+        row = session.execute(
+            select(func.coalesce(func.sum(rollups.log_count), 0), func.count(), func.max(rollups.last_work_date))
+        ).one()
+    summary.update(log_count=int(row[0]), project_count=int(row[1]), last_work_date=row[2])
+    return summary
+
+
+# ===== 보관소 쓰기 =====
+def refresh_rollups(conn, project_ids: Iterable[int]) -> None:
+    """프로젝트별 보관 로그 집계 재계산 (해당 프로젝트의 보관 로그만 읽음)"""
+    project_ids = list(set(project_ids))
+    if not project_ids:
+        return
+
+    logs = archived_work_logs.c
+    rollups = archived_work_log_rollups
+    efficiency = func.cast(logs.progress_added, Float) / func.nullif(logs.hours_spent, 0)
+
+    conn.execute(delete(rollups).where(rollups.c.project_id.in_(project_ids)))
+    conn.execute(insert(rollups).from_select(
+        [column.name for column in rollups.columns],
+        select(
+            logs.project_id,
+            func.count(),
+            func.sum(logs.progress_added),
+            func.sum(logs.hours_spent),
+            func.sum(logs.progress_added * logs.hours_spent),
+            func.coalesce(func.sum(efficiency), 0.0),
+            func.coalesce(func.sum(efficiency * efficiency), 0.0),
+            func.count(efficiency),
+            func.min(logs.work_date),
+            func.max(logs.work_date)
+        )
+        .where(logs.project_id.in_(project_ids))
+        .group_by(logs.project_id)
+    ))
+
+
+def remove_overwritten(conn, keys: Optional[List[Tuple[int, date]]] = None) -> int:
+    """
+    메인과 보관소 양쪽에 있는 로그를 보관소에서 삭제 (메인 값 우선)
+    - 이동 중 멈춘 경우 / 가져오기로 보관된 날짜가 다시 들어온 경우
+
+    Args:
+        keys: 확인할 (project_id, work_date) 목록 (None = 보관소 전체)
+
+    Returns:
+        삭제한 보관 로그 수
+    """
+    if not archive_reaches(conn):
+        return 0
+
+    logs = archived_work_logs.c
+    condition = exists().where(WorkLog.project_id == logs.project_id, WorkLog.work_date == logs.work_date)
+    if keys is not None:
+        if not keys:
+            return 0
+        condition = and_(tuple_(logs.project_id, logs.work_date).in_(keys), condition)
+
+    project_ids = conn.execute(select(logs.project_id).where(condition).distinct()).scalars().all()
+    if not project_ids:
+        return 0
+
+    removed = conn.execute(delete(archived_work_logs).where(condition)).rowcount
+    refresh_rollups(conn, project_ids)
+    return removed
+
+
+def remove_archived(conn, filters: Callable) -> int:
+    """
+    조건에 맞는 보관 로그 삭제 + 집계 갱신 (빈 로그 정리 / sparse 모드에서 비운 날)
+
+    Args:
+        filters: table → 조건 리스트
+
+    Returns:
+        삭제한 보관 로그 수
+    """
+    if not archive_reaches(conn):
+        return 0
+
+    conditions = filters(archived_work_logs)
+    project_ids = conn.execute(
+        select(archived_work_logs.c.project_id).where(*conditions).distinct()
+    ).scalars().all()
+    if not project_ids:
+        return 0
+
+    removed = conn.execute(delete(archived_work_logs).where(*conditions)).rowcount
+    refresh_rollups(conn, project_ids)
+    return removed
+
+
+def update_archived_logs(conn, updates: List[Dict]) -> int:
+    """
+    보관된 로그 수정 (과거 작업 편집기에서 보관된 날짜를 고친 경우)
+
+    Returns:
+        수정된 로그 수
+    """
+    if not updates or not db_manager.archive_attached:
+        return 0
+
+    logs = archived_work_logs.c
+    updated_count = 0
+    project_ids = set()
+    for update_data in updates:
+        result = conn.execute(
+            update(archived_work_logs)
+            .where(logs.project_id == update_data['project_id'], logs.work_date == update_data['work_date'])
+            .values(
+                progress_added=update_data['progress_added'],
+                hours_spent=update_data['hours_spent'],
+                memo=update_data['memo']
+            )
+        )
+        if result.rowcount:
+            updated_count += result.rowcount
+            project_ids.add(update_data['project_id'])
+
+    if updated_count:
+        refresh_rollups(conn, project_ids)
+    return updated_count
+
+
+# ===== 보관 실행 =====
+def archive_cutoff(today: date, months: int) -> date:
+    """today 기준 months 개월 전 같은 날 (말일 보정)"""
+    month_index = today.year * 12 + today.month - 1 - months
+    year, month = divmod(month_index, 12)
+    day = min(today.day, calendar.monthrange(year, month + 1)[1])
+    return date(year, month + 1, day)
+
+
+def run_archive(after_months: Optional[int] = None, include_completed: Optional[bool] = None,
+                batch_size: int = DEFAULT_BATCH_SIZE, dry_run: bool = False) -> ArchiveResult:
+    """
+    보관 정책대로 메인 작업 로그를 보관소로 이동
+
+    Args:
+        after_months: 이보다 오래된 로그 이동 (None = config.ARCHIVE_AFTER_MONTHS, 0 = 날짜 기준 안 씀)
+        include_completed: 완료 프로젝트의 오늘 이전 로그 이동 (None = config.ARCHIVE_COMPLETED_PROJECTS)
+        batch_size: 트랜잭션당 이동 로그 수
+        dry_run: True 면 옮길 로그 수만 계산
+
+    Returns:
+        ArchiveResult
+    """
+    if not db_manager.archive_attached:
+        raise DatabaseError("💾❌ 보관소가 연결되지 않았습니다 (config.ARCHIVE_ENABLED = True 필요)")
+
+    if after_months is None:
+        after_months = getattr(config, "ARCHIVE_AFTER_MONTHS", DEFAULT_AFTER_MONTHS)
+    if include_completed is None:
+        include_completed = getattr(config, "ARCHIVE_COMPLETED_PROJECTS", True)
+
+    # 1: 보관 대상 조건 (날짜 기준 OR 완료 프로젝트)
+    today = date.today()
+    cutoff = archive_cutoff(today, after_months) if after_months > 0 else None
+    conditions = []
+    if cutoff is not None:
+        conditions.append(WorkLog.work_date < cutoff)
+    if include_completed:
+        completed_ids = select(Project.id).where(Project.status == COMPLETED_STATUS)
+        conditions.append(and_(WorkLog.work_date < today, WorkLog.project_id.in_(completed_ids)))
+    if not conditions:
+        return ArchiveResult(cutoff, 0, 0, 0, dry_run)
+    condition = or_(*conditions)
+
+    if dry_run:
+        with db_manager.get_session_context() as session:
+            row = session.execute(
+                select(func.count(), func.count(func.distinct(WorkLog.project_id))).where(condition)
+            ).one()
+        return ArchiveResult(cutoff, row[0], row[1], 0, True)
+
+    # 2: 이전 실행이 중간에 멈춰 양쪽에 남은 로그 정리
+    with db_manager.get_session_context() as session:
+        reconciled = remove_overwritten(session)
+
+    moved_count = 0
+    project_ids = set()
+    while True:
+        # 3: 보관소에 복사 + 집계 갱신 (보관소만 쓰는 트랜잭션)
+        with db_manager.get_session_context() as session:
+            batch = session.execute(
+                select(WorkLog.id, WorkLog.project_id, WorkLog.work_date)
+                .where(condition).order_by(WorkLog.id).limit(batch_size)
+            ).all()
+            if not batch:
+                break
+            log_ids = [row.id for row in batch]
+            batch_keys = [(row.project_id, row.work_date) for row in batch]
+            batch_project_ids = {row.project_id for row in batch}
+
+            session.execute(insert(archived_work_logs).from_select(
+                ["project_id", "work_date", "id", "progress_added", "hours_spent", "memo"],
+                select(
+                    WorkLog.project_id, WorkLog.work_date, WorkLog.id,
+                    WorkLog.progress_added, WorkLog.hours_spent, WorkLog.memo
+                ).where(WorkLog.id.in_(log_ids))
+            ))
+            refresh_rollups(session, batch_project_ids)
+
+        # 4: 메인에서 삭제 (메인만 쓰는 트랜잭션)
+        #    실패하면(잠금 대기 초과 등) 방금 복사한 보관본을 되돌려 양쪽 중복 집계를 다음 실행까지 남기지 않음
+        try:
+            with db_manager.get_session_context() as session:
+                session.execute(delete(WorkLog).where(WorkLog.id.in_(log_ids)))
+        except Exception:
+            try:
+                with db_manager.get_session_context() as session:
+                    remove_overwritten(session, batch_keys)
+            except Exception as cleanup_error:
+                logger.error(f"💾❌ 보관 실패 후 중복 보관본 정리 실패 (다음 실행 때 정리): {str(cleanup_error)}")
+            raise
+
+        moved_count += len(log_ids)
+        project_ids |= batch_project_ids
+
+    if moved_count or reconciled:
+        logger.info(
+            f"💾✅ 작업 로그 {moved_count:,}건 보관소로 이동 (프로젝트 {len(project_ids)}개, "
+            f"기준일 {cutoff or '-'}, 정리 {reconciled}건)"
+        )
+    return ArchiveResult(cutoff, moved_count, len(project_ids), reconciled, False)
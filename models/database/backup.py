@@ -0,0 +1,340 @@
+"""
+온라인 백업 / 복원
+- sqlite3 backup API 로 앱 실행 중에도 일관된 스냅샷 복사 (파일 복사와 달리 WAL 내용 포함)
+- 작은 페이지 단위로 나눠 복사하고 단계마다 쉬어서 잠금을 오래 잡지 않음
+- 백업본은 무결성 검사 후 gzip 압축, 오래된 백업은 개수 기준으로 정리
+"""
+
+import gzip
+import logging
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .connection import DatabaseError, db_manager
+from utils import metrics
+
+BACKUP_PREFIX = "ProjectTracker-"
+PRERESTORE_PREFIX = "ProjectTracker-prerestore-"     # 복원 직전 안전 백업 - 개수 정리 대상 아님
+DEFAULT_KEEP = 7                # 보관할 백업 수
+DEFAULT_PAGES_PER_STEP = 256    # 단계당 복사 페이지 수 (4KB 페이지 기준 1MB)
+DEFAULT_STEP_SLEEP = 0.05       # 단계 사이 대기 (초) - 이 동안 다른 연결이 잠금을 얻음
+MAX_RESTARTS = 3                # 복사 중 원본 변경으로 재시작된 횟수가 이를 넘으면 한 번에 복사
+
+_BACKUP_STAMP = r"\d{8}-\d{6}\.db(\.gz)?$"
+
+logger = logging.getLogger(__name__)
+
+
+class _TooManyRestarts(Exception):
+    """단계 복사가 원본 쓰기 때문에 계속 재시작됨"""
+    pass
+
+
+def default_backup_dir() -> str:
+    """기본 백업 디렉토리 (DB 파일 옆 backups/)"""
+    return os.path.join(os.path.dirname(db_manager.db_path), "backups")
+
+
+def create_backup(backup_dir: Optional[str] = None, keep: int = DEFAULT_KEEP, compress: bool = True,
+                  pages_per_step: int = DEFAULT_PAGES_PER_STEP,
+                  step_sleep: float = DEFAULT_STEP_SLEEP, prefix: str = BACKUP_PREFIX) -> str:
+    """
+    현재 DB 온라인 백업
+
+    Args:
+        backup_dir: 백업 디렉토리 (None 이면 default_backup_dir())
+        keep: 보관할 백업 수 (0 이하 = 정리 안 함, 정리는 BACKUP_PREFIX 백업만)
+        compress: gzip 압축 여부
+        pages_per_step, step_sleep: 단계당 복사 페이지 수 / 단계 사이 대기 (초)
+        prefix: 파일명 접두어 (PRERESTORE_PREFIX = 복원 전 안전 백업)
+
+    Returns:
+        생성된 백업 파일 경로
+    """
+    backup_dir = backup_dir or default_backup_dir()
+    os.makedirs(backup_dir, exist_ok=True)
+
+    # 이름은 초 단위 시각 - 같은 초에 이미 있으면 다음 초까지 대기 (기존 백업 덮어쓰기 방지)
+    while True:
+        name = f"{prefix}{datetime.now().strftime('%Y%m%d-%H%M%S')}.db"
+        final_path = os.path.join(backup_dir, f"{name}.gz" if compress else name)
+        base_path = os.path.join(backup_dir, name)
+        if not os.path.exists(base_path) and not os.path.exists(f"{base_path}.gz"):
+            break
+        time.sleep(1)
+    snapshot_path = os.path.join(backup_dir, f".{name}.tmp")
+
+    started = time.perf_counter()
+    try:
+        # 1: 단계별 온라인 복사 → 단일 파일(DELETE 저널) 스냅샷
+        _copy_database(db_manager.db_path, snapshot_path, pages_per_step, step_sleep)
+
+        # 2: 스냅샷 무결성 검사
+        result = integrity_check(snapshot_path)
+        if result != "ok":
+            raise DatabaseError(f"💾❌ 백업본 무결성 검사 실패: {result}")
+
+        # 3: 압축 (임시 파일에 쓴 뒤 이름 변경 → 반쯤 쓰인 백업이 남지 않음)
+        if compress:
+            compressed_path = f"{snapshot_path}.gz"
+            with open(snapshot_path, "rb") as src, gzip.open(compressed_path, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(compressed_path, final_path)
+            os.remove(snapshot_path)
+        else:
+            os.replace(snapshot_path, final_path)
+
+        # 4: 오래된 백업 정리
+        removed = rotate_backups(backup_dir, keep)
+
+        elapsed = time.perf_counter() - started
+        metrics.backup_seconds.observe(elapsed)
+        metrics.backup_total.inc(result="success")
+        metrics.backup_last_success_timestamp.set(time.time())
+        logger.info(
+            f"💾✅ 백업 완료: {os.path.basename(final_path)} "
+            f"({os.path.getsize(final_path):,} bytes, {elapsed:.2f}s, 정리 {removed}개)"
+        )
+        return final_path
+
+    except Exception as e:
+        metrics.backup_total.inc(result="failure")
+        for path in (snapshot_path, f"{snapshot_path}.gz"):
+            if os.path.exists(path):
+                os.remove(path)
+        logger.error(f"💾❌ 백업 실패: {str(e)}")
+        if isinstance(e, DatabaseError):
+            raise
+        raise DatabaseError(f"💾❌ 백업 실패: {str(e)}")
+
+
+def list_backups(backup_dir: Optional[str] = None, prefix: str = BACKUP_PREFIX) -> List[Dict]:
+    """
+    백업 목록 (최신순)
+
+    Args:
+        prefix: BACKUP_PREFIX = 정기 / 수동 백업, PRERESTORE_PREFIX = 복원 전 안전 백업
+
+    Returns:
+        [{'name', 'path', 'bytes', 'created_at'}]
+    """
+    backup_dir = backup_dir or default_backup_dir()
+    if not os.path.isdir(backup_dir):
+        return []
+
+    # 접두어 바로 뒤가 시각이어야 함 → 정기 백업 목록에 복원 전 백업이 섞이지 않음
+    pattern = re.compile(rf"^{re.escape(prefix)}{_BACKUP_STAMP}")
+    backups = []
+    for name in os.listdir(backup_dir):
+        if not pattern.match(name):
+            continue
+        path = os.path.join(backup_dir, name)
+        stamp = name[len(prefix):len(prefix) + 15]
+        backups.append({
+            'name': name,
+            'path': path,
+            'bytes': os.path.getsize(path),
+            'created_at': datetime.strptime(stamp, "%Y%m%d-%H%M%S")
+        })
+
+    return sorted(backups, key=lambda backup: backup['name'], reverse=True)
+
+
+def rotate_backups(backup_dir: str, keep: int) -> int:
+    """최신 keep 개만 남기고 삭제 (복원 전 안전 백업은 제외) - 삭제한 개수 반환"""
+    if keep <= 0:
+        return 0
+
+    expired = list_backups(backup_dir)[keep:]
+    for backup in expired:
+        os.remove(backup['path'])
+    return len(expired)
+
+
+def integrity_check(path: str) -> str:
+    """PRAGMA integrity_check 결과 ("ok" 이면 정상, 아니면 첫 오류 메시지)"""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        return conn.execute("PRAGMA integrity_check").fetchone()[0]
+    except sqlite3.DatabaseError as e:
+        return str(e)
+    finally:
+        conn.close()
+
+
+def restore_backup(backup_path: str, verify_only: bool = False) -> Optional[str]:
+    """
+    백업본으로 복원 (앱 실행 중 가능)
+    - 백업본 무결성 검사 → 현재 DB 안전 백업 → backup API 로 현재 DB 에 덮어쓰기
+    - 데이터 버전을 복원 전보다 크게 올려서 버전 기준 캐시가 옛 결과를 재사용하지 않도록 함
+
+    Args:
+        backup_path: 백업 파일 (.db 또는 .db.gz)
+        verify_only: True 면 무결성 검사만
+
+    Returns:
+        복원 전 현재 DB 를 담은 안전 백업 경로 (verify_only 면 None)
+    """
+    if not os.path.isfile(backup_path):
+        raise ValueError(f"💾❌ 백업 파일을 찾을 수 없습니다: {backup_path}")
+
+    # 1: 압축 해제 (DB 디렉토리 임시 파일)
+    snapshot_path = os.path.join(os.path.dirname(db_manager.db_path), ".restore.tmp")
+    try:
+        if backup_path.endswith(".gz"):
+            with gzip.open(backup_path, "rb") as src, open(snapshot_path, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+        else:
+            shutil.copyfile(backup_path, snapshot_path)
+
+        # 2: 무결성 + 스키마 확인
+        result = integrity_check(snapshot_path)
+        if result != "ok":
+            raise DatabaseError(f"💾❌ 백업본 무결성 검사 실패: {result}")
+        _check_schema(snapshot_path)
+        logger.info(f"💾✅ 백업본 검증 완료: {os.path.basename(backup_path)}")
+
+        if verify_only:
+            return None
+
+        # 3: 현재 DB 안전 백업 (별도 접두어 - 이후 정기 백업의 개수 정리로 지워지지 않음)
+        safety_path = create_backup(os.path.dirname(os.path.abspath(backup_path)), keep=0, prefix=PRERESTORE_PREFIX)
+
+        # 4: 덮어쓰기 - 한 단계로 복사 (대상 쓰기 잠금은 복사 끝까지 유지되므로 나눠도 이득 없음)
+        version_before = db_manager.get_data_version()
+        src = sqlite3.connect(f"file:{snapshot_path}?mode=ro", uri=True)
+        dst = sqlite3.connect(db_manager.db_path, timeout=db_manager.busy_timeout_ms / 1000)
+        try:
+            src.backup(dst)
+            dst.execute(
+                "UPDATE app_meta SET value = max(value, ?) + 1 WHERE key = 'data_version'",
+                (version_before,)
+            )
+            dst.commit()
+        finally:
+            src.close()
+            dst.close()
+
+        # 5: 옛 백업에 없던 인덱스 / 트리거 보충
+        db_manager.create_tables()
+
+        logger.info(f"💾✅ 복원 완료: {os.path.basename(backup_path)} (이전 DB → {os.path.basename(safety_path)})")
+        return safety_path
+
+    except sqlite3.Error as e:
+        raise DatabaseError(f"💾❌ 복원 실패: {str(e)}")
+
+    finally:
+        if os.path.exists(snapshot_path):
+            os.remove(snapshot_path)
+
+
+# ===== 내부 헬퍼 =====
+def _copy_database(source_path: str, target_path: str, pages_per_step: int, step_sleep: float) -> None:
+    """
+    backup API 단계 복사
+    - 단계가 끝날 때마다 원본 읽기 잠금이 풀리고 progress 콜백에서 step_sleep 만큼 쉼
+    - 단계 사이 원본이 다른 연결에서 바뀌면 SQLite 가 처음부터 다시 복사함 (remaining 이 줄지 않음)
+    - 재시작이 MAX_RESTARTS 번을 넘으면 한 단계로 복사 (WAL 에서는 읽기 스냅샷만 잡으므로 쓰기는 막지 않음)
+    """
+    restarts = 0
+    last_remaining = None
+
+    def _progress(status, remaining, total):
+        nonlocal restarts, last_remaining
+        if last_remaining is not None and remaining >= last_remaining:
+            restarts += 1
+            if restarts > MAX_RESTARTS:
+                raise _TooManyRestarts()
+        last_remaining = remaining
+        # 단계 사이 휴식 (backup() 의 sleep 인자는 BUSY 재시도 때만 적용됨)
+        if remaining > 0:
+            time.sleep(step_sleep)
+
+    src = sqlite3.connect(f"file:{source_path}?mode=ro", uri=True,
+                          timeout=db_manager.busy_timeout_ms / 1000)
+    dst = sqlite3.connect(target_path)
+    try:
+        try:
+            src.backup(dst, pages=pages_per_step, progress=_progress, sleep=step_sleep)
+        except _TooManyRestarts:
+            logger.warning(f"💾⚠️ 백업 중 원본 변경으로 {restarts}회 재시작 → 한 번에 복사")
+            src.backup(dst)
+
+        # 백업본은 단일 파일로 보관 (WAL 헤더 제거)
+        dst.execute("PRAGMA journal_mode=DELETE")
+    finally:
+        src.close()
+        dst.close()
+
+
+def _check_schema(path: str) -> None:
+    """복원 대상에 필수 테이블이 있는지 확인"""
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    finally:
+        conn.close()
+
+    missing = {"projects", "work_logs"} - tables
+    if missing:
+        raise DatabaseError(f"💾❌ ProjectTracker 백업이 아닙니다 (없는 테이블: {', '.join(sorted(missing))})")
+
+
+# ===== 주기 백업 스케줄러 =====
+_scheduler_thread: Optional[threading.Thread] = None
+_scheduler_stop = threading.Event()
+_scheduler_lock = threading.Lock()
+
+
+def start_backup_scheduler(interval_hours: float, backup_dir: Optional[str] = None, keep: int = DEFAULT_KEEP,
+                           compress: bool = True) -> Optional[threading.Thread]:
+    """
+    주기 백업을 데몬 스레드로 시작 (프로세스당 1회)
+    - 마지막 백업이 interval 보다 오래됐으면 바로, 아니면 남은 시간 후 첫 백업
+    """
+    global _scheduler_thread
+
+    with _scheduler_lock:
+        if _scheduler_thread is not None:
+            return _scheduler_thread
+
+        interval_seconds = max(interval_hours, 0.01) * 3600
+
+        def _run():
+            while not _scheduler_stop.is_set():
+                backups = list_backups(backup_dir)
+                if backups:
+                    age = (datetime.now() - backups[0]['created_at']).total_seconds()
+                    delay = max(interval_seconds - age, 0.0)
+                else:
+                    delay = 0.0
+
+                if _scheduler_stop.wait(delay):
+                    break
+                try:
+                    create_backup(backup_dir, keep=keep, compress=compress)
+                except Exception:
+                    # 실패는 create_backup 에서 로그/메트릭 기록, 다음 주기에 재시도
+                    if _scheduler_stop.wait(min(interval_seconds, 3600)):
+                        break
+
+        _scheduler_stop.clear()
+        _scheduler_thread = threading.Thread(target=_run, name="db-backup", daemon=True)
+        _scheduler_thread.start()
+        logger.info(f"💾✅ 주기 백업 시작: {interval_hours}시간마다, {keep}개 보관")
+        return _scheduler_thread
+
+
+def stop_backup_scheduler() -> None:
+    """주기 백업 스레드 종료 요청"""
+    global _scheduler_thread
+    with _scheduler_lock:
+        _scheduler_stop.set()
+        _scheduler_thread = None
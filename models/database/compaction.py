@@ -0,0 +1,85 @@
+"""
+빈 작업 로그 정리 (compaction)
+- 오늘 작업 화면이 진행 중 프로젝트마다 만들어 두는 자리 표시용 로그(진행량 0, 작업시간 0, 메모 없음) 중
+  지난 날짜의 것을 삭제 → 테이블 / 인덱스 크기와 첫~마지막 작업일 범위 왜곡 제거
+- 보관소가 있으면 보관 로그도 같은 기준으로 정리 (집계 테이블 갱신)
+- 진행도 / 작업시간 합계는 0 행이 빠질 뿐이라 바뀌지 않음
+- dense 모드에서는 정리된 날이 과거 편집 화면에서 사라지므로 자동 정리는 sparse 모드에서만 (maintenance)
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+
+from sqlalchemy import delete, func, select
+
+from . import archive
+from .connection import db_manager
+from ..entities.work_log import WorkLog
+
+DEFAULT_AFTER_DAYS = 14         # 이 일수보다 지난 빈 로그만 정리 (최근 며칠은 편집 중일 수 있음)
+DEFAULT_BATCH_SIZE = 5000       # 한 번에 지우는 로그 수 (트랜잭션당 잠금 시간 제한)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    """빈 로그 정리 결과"""
+
+    before_date: date           # 이 날짜 이전의 빈 로그 정리
+    removed_count: int          # 메인에서 지운(dry_run 이면 지울) 로그 수
+    archived_removed_count: int # 보관소에서 지운 로그 수
+    dry_run: bool
+
+
+def placeholder_conditions(table) -> List:
+    """자리 표시용 빈 로그 조건 (진행량 0, 작업시간 0, 메모 없음 / 공백)"""
+    return [
+        table.c.progress_added == 0,
+        table.c.hours_spent == 0,
+        func.coalesce(func.trim(table.c.memo), "") == ""
+    ]
+
+
+def compact_placeholders(before: date, batch_size: int = DEFAULT_BATCH_SIZE,
+                         dry_run: bool = False) -> CompactionResult:
+    """
+    before 이전 날짜의 빈 로그 삭제
+
+    Args:
+        before: 이 날짜 이전 로그만 대상 (오늘 이후는 편집 중일 수 있으므로 항상 제외)
+        batch_size: 트랜잭션당 삭제 로그 수
+        dry_run: True 면 지울 로그 수만 계산
+    """
+    before = min(before, date.today())
+
+    def is_stale_placeholder(table):
+        return [table.c.work_date < before, *placeholder_conditions(table)]
+
+    logs = WorkLog.__table__
+    if dry_run:
+        with db_manager.get_session_context() as session:
+            count = session.execute(select(func.count()).where(*is_stale_placeholder(logs))).scalar()
+        return CompactionResult(before, int(count), 0, True)
+
+    # 1: 메인 - 배치 단위 삭제 (배치 트랜잭션마다 데이터 버전 증가)
+    removed_count = 0
+    while True:
+        with db_manager.get_session_context() as session:
+            batch_ids = select(logs.c.id).where(*is_stale_placeholder(logs)).limit(batch_size)
+            removed = session.execute(delete(logs).where(logs.c.id.in_(batch_ids))).rowcount
+        removed_count += removed
+        if removed < batch_size:
+            break
+
+    # 2: 보관소 - 한 번에 삭제 + 집계 갱신
+    with db_manager.get_session_context() as session:
+        archived_removed_count = archive.remove_archived(session, is_stale_placeholder)
+
+    if removed_count or archived_removed_count:
+        logger.info(
+            f"💾✅ 빈 작업 로그 정리: {removed_count:,}건 (보관소 {archived_removed_count:,}건, {before} 이전)"
+        )
+    return CompactionResult(before, removed_count, archived_removed_count, False)
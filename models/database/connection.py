@@ -1,12 +1,16 @@
 import os
+import time
 from typing import Generator
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy.exc import IntegrityError, OperationalError, StatementError
 from contextlib import contextmanager
 
 from .base import Base
+from .migrations import get_schema_version, run_migrations
+from utils import metrics
 
 class DatabaseError(Exception):
     """데이터베이스 관련 모든 오류"""
@@ -20,6 +24,12 @@ class DatabaseManager:
     _instance = None
     _engine = None
     _session_factory = None
+    _db_path = None
+    _readonly_engine = None
+    _archive_path = None
+    _archive_attached = False   # 보관소(archive) DB ATTACH 여부
+    _busy_timeout_ms = 5000     # sqlite3 기본 timeout (5초) 과 동일
+    _last_activity = 0.0        # 마지막 SQL 실행 시각 (monotonic)
 
     def __new__(cls):
         if cls._instance is None:
@@ -40,8 +50,10 @@ class DatabaseManager:
         try:
             database_url = self._get_database_url()
             self._create_engine(database_url)
+            self._register_metrics()
             self._create_session_factory()
             self.create_tables()
+            self._register_data_version_tracking()
             self._configure_sqlite()
 
             self.logger.info("💾✅ 데이터베이스 초기화 완료")
@@ -54,25 +66,36 @@ class DatabaseManager:
         """
         데이터베이스 URL 생성 및 디렉토리 확인
         """
-        # 1: 현재 파일 기준 상대 경로 계산
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.join(current_dir, '..', '..')
-        data_dir = os.path.join(project_root, 'data')
+        import config
 
-        # 2: 디렉토리 존재 확인 및 생성
+        # 1: DB 파일 경로 (기본: 현재 파일 기준 프로젝트 루트의 data/ProjectTracker.db)
+        configured_path = getattr(config, "DATABASE_PATH", None)
+        if configured_path:
+            db_path = os.path.abspath(configured_path)
+        else:
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            project_root = os.path.join(current_dir, '..', '..')
+            db_path = os.path.abspath(os.path.join(project_root, 'data', 'ProjectTracker.db'))
+        self._db_path = db_path
+
+        # 2: 데이터 디렉토리 존재 확인 및 생성
+        data_dir = os.path.dirname(db_path)
         if not os.path.exists(data_dir):
             os.makedirs(data_dir, mode=0o755)
             self.logger.debug(f"💾🔄 데이터 디렉토리 생성: {data_dir}")
 
-        # 3: DB 파일 경로 생성
-        db_path = os.path.join(data_dir, 'ProjectTracker.db')
-
-        # 4: DB 파일 존재 여부 확인
+        # 3: DB 파일 존재 여부 확인
         if not os.path.exists(db_path):
             self.logger.debug(f"💾🔄 새로운 데이터베이스 생성: {db_path}")
         else:
             self.logger.debug(f"💾🔄 기존 데이터베이스 연결: {db_path}")
 
+        # 4: 보관소 DB 경로 - 보관 기능을 켰거나 이미 보관한 파일이 있으면 ATTACH
+        self._archive_path = os.path.abspath(
+            getattr(config, "ARCHIVE_PATH", None) or os.path.join(data_dir, 'ProjectTracker-archive.db')
+        )
+        self._archive_attached = getattr(config, "ARCHIVE_ENABLED", False) or os.path.exists(self._archive_path)
+
         return f"sqlite:///{db_path}"
 
     def _create_engine(self, database_url: str) -> None:
@@ -86,12 +109,75 @@ class DatabaseManager:
                 connect_args={"check_same_thread": False},
                 poolclass=StaticPool,
             )
+            event.listen(self._engine, "connect", lambda dbapi_conn, record: self.attach_archive(dbapi_conn))
             self.logger.debug("💾✅ SQLAlchemy 엔진 생성 완료")
 
         except Exception as e:
             self.logger.error(f"💾❌ SQLAlchemy 엔진 생성 실패: {str(e)}")
             raise
 
+    def _register_metrics(self) -> None:
+        """
+        SQL 실행 횟수 및 DB 파일 크기 메트릭 등록
+        """
+        @event.listens_for(self._engine, "before_cursor_execute")
+        def _count_query(conn, cursor, statement, parameters, context, executemany):
+            self._last_activity = time.monotonic()
+            keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "OTHER"
+            if keyword not in ("SELECT", "INSERT", "UPDATE", "DELETE", "WITH"):
+                keyword = "OTHER"
+            metrics.sql_queries_total.inc(statement=keyword)
+
+        metrics.db_file_bytes.set_function(lambda: self._file_size(self._db_path), file="main")
+        metrics.db_file_bytes.set_function(lambda: self._file_size(f"{self._db_path}-wal"), file="wal")
+        metrics.db_file_bytes.set_function(lambda: self._file_size(self._archive_path), file="archive")
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        """파일 크기 (없으면 0)"""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @property
+    def db_path(self) -> str:
+        """SQLite DB 파일 절대 경로"""
+        return self._db_path
+
+    @property
+    def archive_path(self) -> str:
+        """보관소 DB 파일 절대 경로"""
+        return self._archive_path
+
+    @property
+    def archive_attached(self) -> bool:
+        """보관소 DB 가 연결되어 있는지 (archive.archived_work_logs 조회 가능 여부)"""
+        return self._archive_attached
+
+    def attach_archive(self, dbapi_conn, readonly: bool = False) -> None:
+        """
+        새 sqlite3 연결에 보관소 DB 를 'archive' 스키마로 ATTACH
+        - 읽기 전용 연결은 파일이 있을 때만 mode=ro 로 연결 (URI 파일명을 허용한 연결이어야 함)
+        """
+        if not self._archive_attached:
+            return
+        if readonly:
+            if os.path.exists(self._archive_path):
+                dbapi_conn.execute("ATTACH DATABASE ? AS archive", (f"file:{self._archive_path}?mode=ro",))
+            return
+        dbapi_conn.execute("ATTACH DATABASE ? AS archive", (self._archive_path,))
+
+    @property
+    def idle_seconds(self) -> float:
+        """이 프로세스에서 마지막 SQL 실행 후 지난 시간 (초)"""
+        return time.monotonic() - self._last_activity
+
+    @property
+    def busy_timeout_ms(self) -> int:
+        """잠금 대기 시간 (ms)"""
+        return self._busy_timeout_ms
+
     def _create_session_factory(self) -> None:
         """
         세션 팩토리 생성
@@ -116,15 +202,91 @@ class DatabaseManager:
             # 1: 모든 엔티티를 import해서 메타데이터에 등록
             from ..entities.project import Project
             from ..entities.work_log import WorkLog
+            from ..entities.archived_work_log import archive_metadata
+            from .search_index import create_archive_index
 
-            # 2: 테이블 생성
+            # 2: 테이블 생성 + 버전 마이그레이션 (변경/삭제) + 기존 테이블에 새로 추가된 인덱스 생성
             Base.metadata.create_all(bind=self._engine)
+            run_migrations(self._engine)
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(bind=self._engine, checkfirst=True)
+
+            # 3: 데이터 버전 추적 테이블 생성
+            self._create_data_version_tracking()
+
+            # +: 보관소 테이블 + 메모 검색 인덱스 + 프로젝트 삭제 시 보관 로그 정리 트리거
+            if self._archive_attached:
+                archive_metadata.create_all(bind=self._engine)
+                with self._engine.begin() as conn:
+                    create_archive_index(conn)
+                self._create_archive_cleanup_trigger()
             self.logger.debug("💾✅ 데이터베이스 테이블 생성/확인 완료")
 
         except Exception as e:
             self.logger.error(f"💾❌ 테이블 생성 실패: {str(e)}")
             raise
 
+    def _create_data_version_tracking(self) -> None:
+        """
+        데이터 버전 저장 테이블 (app_meta.data_version)
+        - 쓰기 트랜잭션 커밋마다 1 증가 (_register_data_version_tracking)
+        - DB 파일에 저장되므로 다른 프로세스(CLI / API 워커 등)의 쓰기도 반영 → 캐시 키로 사용 가능
+        """
+        statements = [
+            "CREATE TABLE IF NOT EXISTS app_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+            "INSERT OR IGNORE INTO app_meta (key, value) VALUES ('data_version', 0)",
+        ]
+
+        with self._engine.begin() as conn:
+            for statement in statements:
+                conn.execute(text(statement))
+
+    def _register_data_version_tracking(self) -> None:
+        """
+        행을 바꾼 트랜잭션만 커밋 직전에 데이터 버전 1 증가 (같은 트랜잭션 - 커밋 / 롤백을 함께 따름)
+        - 트랜잭션 시작 때 연결의 누적 변경 행 수(total_changes)를 기억해 두고 커밋 때 비교
+        - 행 단위 트리거와 달리 대량 upsert / 가져오기 / 보관 / 정리도 트랜잭션당 UPDATE 1번
+        - 보관소 변경도 같은 연결이므로 함께 감지
+        """
+        @event.listens_for(self._engine, "begin")
+        def _remember_changes(conn):
+            conn.info['changes_at_begin'] = conn.connection.driver_connection.total_changes
+
+        @event.listens_for(self._engine, "commit")
+        def _bump_if_changed(conn):
+            dbapi_conn = conn.connection.driver_connection
+            if dbapi_conn.total_changes != conn.info.pop('changes_at_begin', dbapi_conn.total_changes):
+                dbapi_conn.execute("UPDATE app_meta SET value = value + 1 WHERE key = 'data_version'")
+
+    def _create_archive_cleanup_trigger(self) -> None:
+        """
+        프로젝트 삭제 시 보관 로그 / 집계 삭제
+        - 메인 DB 트리거는 다른 스키마를 참조할 수 없으므로 이 연결 전용 TEMP 트리거로 생성
+          (트리거 본문은 스키마를 붙일 수 없어 메인과 겹치지 않는 테이블 이름으로 참조)
+        - 메인 work_logs 의 ON DELETE CASCADE 와 같은 역할
+        """
+        statement = (
+            "CREATE TEMP TRIGGER IF NOT EXISTS trg_projects_delete_archive "
+            "AFTER DELETE ON main.projects "
+            "BEGIN "
+            "DELETE FROM archived_work_logs WHERE project_id = old.id; "
+            "DELETE FROM work_log_rollups WHERE project_id = old.id; "
+            "END"
+        )
+        with self._engine.begin() as conn:
+            conn.execute(text(statement))
+
+    def get_data_version(self) -> int:
+        """
+        현재 데이터 버전 조회 (쓰기 트랜잭션 커밋마다 증가)
+        """
+        with self._engine.connect() as conn:
+            version = conn.execute(
+                text("SELECT value FROM app_meta WHERE key = 'data_version'")
+            ).scalar()
+        return int(version or 0)
+
     def _configure_sqlite(self) -> None:
         """
         SQLite 성능 최적화 설정
@@ -139,6 +301,10 @@ class DatabaseManager:
                 conn.execute(text("PRAGMA synchronous=NORMAL"))
                 # 캐시 크기 설정 (메모리 사용량 최적화)
                 conn.execute(text("PRAGMA cache_size=1000"))
+                # 보관소 DB 도 같은 저널 / 동기화 설정
+                if self._archive_attached:
+                    conn.execute(text("PRAGMA archive.journal_mode=WAL"))
+                    conn.execute(text("PRAGMA archive.synchronous=NORMAL"))
                 conn.commit()
 
             self.logger.debug("💾✅ SQLite 최적화 설정 완료")
@@ -147,6 +313,87 @@ class DatabaseManager:
             self.logger.error(f"💾❌ SQLite 설정 실패: {str(e)}")
             raise
 
+    def set_busy_timeout(self, milliseconds: int) -> None:
+        """
+        잠금 대기 시간 설정 - 다른 프로세스가 쓰는 중이면 즉시 실패하지 않고 대기
+        - 공유 연결(StaticPool)에 바로 적용, 읽기 전용 연결은 새로 열 때 적용
+        """
+        with self._engine.connect() as conn:
+            conn.execute(text(f"PRAGMA busy_timeout={int(milliseconds)}"))
+        self._busy_timeout_ms = int(milliseconds)
+
+        if self._readonly_engine is not None:
+            self._readonly_engine.dispose()
+            self._readonly_engine = None
+
+    # ===== 유지보수 메서드들 =====
+    def analyze(self) -> None:
+        """쿼리 플래너 통계 갱신"""
+        self._run_maintenance("ANALYZE")
+
+    def optimize(self) -> None:
+        """
+        PRAGMA optimize - 통계가 낡은 테이블만 ANALYZE
+        (이 연결에서 실행된 쿼리가 쓴 테이블 기준이므로 앱 공유 연결에서 실행)
+        """
+        self._run_maintenance("PRAGMA optimize")
+
+    def reindex(self) -> None:
+        """모든 인덱스 재구성"""
+        self._run_maintenance("REINDEX")
+
+    def rebuild_search_index(self) -> None:
+        """메모 전문 검색 인덱스를 작업 로그에서 다시 구성 (보관소 포함)"""
+        from .search_index import rebuild_archive_index, rebuild_main_index
+        try:
+            with self._engine.begin() as conn:
+                rebuild_main_index(conn)
+                if self._archive_attached:
+                    rebuild_archive_index(conn)
+            self.logger.info("💾✅ 메모 검색 인덱스 재구성 완료")
+
+        except OperationalError as e:
+            raise DatabaseError(f"💾❌ 메모 검색 인덱스 재구성 실패: {str(e)}")
+
+    def vacuum(self) -> None:
+        """DB 파일 재작성 (빈 페이지 회수) - 트랜잭션 밖에서만 실행 가능"""
+        self._run_maintenance("VACUUM")
+
+    def _run_maintenance(self, statement: str) -> None:
+        """유지보수 구문 실행 (autocommit)"""
+        try:
+            with self._engine.connect() as conn:
+                conn.execution_options(isolation_level="AUTOCOMMIT").exec_driver_sql(statement)
+            self.logger.info(f"💾✅ {statement} 완료")
+
+        except OperationalError as e:
+            raise DatabaseError(f"💾❌ {statement} 실패: {str(e)}")
+
+    def get_storage_stats(self) -> dict:
+        """
+        DB 파일 / 페이지 통계
+
+        Returns:
+            {'db_bytes', 'wal_bytes', 'archive_bytes', 'page_size', 'page_count', 'freelist_count',
+             'data_version', 'schema_version'}
+        """
+        with self._engine.connect() as conn:
+            page_size = conn.exec_driver_sql("PRAGMA page_size").scalar()
+            page_count = conn.exec_driver_sql("PRAGMA page_count").scalar()
+            freelist_count = conn.exec_driver_sql("PRAGMA freelist_count").scalar()
+            schema_version = get_schema_version(conn)
+
+        return {
+            'db_bytes': self._file_size(self._db_path),
+            'wal_bytes': self._file_size(f"{self._db_path}-wal"),
+            'archive_bytes': self._file_size(self._archive_path),
+            'page_size': int(page_size),
+            'page_count': int(page_count),
+            'freelist_count': int(freelist_count),
+            'data_version': self.get_data_version(),
+            'schema_version': schema_version
+        }
+
     def get_session(self) -> Session:
         """
         특수용도: 세션 수동 관리
@@ -184,5 +431,38 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @contextmanager
+    def get_readonly_connection(self) -> Generator[Connection, None, None]:
+        """
+        읽기 전용 별도 연결 (대용량 스트리밍 조회용)
+        - 앱 세션이 쓰는 공유 연결(StaticPool)과 분리 → 긴 조회 중에도 다른 세션이 막히지 않음
+        - WAL 모드라 쓰기와 동시에 일관된 스냅샷을 읽음
+        """
+        if self._readonly_engine is None:
+            self._readonly_engine = create_engine(
+                f"sqlite:///file:{self._db_path}?mode=ro&uri=true",
+                echo=False,
+                connect_args={"check_same_thread": False, "timeout": self._busy_timeout_ms / 1000},
+                poolclass=NullPool,
+            )
+            event.listen(
+                self._readonly_engine, "connect",
+                lambda dbapi_conn, record: self.attach_archive(dbapi_conn, readonly=True)
+            )
+
+        try:
+            conn = self._readonly_engine.connect()
+        except OperationalError as e:
+            raise DatabaseError(f"💾❌ 읽기 전용 연결 실패: {str(e)}")
+
+        try:
+            yield conn
+
+        except OperationalError as e:
+            raise DatabaseError(f"💾❌ 읽기 전용 조회 실패: {str(e)}")
+
+        finally:
+            conn.close()
+
 # 전역 데이터베이스 매니저 인스턴스
 db_manager = DatabaseManager()
\ No newline at end of file
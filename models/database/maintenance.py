@@ -0,0 +1,283 @@
+"""
+DB 유지보수 스케줄러
+- WAL 크기 기준 체크포인트 (PASSIVE → 커지면 TRUNCATE)
+- 주기적 PRAGMA optimize / ANALYZE (통계가 없으면 즉시 ANALYZE)
+- 유휴 시간 incremental vacuum (auto_vacuum=INCREMENTAL 일 때만, 선택)
+- 유휴 시간 빈 작업 로그 정리 (WORK_LOG_SPARSE 이고 WORK_LOG_COMPACT_AFTER_DAYS > 0 일 때)
+- 유휴 시간 작업 로그 보관 (ARCHIVE_ENABLED 일 때만, 선택)
+- 실행 내역(작업, 소요 시간, 결과)을 메모리에 보관하고 로그/메트릭으로 기록
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Deque, Generator, List, Optional
+
+import config
+from . import archive, compaction
+from .connection import DatabaseError, db_manager
+from utils import metrics
+
+DEFAULT_INTERVAL_SECONDS = 60
+DEFAULT_WAL_PASSIVE_BYTES = 4 * 1024 * 1024         # 자동 체크포인트(1000 페이지 ≈ 4MB)로 못 따라갈 때
+DEFAULT_WAL_TRUNCATE_BYTES = 64 * 1024 * 1024
+DEFAULT_OPTIMIZE_INTERVAL_HOURS = 6
+DEFAULT_ANALYZE_INTERVAL_HOURS = 24
+DEFAULT_VACUUM_IDLE_SECONDS = 300
+DEFAULT_VACUUM_PAGES = 256
+DEFAULT_COMPACT_INTERVAL_HOURS = 24
+DEFAULT_ARCHIVE_INTERVAL_HOURS = 24
+HISTORY_SIZE = 200
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MaintenanceRecord:
+    """유지보수 작업 1건 실행 내역"""
+
+    task: str                   # checkpoint_passive / checkpoint_truncate / optimize / analyze / incremental_vacuum / compact / archive
+    started_at: datetime
+    duration_seconds: float
+    success: bool
+    detail: str
+
+
+class MaintenanceScheduler:
+    """
+    유지보수 작업 판단 + 실행
+    - run_pending() 한 번이 한 주기 (조건을 만족한 작업만 실행)
+    - 체크포인트 / incremental vacuum 은 별도 sqlite3 연결, optimize / ANALYZE 는 앱 공유 연결에서 실행
+    """
+
+    def __init__(self):
+        self.interval_seconds = getattr(config, "MAINTENANCE_INTERVAL_SECONDS", DEFAULT_INTERVAL_SECONDS)
+        self.wal_passive_bytes = getattr(config, "WAL_CHECKPOINT_PASSIVE_BYTES", DEFAULT_WAL_PASSIVE_BYTES)
+        self.wal_truncate_bytes = getattr(config, "WAL_CHECKPOINT_TRUNCATE_BYTES", DEFAULT_WAL_TRUNCATE_BYTES)
+        self.optimize_interval = getattr(config, "OPTIMIZE_INTERVAL_HOURS", DEFAULT_OPTIMIZE_INTERVAL_HOURS) * 3600
+        self.analyze_interval = getattr(config, "ANALYZE_INTERVAL_HOURS", DEFAULT_ANALYZE_INTERVAL_HOURS) * 3600
+        self.vacuum_enabled = getattr(config, "INCREMENTAL_VACUUM_ENABLED", False)
+        self.vacuum_idle_seconds = getattr(config, "INCREMENTAL_VACUUM_IDLE_SECONDS", DEFAULT_VACUUM_IDLE_SECONDS)
+        self.vacuum_pages = getattr(config, "INCREMENTAL_VACUUM_PAGES", DEFAULT_VACUUM_PAGES)
+        # dense 모드는 정리된 날을 편집 화면에서 다시 채울 수 없으므로 sparse 모드에서만 자동 정리
+        self.compact_enabled = getattr(config, "WORK_LOG_SPARSE", False)
+        self.compact_after_days = getattr(config, "WORK_LOG_COMPACT_AFTER_DAYS", compaction.DEFAULT_AFTER_DAYS)
+        self.compact_interval = getattr(config, "WORK_LOG_COMPACT_INTERVAL_HOURS", DEFAULT_COMPACT_INTERVAL_HOURS) * 3600
+        self.archive_enabled = getattr(config, "ARCHIVE_ENABLED", False)
+        self.archive_interval = getattr(config, "ARCHIVE_INTERVAL_HOURS", DEFAULT_ARCHIVE_INTERVAL_HOURS) * 3600
+
+        self.history: Deque[MaintenanceRecord] = deque(maxlen=HISTORY_SIZE)
+        self._last_optimize = time.monotonic()
+        self._last_analyze = time.monotonic()
+        self._last_compact = time.monotonic() - self.compact_interval     # 시작 후 첫 유휴 시간에 바로 정리
+        self._last_archive = time.monotonic() - self.archive_interval     # 시작 후 첫 유휴 시간에 바로 보관
+        self._lock = threading.Lock()
+
+    def run_pending(self, force: bool = False) -> List[MaintenanceRecord]:
+        """
+        조건을 만족한 유지보수 작업 실행
+
+        Args:
+            force: True 면 주기/크기/유휴 조건을 무시하고 모든 작업 실행
+
+        Returns:
+            이번에 실행한 작업 내역
+        """
+        with self._lock:
+            records = []
+            now = time.monotonic()
+            idle = force or db_manager.idle_seconds >= self.vacuum_idle_seconds
+
+            # 1: WAL 체크포인트 (크기 기준, 유휴 중이면 TRUNCATE 로 파일까지 비움)
+            wal_bytes = _file_size(f"{db_manager.db_path}-wal")
+            if force or wal_bytes >= self.wal_truncate_bytes or (idle and wal_bytes >= self.wal_passive_bytes):
+                records.append(self._run("checkpoint_truncate", lambda: self._checkpoint("TRUNCATE", wal_bytes)))
+            elif wal_bytes >= self.wal_passive_bytes:
+                records.append(self._run("checkpoint_passive", lambda: self._checkpoint("PASSIVE", wal_bytes)))
+
+            # 2: 플래너 통계 - 없으면 바로 ANALYZE, 있으면 주기별 ANALYZE / optimize
+            if force or not self._has_statistics() or now - self._last_analyze >= self.analyze_interval:
+                records.append(self._run("analyze", self._analyze))
+                self._last_analyze = self._last_optimize = now
+            elif now - self._last_optimize >= self.optimize_interval:
+                records.append(self._run("optimize", self._optimize))
+                self._last_optimize = now
+
+            # 3: 유휴 시간 incremental vacuum (선택)
+            if self.vacuum_enabled and idle:
+                records.append(self._run("incremental_vacuum", self._incremental_vacuum))
+
+            # 4: 유휴 시간 빈 작업 로그 정리 - 보관 전에 실행해 빈 로그를 보관소로 옮기지 않음
+            if self.compact_enabled and self.compact_after_days > 0 and idle and (force or now - self._last_compact >= self.compact_interval):
+                records.append(self._run("compact", self._compact))
+                self._last_compact = now
+
+            # 5: 유휴 시간 작업 로그 보관 (선택) - 옮긴 만큼 생긴 빈 페이지는 다음 incremental vacuum 이 회수
+            if self.archive_enabled and idle and (force or now - self._last_archive >= self.archive_interval):
+                records.append(self._run("archive", self._archive))
+                self._last_archive = now
+
+            self.history.extend(records)
+            return records
+
+    # ===== 작업 =====
+    def _checkpoint(self, mode: str, wal_bytes: int) -> str:
+        """WAL 체크포인트 - (busy, WAL 프레임, 반영 프레임)"""
+        with _connect() as conn:
+            busy, log_frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+
+        after = _file_size(f"{db_manager.db_path}-wal")
+        detail = f"WAL {wal_bytes:,} → {after:,} bytes"
+        if mode == "PASSIVE":
+            detail += f", 프레임 {checkpointed}/{log_frames} 반영"
+        if busy or checkpointed < log_frames:
+            # 읽는 연결이 있어서 전부 반영 못 함 - 다음 주기에 다시 시도
+            detail += " (일부 대기 중)"
+        return detail
+
+    @staticmethod
+    def _analyze() -> str:
+        db_manager.analyze()
+        return "전체 테이블 통계 갱신"
+
+    @staticmethod
+    def _optimize() -> str:
+        db_manager.optimize()
+        return "낡은 통계만 갱신"
+
+    def _incremental_vacuum(self) -> str:
+        """빈 페이지 일부 회수 (auto_vacuum=INCREMENTAL 이 아니면 건너뜀)"""
+        with _connect() as conn:
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if auto_vacuum != 2:
+                return "auto_vacuum 이 INCREMENTAL 이 아님 (python -m cli vacuum --incremental 로 전환)"
+
+            before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if before == 0:
+                return "빈 페이지 없음"
+            # 결과 컬럼이 없는 PRAGMA 라 execute() 는 한 단계(1 페이지)만 실행 → executescript 로 끝까지 실행
+            conn.executescript(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)});")
+            after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+        return f"빈 페이지 {before:,} → {after:,}"
+
+    def _compact(self) -> str:
+        result = compaction.compact_placeholders(date.today() - timedelta(days=self.compact_after_days))
+        return (f"빈 작업 로그 {result.removed_count:,}건 삭제 "
+                f"(보관소 {result.archived_removed_count:,}건, {result.before_date} 이전)")
+
+    @staticmethod
+    def _archive() -> str:
+        result = archive.run_archive()
+        return f"작업 로그 {result.moved_count:,}건 보관 (프로젝트 {result.project_count}개, 기준일 {result.cutoff_date or '-'})"
+
+    def _has_statistics(self) -> bool:
+        """ANALYZE 통계(sqlite_stat1) 존재 여부"""
+        with _connect() as conn:
+            row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'").fetchone()
+        return row is not None
+
+    @staticmethod
+    def _run(task: str, action) -> MaintenanceRecord:
+        """작업 실행 + 소요 시간 / 결과 기록 (실패해도 다음 작업은 계속)"""
+        started_at = datetime.now()
+        started = time.perf_counter()
+        try:
+            detail = action()
+            success = True
+            logger.info(f"💾✅ 유지보수 {task}: {detail} ({time.perf_counter() - started:.3f}s)")
+        except Exception as e:
+            detail = str(e)
+            success = False
+            logger.error(f"💾❌ 유지보수 {task} 실패: {detail}")
+
+        duration = time.perf_counter() - started
+        metrics.maintenance_seconds.observe(duration, task=task)
+        metrics.maintenance_total.inc(task=task, result="success" if success else "failure")
+        return MaintenanceRecord(task, started_at, duration, success, detail)
+
+
+# ===== 내부 헬퍼 =====
+@contextmanager
+def _connect() -> Generator[sqlite3.Connection, None, None]:
+    """유지보수 전용 sqlite3 연결 (앱 세션 연결과 분리, 잠금은 busy_timeout 만큼 대기)"""
+    conn = sqlite3.connect(
+        db_manager.db_path,
+        timeout=db_manager.busy_timeout_ms / 1000,
+        isolation_level=None
+    )
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def enable_incremental_vacuum() -> None:
+    """auto_vacuum 을 INCREMENTAL 로 전환 (전체 VACUUM 1회 필요 - 앱 사용이 적을 때 실행)"""
+    try:
+        with _connect() as conn:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+        logger.info("💾✅ auto_vacuum=INCREMENTAL 전환 완료")
+
+    except sqlite3.Error as e:
+        raise DatabaseError(f"💾❌ auto_vacuum 전환 실패: {str(e)}")
+
+
+# ===== 주기 실행 스레드 =====
+_scheduler: Optional[MaintenanceScheduler] = None
+_scheduler_stop = threading.Event()
+_scheduler_lock = threading.Lock()
+
+
+def start_maintenance_scheduler() -> MaintenanceScheduler:
+    """유지보수 스케줄러를 데몬 스레드로 시작 (프로세스당 1회)"""
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is not None:
+            return _scheduler
+
+        scheduler = MaintenanceScheduler()
+
+        def _run():
+            while not _scheduler_stop.wait(scheduler.interval_seconds):
+                try:
+                    scheduler.run_pending()
+                except Exception as e:
+                    logger.error(f"💾❌ 유지보수 주기 실행 실패: {str(e)}")
+
+        _scheduler_stop.clear()
+        _scheduler = scheduler
+        threading.Thread(target=_run, name="db-maintenance", daemon=True).start()
+        logger.info(f"💾✅ DB 유지보수 스케줄러 시작: {scheduler.interval_seconds}초마다 점검")
+        return scheduler
+
+
+def stop_maintenance_scheduler() -> None:
+    """유지보수 스레드 종료 요청"""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler_stop.set()
+        _scheduler = None
+
+
+def get_maintenance_history() -> List[MaintenanceRecord]:
+    """실행 중인 스케줄러의 작업 내역 (최신순)"""
+    scheduler = _scheduler
+    if scheduler is None:
+        return []
+    return list(reversed(scheduler.history))
@@ -0,0 +1,114 @@
+"""
+버전 기반 스키마 마이그레이션
+- 현재 스키마 버전은 PRAGMA user_version 에 저장 (DB 헤더, 트랜잭션과 함께 롤백됨)
+- create_all 은 없는 테이블/인덱스만 만들고 기존 것은 바꾸지 않으므로,
+  변경/삭제는 여기 MIGRATIONS 에 버전 순서대로 추가
+- 각 마이그레이션은 버전 갱신과 같은 트랜잭션에서 실행 → 중간 실패 시 그 버전 전체 롤백
+  (pysqlite 는 DDL / PRAGMA 앞에 BEGIN 을 넣지 않으므로 AUTOCOMMIT 연결에서 BEGIN IMMEDIATE 를 직접 실행)
+"""
+
+import logging
+from typing import Callable, List, Tuple
+
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+
+# ===== 마이그레이션 =====
+def _drop_redundant_indexes(conn: Connection) -> None:
+    """
+    중복 인덱스 삭제 (쓰기마다 같은 내용의 B-tree 를 한 번 더 갱신하던 비용 제거)
+    - ix_projects_notion_page_id: notion_page_id UNIQUE 자동 인덱스와 동일
+    - ix_work_logs_project_date: unique_project_date(project_id, work_date) 자동 인덱스와 동일
+    - ix_work_logs_work_date: ix_work_logs_date_project(work_date, project_id) 의 앞부분과 동일 (이전 버전 DB)
+    """
+    for index_name in ("ix_projects_notion_page_id", "ix_work_logs_project_date", "ix_work_logs_work_date"):
+        conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index_name}")
+
+
+def _create_memo_search_index(conn: Connection) -> None:
+    """
+    메모 전문 검색 인덱스 (FTS5 외부 콘텐츠 테이블 + work_logs 동기화 트리거) 생성 후 기존 메모로 채움
+    - LIKE '%...%' 전체 스캔 대신 토큰 인덱스로 검색
+    """
+    from .search_index import create_main_index
+    create_main_index(conn)
+
+
+def _drop_row_data_version_triggers(conn: Connection) -> None:
+    """
+    행마다 app_meta.data_version 을 올리던 트리거 삭제
+    - 대량 쓰기에서 행 수만큼 UPDATE 가 추가되던 비용 제거 → 커밋 단위 증가로 대체 (connection)
+    """
+    for table in ("projects", "work_logs"):
+        for operation in ("insert", "update", "delete"):
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS trg_{table}_{operation}_data_version")
+
+
+# (버전, 설명, 실행 함수) - 버전은 1부터 연속, 한 번 배포한 항목은 수정하지 않고 새 버전으로 추가
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "중복 인덱스 삭제", _drop_redundant_indexes),
+    (2, "메모 전문 검색 인덱스", _create_memo_search_index),
+    (3, "데이터 버전 행 트리거 삭제", _drop_row_data_version_triggers),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+
+def get_schema_version(conn: Connection) -> int:
+    """현재 DB 스키마 버전 (PRAGMA user_version)"""
+    return int(conn.exec_driver_sql("PRAGMA user_version").scalar() or 0)
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """
+    적용 안 된 마이그레이션을 순서대로 실행
+
+    Returns:
+        이번에 적용한 버전 목록
+    """
+    with engine.connect() as conn:
+        current = get_schema_version(conn)
+
+    # +: 코드보다 새 버전의 DB 는 건드리지 않음
+    if current > LATEST_VERSION:
+        raise RuntimeError(
+            f"💾❌ DB 스키마 버전({current})이 코드가 아는 최신 버전({LATEST_VERSION})보다 높습니다"
+        )
+
+    applied = []
+    for version, description, migrate in MIGRATIONS:
+        if version <= current:
+            continue
+
+        if _apply(engine, version, migrate):
+            applied.append(version)
+            logger.info(f"💾✅ 마이그레이션 v{version} 적용: {description}")
+
+    return applied
+
+
+def _apply(engine: Engine, version: int, migrate: Callable[[Connection], None]) -> bool:
+    """
+    마이그레이션 1개 + 버전 갱신을 한 트랜잭션으로 실행
+
+    Returns:
+        적용 여부 (다른 프로세스가 먼저 적용했으면 False)
+    """
+    with engine.connect() as conn:
+        # 드라이버 자동 트랜잭션을 끄고 직접 시작 - 쓰기 잠금을 먼저 잡아 다른 프로세스와 동시 적용 방지
+        conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            if get_schema_version(conn) >= version:
+                conn.exec_driver_sql("ROLLBACK")
+                return False
+            migrate(conn)
+            conn.exec_driver_sql(f"PRAGMA user_version={int(version)}")
+            conn.exec_driver_sql("COMMIT")
+            return True
+        except Exception:
+            if conn.connection.dbapi_connection.in_transaction:
+                conn.exec_driver_sql("ROLLBACK")
+            raise
@@ -0,0 +1,129 @@
+"""
+작업 로그 메모 전문 검색 인덱스 (SQLite FTS5)
+- 메인: work_logs 를 content 로 쓰는 외부 콘텐츠 FTS5 테이블 (메모 사본 없이 토큰 인덱스만 보관)
+  work_logs INSERT / UPDATE OF memo / DELETE 트리거로 동기화 → 업서트 / 보관 이동 / 정리도 자동 반영
+- 보관소: archived_work_logs 는 WITHOUT ROWID 라 외부 콘텐츠로 못 쓰므로 메모 + 키를 함께 저장하는 FTS5 테이블
+  (rowid = (project_id, work_date) 에서 계산한 값, 보관소 안 트리거로 동기화)
+  원래 work_logs.id 는 AUTOINCREMENT 가 아니라 삭제 후 재사용되므로 보관소에서는 키로 쓰지 않음
+- 한국어 메모는 조사가 붙은 어절 단위로 토큰이 나뉘므로 검색어는 접두어 검색으로 변환 (prefix 인덱스로 빠르게)
+"""
+
+from sqlalchemy.engine import Connection
+
+from ..entities.archived_work_log import ARCHIVE_SCHEMA
+from ..entities.work_log_search import ARCHIVED_WORK_LOG_FTS, WORK_LOG_FTS
+
+# unicode61: 공백 / 구두점 기준 분리 (한글 포함), 발음 구별 기호 무시
+# prefix: 2 / 3 글자 접두어 인덱스 - "회의"* 같은 짧은 접두어 검색도 인덱스로 처리
+FTS_OPTIONS = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+
+# snippet() 강조 표시 - 메모에 나올 수 없는 제어 문자 (표시 계층에서 이스케이프 후 태그로 바꿈)
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+SNIPPET_ELLIPSIS = "…"
+SNIPPET_TOKENS = 16         # 메모 최대 100자 - 대부분 메모 전체가 들어가는 길이
+
+
+def create_main_index(conn: Connection) -> None:
+    """메인 메모 인덱스 + 동기화 트리거 생성 후 기존 로그로 채움 (마이그레이션에서 1회)"""
+    statements = [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {WORK_LOG_FTS} USING fts5("
+        f"memo, content = 'work_logs', content_rowid = 'id', {FTS_OPTIONS})",
+
+        # 외부 콘텐츠 테이블 삭제는 'delete' 명령에 이전 값을 그대로 넘겨야 인덱스에서 빠짐
+        f"CREATE TRIGGER IF NOT EXISTS trg_work_logs_insert_fts AFTER INSERT ON work_logs "
+        f"BEGIN INSERT INTO {WORK_LOG_FTS} (rowid, memo) VALUES (new.id, new.memo); END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_work_logs_delete_fts AFTER DELETE ON work_logs "
+        f"BEGIN INSERT INTO {WORK_LOG_FTS} ({WORK_LOG_FTS}, rowid, memo) VALUES ('delete', old.id, old.memo); END",
+        f"CREATE TRIGGER IF NOT EXISTS trg_work_logs_update_fts AFTER UPDATE OF memo ON work_logs "
+        f"BEGIN "
+        f"INSERT INTO {WORK_LOG_FTS} ({WORK_LOG_FTS}, rowid, memo) VALUES ('delete', old.id, old.memo); "
+        f"INSERT INTO {WORK_LOG_FTS} (rowid, memo) VALUES (new.id, new.memo); "
+        f"END",
+    ]
+    for statement in statements:
+        conn.exec_driver_sql(statement)
+    rebuild_main_index(conn)
+
+
+def rebuild_main_index(conn: Connection) -> None:
+    """메인 메모 인덱스를 work_logs 에서 다시 구성"""
+    conn.exec_driver_sql(f"INSERT INTO {WORK_LOG_FTS} ({WORK_LOG_FTS}) VALUES ('rebuild')")
+
+
+def archive_fts_rowid(alias: str) -> str:
+    """
+    보관소 인덱스 rowid 식 - 보관 로그 기본키 (project_id, work_date) 에서 계산
+    - 율리우스일(정수부)은 7자리 → project_id × 10^7 에 더하면 키마다 유일
+    - 트리거에서 기본키로 바로 rowid 를 찾으므로 삭제 / 수정이 인덱스 전체를 훑지 않음
+    """
+    return f"{alias}.project_id * 10000000 + CAST(julianday({alias}.work_date) AS INTEGER)"
+
+
+_ARCHIVE_FTS_TRIGGERS = (
+    "trg_archived_work_logs_insert_fts",
+    "trg_archived_work_logs_delete_fts",
+    "trg_archived_work_logs_update_fts",
+)
+
+
+def create_archive_index(conn: Connection) -> None:
+    """
+    보관소 메모 인덱스 + 동기화 트리거 생성 (보관소가 연결된 경우, 없을 때만)
+    - 처음 만들 때 이미 보관된 로그로 채움
+    - 예전 형식(rowid = 원래 work_logs.id) 인덱스는 지우고 다시 만듦
+    """
+    insert_trigger_sql = conn.exec_driver_sql(
+        f"SELECT sql FROM {ARCHIVE_SCHEMA}.sqlite_master WHERE type = 'trigger' AND name = ?",
+        (_ARCHIVE_FTS_TRIGGERS[0],)
+    ).scalar()
+    if insert_trigger_sql is not None and "new.id" not in insert_trigger_sql:
+        return
+
+    # 예전 형식 / 중간에 멈춘 생성 정리
+    for trigger in _ARCHIVE_FTS_TRIGGERS:
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {ARCHIVE_SCHEMA}.{trigger}")
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {ARCHIVE_SCHEMA}.{ARCHIVED_WORK_LOG_FTS}")
+
+    # 보관소 스키마의 트리거 본문은 같은 스키마 테이블만 (스키마 없이) 참조
+    statements = [
+        f"CREATE VIRTUAL TABLE {ARCHIVE_SCHEMA}.{ARCHIVED_WORK_LOG_FTS} USING fts5("
+        f"memo, project_id UNINDEXED, work_date UNINDEXED, {FTS_OPTIONS})",
+
+        f"CREATE TRIGGER {ARCHIVE_SCHEMA}.trg_archived_work_logs_insert_fts "
+        f"AFTER INSERT ON archived_work_logs "
+        f"BEGIN INSERT INTO {ARCHIVED_WORK_LOG_FTS} (rowid, memo, project_id, work_date) "
+        f"VALUES ({archive_fts_rowid('new')}, new.memo, new.project_id, new.work_date); END",
+        f"CREATE TRIGGER {ARCHIVE_SCHEMA}.trg_archived_work_logs_delete_fts "
+        f"AFTER DELETE ON archived_work_logs "
+        f"BEGIN DELETE FROM {ARCHIVED_WORK_LOG_FTS} WHERE rowid = {archive_fts_rowid('old')}; END",
+        f"CREATE TRIGGER {ARCHIVE_SCHEMA}.trg_archived_work_logs_update_fts "
+        f"AFTER UPDATE OF memo ON archived_work_logs "
+        f"BEGIN UPDATE {ARCHIVED_WORK_LOG_FTS} SET memo = new.memo WHERE rowid = {archive_fts_rowid('old')}; END",
+    ]
+    for statement in statements:
+        conn.exec_driver_sql(statement)
+    rebuild_archive_index(conn)
+
+
+def rebuild_archive_index(conn: Connection) -> None:
+    """보관소 메모 인덱스를 archived_work_logs 에서 다시 구성"""
+    conn.exec_driver_sql(f"DELETE FROM {ARCHIVE_SCHEMA}.{ARCHIVED_WORK_LOG_FTS}")
+    conn.exec_driver_sql(
+        f"INSERT INTO {ARCHIVE_SCHEMA}.{ARCHIVED_WORK_LOG_FTS} (rowid, memo, project_id, work_date) "
+        f"SELECT {archive_fts_rowid('logs')}, logs.memo, logs.project_id, logs.work_date "
+        f"FROM {ARCHIVE_SCHEMA}.archived_work_logs AS logs"
+    )
+
+
+def to_match_query(text: str) -> str:
+    """
+    사용자 검색어 → FTS5 MATCH 식
+    - 공백으로 나눈 단어마다 큰따옴표로 감싼 접두어 검색 ("회의"* → 회의, 회의에서, 회의록 ...)
+    - 모든 단어를 포함한 메모만 (AND), FTS5 연산자 / 특수문자는 문자 그대로 검색
+
+    Returns:
+        MATCH 식 (검색어가 비면 빈 문자열)
+    """
+    terms = [term.replace('"', '""') for term in text.split()]
+    return " ".join(f'"{term}"*' for term in terms)
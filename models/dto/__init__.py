@@ -0,0 +1,26 @@
+"""
+DTO 패키지 초기화
+Service → Controller → View 로 전달되는 읽기 전용 데이터 구조 제공
+"""
+
+from .calendar_heatmap import CalendarHeatmap
+from .deadline_risk import DeadlineRisk
+from .import_result import ImportResult
+from .memo_search_page import MemoSearchPage
+from .project_summary import ProjectSummary
+from .records import ProjectRecord, WorkLogRecord, format_d_day
+from .timeline import TimelineData
+from .work_log_page import WorkLogPage
+
+__all__ = [
+    "CalendarHeatmap",
+    "DeadlineRisk",
+    "ImportResult",
+    "MemoSearchPage",
+    "ProjectSummary",
+    "ProjectRecord",
+    "WorkLogRecord",
+    "format_d_day",
+    "TimelineData",
+    "WorkLogPage"
+]
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CalendarHeatmap:
+    """
+    캘린더 히트맵 데이터 (요일 × 주)
+    - hours / dates: (7, 주 수) 배열, 행 0 = 월요일, 기간 밖 칸의 hours 는 NaN
+    """
+
+    hours: np.ndarray
+    dates: np.ndarray
+    week_starts: List[date]
+    start_date: date
+    end_date: date
+    total_hours: float          # 기간 총 작업시간
+    active_days: int            # 작업한 날 수
+    longest_streak: int         # 최장 연속 작업일
+    max_daily_hours: float      # 하루 최대 작업시간
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class DeadlineRisk:
+    """
+    몬테카를로 시뮬레이션 기반 마감 리스크
+    - 계산 불가(데이터 없음) 또는 시뮬레이션 기간 초과 시 None
+    """
+
+    project_id: int
+    name: str
+    end_date: date
+    p50_date: Optional[date]              # 50% 확률 완료일
+    p90_date: Optional[date]              # 90% 확률 완료일
+    miss_probability: Optional[float]     # 마감일 초과 확률 (0~1)
+    trials: int
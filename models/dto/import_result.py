@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ImportResult:
+    """
+    작업 로그 가져오기 결과
+    - 검증 실패 / 프로젝트 미확인 행은 건너뛰고 개수만 집계
+    """
+
+    total_rows: int             # 파일에서 읽은 행 수
+    imported_rows: int          # upsert 한 행 수 (dry-run 이면 0)
+    invalid_rows: int           # 값 검증 실패 행 수
+    unresolved_rows: int        # 프로젝트를 찾지 못한 행 수
+    chunk_count: int
+    elapsed_seconds: float
+    dry_run: bool = False
+
+    @property
+    def skipped_rows(self) -> int:
+        return self.invalid_rows + self.unresolved_rows
+
+    @property
+    def rows_per_second(self) -> float:
+        """처리량 (읽은 행 기준)"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_rows / self.elapsed_seconds
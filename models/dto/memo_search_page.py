@@ -0,0 +1,25 @@
+import math
+from dataclasses import dataclass
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class MemoSearchPage:
+    """
+    메모 검색 결과 한 페이지 (순위순 오프셋 페이지)
+    - total_count: 조건에 맞는 전체 로그 수, page: 1부터
+    """
+
+    frame: pd.DataFrame
+    total_count: int
+    page: int
+    page_size: int
+
+    @property
+    def total_pages(self) -> int:
+        return max(1, math.ceil(self.total_count / self.page_size))
+
+    @property
+    def has_next(self) -> bool:
+        return self.page < self.total_pages
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class ProjectSummary:
+    """
+    프로젝트 현황 요약 (숫자 그대로 보관)
+    - 테이블과 차트가 같은 결과를 공유
+    - 문자열 포맷팅은 View에서만 수행
+    """
+
+    project_id: int
+    name: str
+    d_day_display: str
+    target_value: int
+    current_progress: int
+    progress_rate: float                          # 진행률 (%)
+    worked_hours: float                           # 누적 작업시간
+    required_hours: Optional[float]               # 남은 작업 예상 필요시간 (효율성 데이터 없으면 None)
+    estimated_completion_date: Optional[date]     # 예상 마감일 (계산 불가 시 None)
+
+    # ===== 신뢰구간 (효율성 분산 기반) =====
+    required_hours_low: Optional[float] = None
+    required_hours_high: Optional[float] = None            # 효율성 하한 ≤ 0 이면 None (상한 없음)
+    completion_date_low: Optional[date] = None
+    completion_date_high: Optional[date] = None
+
+    # ===== 최근 구간 속도/효율성 (7/14/30일) =====
+    velocity_7d: Optional[float] = None                    # 일평균 진행량
+    velocity_14d: Optional[float] = None
+    velocity_30d: Optional[float] = None
+    efficiency_7d: Optional[float] = None                  # 진행량/시간 (표본 없으면 None)
+    efficiency_14d: Optional[float] = None
+    efficiency_30d: Optional[float] = None
+    forecast_window_days: Optional[int] = None             # 예측에 쓴 최근 구간 (None = 전체 이력)
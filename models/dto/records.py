@@ -0,0 +1,60 @@
+"""
+읽기 전용 목록 조회용 경량 레코드
+- ORM 엔티티 + to_dict() 대신 Core select() 결과 행에서 바로 생성
+- __slots__ 로 행당 메모리 / 속성 접근 비용 최소화
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+def format_d_day(days_until_deadline: int) -> str:
+    """D-Day 표시용 문자열 - D-3 / D-Day / D+2"""
+    if days_until_deadline > 0:
+        return f"D-{days_until_deadline}"
+    elif days_until_deadline == 0:
+        return "D-Day"
+    else:
+        return f"D+{abs(days_until_deadline)}"
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectRecord:
+    """프로젝트 목록 행 (파생 필드는 배치당 한 번 계산된 오늘 날짜 기준)"""
+
+    id: int
+    notion_page_id: str
+    name: str
+    status: str
+    start_date: date
+    end_date: date
+    target_value: int
+    initial_progress: int
+    current_progress: int           # 초기값 + 작업로그 누적 (쿼리에서 집계)
+    days_until_deadline: int
+    d_day_display: str
+
+    @property
+    def is_overdue(self) -> bool:
+        """마감일 초과 여부"""
+        return self.days_until_deadline < 0
+
+
+@dataclass(frozen=True, slots=True)
+class WorkLogRecord:
+    """작업 로그 행"""
+
+    id: int
+    project_id: int
+    work_date: date
+    progress_added: int
+    hours_spent: float
+    memo: Optional[str]
+
+    @property
+    def efficiency(self) -> float:
+        """작업 효율성 (진행량/시간)"""
+        if self.hours_spent <= 0:
+            return 0.0
+        return self.progress_added / self.hours_spent
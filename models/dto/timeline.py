@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from datetime import date
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class TimelineData:
+    """
+    기간별 작업시간 추이 (SQL에서 구간 집계 → 0으로 채운 밀집 행렬)
+    - matrix: DataFrame (index: 구간 시작일, columns: 프로젝트명, values: 작업시간)
+    - granularity: 실제 적용된 집계 단위 (day / week / month)
+    - 차트와 요약 수치는 모두 matrix 하나에서 계산
+    """
+
+    matrix: pd.DataFrame
+    granularity: str
+    start_date: date
+    end_date: date
+
+    @property
+    def days(self) -> int:
+        """조회 기간 일수"""
+        return (self.end_date - self.start_date).days + 1
+
+    @property
+    def empty(self) -> bool:
+        """기간 내 작업 기록 없음"""
+        return self.matrix.shape[1] == 0
+
+    @property
+    def total_hours(self) -> float:
+        """기간 총 작업시간"""
+        return float(self.matrix.to_numpy().sum())
+
+    @property
+    def avg_hours_per_day(self) -> float:
+        """기간 일평균 작업시간 (작업 안 한 날 포함)"""
+        return self.total_hours / self.days
+
+    @property
+    def worked_projects(self) -> int:
+        """기간 내 작업한 프로젝트 수"""
+        return int((self.matrix.to_numpy().sum(axis=0) > 0).sum())
+
+    @property
+    def cumulative(self) -> pd.DataFrame:
+        """프로젝트별 누적 작업시간"""
+        return self.matrix.cumsum()
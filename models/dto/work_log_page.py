@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class WorkLogPage:
+    """
+    지난 작업 로그 키셋 페이지
+    - next_cursor: 다음 페이지 조회 기준 (이 페이지 마지막 행의 (work_date, project_id)), 마지막 페이지면 None
+    """
+
+    frame: pd.DataFrame
+    next_cursor: Optional[Tuple[date, int]]
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
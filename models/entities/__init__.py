@@ -5,8 +5,14 @@ ORM 모델들을 제공
 
 from .project import Project
 from .work_log import WorkLog
+from .archived_work_log import archived_work_log_rollups, archived_work_logs
+from .work_log_search import archived_work_log_fts, work_log_fts
 
 __all__ = [
     "Project",
-    "WorkLog"
+    "WorkLog",
+    "archived_work_logs",
+    "archived_work_log_rollups",
+    "work_log_fts",
+    "archived_work_log_fts"
 ]
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+보관소(archive) 테이블 - ATTACH 한 별도 SQLite 파일의 작업 로그 / 프로젝트별 집계
+- 메인 Base 메타데이터와 분리 (보관소가 연결된 경우에만 생성)
+- ORM 매핑 없이 Core Table 로만 사용 (이동 / UNION 조회 / 집계 병합)
+"""
+
+from sqlalchemy import Column, Date, Float, Index, Integer, MetaData, String, Table
+
+ARCHIVE_SCHEMA = "archive"
+
+archive_metadata = MetaData(schema=ARCHIVE_SCHEMA)
+
+# 보관된 작업 로그 - work_logs 와 같은 컬럼, (project_id, work_date) 클러스터드 키
+archived_work_logs = Table(
+    "archived_work_logs",     # 메인과 다른 이름 - TEMP 트리거 안에서는 스키마를 붙일 수 없어 이름으로 구분
+    archive_metadata,
+    Column("project_id", Integer, primary_key=True, comment="프로젝트 ID (FK 없음 - 삭제는 TEMP 트리거가 정리)"),
+    Column("work_date", Date, primary_key=True, comment="작업일"),
+    Column("id", Integer, nullable=False, comment="메인 work_logs 에서의 원래 ID (재사용될 수 있어 키 아님)"),
+    Column("progress_added", Integer, nullable=False, comment="진행량"),
+    Column("hours_spent", Float, nullable=False, comment="작업시간"),
+    Column("memo", String(100), nullable=True, comment="작업 메모"),
+    Index("ix_archived_work_logs_date_project", "work_date", "project_id"),     # 기간 조회
+    sqlite_with_rowid=False,
+)
+
+# 프로젝트별 보관 로그 집계 - 진행도 / 효율성 / 지문 계산 때 보관 로그를 읽지 않도록 유지
+archived_work_log_rollups = Table(
+    "work_log_rollups",
+    archive_metadata,
+    Column("project_id", Integer, primary_key=True),
+    Column("log_count", Integer, nullable=False),
+    Column("progress_sum", Integer, nullable=False),
+    Column("hours_sum", Float, nullable=False),
+    Column("progress_hours_sum", Float, nullable=False),    # Σ 진행량×작업시간 (로그 지문용)
+    Column("efficiency_sum", Float, nullable=False),        # Σ 효율성 (작업시간 > 0 로그)
+    Column("efficiency_sq_sum", Float, nullable=False),     # Σ 효율성²
+    Column("efficiency_count", Integer, nullable=False),
+    Column("first_work_date", Date, nullable=False),
+    Column("last_work_date", Date, nullable=False),
+)
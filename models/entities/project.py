@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from .work_log import WorkLog
 
 from ..database.base import Base
+from ..dto.records import format_d_day
 
 
 class Project(Base):
@@ -92,13 +93,16 @@ class Project(Base):
         # 성능을 위한 인덱스
         Index("ix_projects_status", "status"),
         Index("ix_projects_end_date", "end_date"),
-        Index("ix_projects_notion_page_id", "notion_page_id"),
+        # notion_page_id 조회는 UNIQUE 자동 인덱스 사용
     )
 
     # ===== 속성값 계산 =====
     @property
     def current_progress(self) -> int:
-        """현재 진행도 = 초기값 + 작업로그 누적 (자동 계산)"""
+        """
+        현재 진행도 = 초기값 + 작업로그 누적 (자동 계산)
+        - 메인 work_logs 만 합산 (보관소로 옮긴 로그 제외) - 목록/통계는 ProjectRepository 레코드 사용
+        """
         work_logs_sum = sum(log.progress_added for log in self.work_logs)
         return self.initial_progress + work_logs_sum
 
@@ -117,13 +121,7 @@ class Project(Base):
     @property
     def d_day_display(self) -> str:
         """D-Day 표시용 문자열 (매번 계산)"""
-        days = self.days_until_deadline
-        if days > 0:
-            return f"D-{days}"
-        elif days == 0:
-            return "D-Day"
-        else:
-            return f"D+{abs(days)}"
+        return format_d_day(self.days_until_deadline)
 
     # ===== Base.to_dict() 오버라이드 =====
     def to_dict(self) -> dict:
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
 
 from ..database.base import Base
 
+MEMO_MAX_LENGTH = 100
+
 
 class WorkLog(Base):
     """
@@ -59,7 +61,7 @@ class WorkLog(Base):
     )
 
     memo: Mapped[Optional[str]] = mapped_column(
-    String(100),
+    String(MEMO_MAX_LENGTH),
     nullable=True,
     comment="작업 메모 (100자 제한)"
     )
@@ -81,14 +83,13 @@ class WorkLog(Base):
             "hours_spent >= 0",
             name="valid_hours"
         ),
-        # 하루에 한 번만 기록 가능
+        # 하루에 한 번만 기록 가능 (자동 인덱스가 프로젝트별 조회에도 쓰임)
         UniqueConstraint(
             "project_id", "work_date",
             name="unique_project_date"
         ),
         # 성능을 위한 인덱스
-        Index("ix_work_logs_work_date", "work_date"),
-        Index("ix_work_logs_project_date", "project_id", "work_date"),
+        Index("ix_work_logs_date_project", "work_date", "project_id"),   # 기간 조회 + 키셋 페이지네이션
     )
 
     # ===== 계산된 속성 =====
@@ -0,0 +1,30 @@
+"""
+메모 전문 검색(FTS5) 가상 테이블 - 쿼리용 경량 테이블 정의
+- 가상 테이블은 create_all 로 만들 수 없으므로 메타데이터에 넣지 않음
+  (메인은 마이그레이션, 보관소는 보관소 연결 시 database.search_index 에서 생성)
+- bm25() / snippet() 은 테이블 이름을 인자로 받으므로 이름 상수도 함께 제공
+"""
+
+from sqlalchemy import Date, Integer, String, column, table
+
+from .archived_work_log import ARCHIVE_SCHEMA
+
+WORK_LOG_FTS = "work_log_fts"
+ARCHIVED_WORK_LOG_FTS = "archived_work_log_fts"
+
+# 메인 - work_logs 외부 콘텐츠 (rowid = work_logs.id)
+work_log_fts = table(
+    WORK_LOG_FTS,
+    column("rowid", Integer),
+    column("memo", String),
+)
+
+# 보관소 - 메모 + 검색 결과를 보관 로그 기본키로 찾기 위한 키 (rowid = 키에서 계산, search_index.archive_fts_rowid)
+archived_work_log_fts = table(
+    ARCHIVED_WORK_LOG_FTS,
+    column("rowid", Integer),
+    column("memo", String),
+    column("project_id", Integer),
+    column("work_date", Date),
+    schema=ARCHIVE_SCHEMA,
+)
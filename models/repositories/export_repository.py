@@ -0,0 +1,123 @@
+from typing import Callable, Iterator, Optional
+from datetime import date
+from sqlalchemy import Float, func, select
+from sqlalchemy.engine import Connection
+import pandas as pd
+
+from ..database.connection import db_manager
+from ..database import archive
+from ..entities.archived_work_log import archived_work_log_rollups
+from ..entities.project import Project
+from ..entities.work_log import WorkLog
+
+
+class ExportRepository:
+    """내보내기용 스트리밍 조회 - 읽기 전용 연결에서 청크 단위로 DataFrame 반환"""
+
+    def __init__(self):
+        pass
+
+    def stream_work_logs(self, chunk_size: int, start_date: Optional[date] = None,
+                         end_date: Optional[date] = None) -> Iterator[pd.DataFrame]:
+        """
+        작업 로그 + 프로젝트명 청크 스트리밍 (날짜 → 프로젝트 ID 순, 기간이 보관소에 닿으면 보관 로그 포함)
+
+        Yields:
+            DataFrame[work_date, project_id, project_name, progress_added, hours_spent, memo]
+        """
+        def in_range(table):
+            conditions = []
+            if start_date is not None:
+                conditions.append(table.c.work_date >= start_date)
+            if end_date is not None:
+                conditions.append(table.c.work_date <= end_date)
+            return conditions
+
+        def build(conn: Connection):
+            logs = archive.work_logs_source(conn, in_range, start_date=start_date)
+            return (
+                select(
+                    logs.c.work_date,
+                    logs.c.project_id,
+                    Project.name.label('project_name'),
+                    logs.c.progress_added,
+                    logs.c.hours_spent,
+                    logs.c.memo
+                )
+                .join(Project, logs.c.project_id == Project.id)
+                .where(*in_range(logs))
+                .order_by(logs.c.work_date, logs.c.project_id)
+            )
+
+        return self._stream(build, chunk_size)
+
+    def stream_project_stats(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        프로젝트별 통계 청크 스트리밍 (프로젝트 ID 순)
+
+        Yields:
+            DataFrame[project_id, name, status, start_date, end_date, target_value, initial_progress,
+                      current_progress, log_count, worked_hours, first_work_date, last_work_date,
+                      avg_efficiency]
+        """
+        efficiency = func.cast(WorkLog.progress_added, Float) / func.nullif(WorkLog.hours_spent, 0)
+        progress_sum = func.coalesce(func.sum(WorkLog.progress_added), 0)
+        log_count = func.count(WorkLog.id)
+        worked_hours = func.coalesce(func.sum(WorkLog.hours_spent), 0.0)
+        first_work_date = func.min(WorkLog.work_date)
+        last_work_date = func.max(WorkLog.work_date)
+        avg_efficiency = func.avg(efficiency)
+
+        # 보관 로그는 프로젝트별 집계 테이블(1:1)로 합산 - 보관 로그 자체는 읽지 않음
+        rollups = archived_work_log_rollups.c
+        if db_manager.archive_attached:
+            progress_sum = progress_sum + func.coalesce(rollups.progress_sum, 0)
+            log_count = log_count + func.coalesce(rollups.log_count, 0)
+            worked_hours = worked_hours + func.coalesce(rollups.hours_sum, 0.0)
+            first_work_date = func.coalesce(func.min(first_work_date, rollups.first_work_date),
+                                            first_work_date, rollups.first_work_date)
+            last_work_date = func.coalesce(func.max(last_work_date, rollups.last_work_date),
+                                           last_work_date, rollups.last_work_date)
+            avg_efficiency = (
+                (func.coalesce(func.sum(efficiency), 0.0) + func.coalesce(rollups.efficiency_sum, 0.0))
+                / func.nullif(func.count(efficiency) + func.coalesce(rollups.efficiency_count, 0), 0)
+            )
+
+        def build(conn: Connection):
+            stmt = (
+                select(
+                    Project.id.label('project_id'),
+                    Project.name,
+                    Project.status,
+                    Project.start_date,
+                    Project.end_date,
+                    Project.target_value,
+                    Project.initial_progress,
+                    (Project.initial_progress + progress_sum).label('current_progress'),
+                    log_count.label('log_count'),
+                    worked_hours.label('worked_hours'),
+                    first_work_date.label('first_work_date'),
+                    last_work_date.label('last_work_date'),
+                    avg_efficiency.label('avg_efficiency')
+                )
+                .outerjoin(WorkLog, WorkLog.project_id == Project.id)
+                .group_by(Project.id)
+                .order_by(Project.id)
+            )
+            if db_manager.archive_attached:
+                stmt = stmt.outerjoin(archived_work_log_rollups, rollups.project_id == Project.id)
+            return stmt
+
+        return self._stream(build, chunk_size)
+
+    @staticmethod
+    def _stream(build: Callable[[Connection], object], chunk_size: int) -> Iterator[pd.DataFrame]:
+        """
+        yield_per 로 chunk_size 행씩 가져와 DataFrame 으로 변환 (전체 결과를 메모리에 올리지 않음)
+        - build: 읽기 전용 연결 → 조회 구문 (보관소 포함 여부를 같은 연결에서 판단)
+        """
+        with db_manager.get_readonly_connection() as conn:
+            result = conn.execution_options(yield_per=chunk_size).execute(build(conn))
+            columns = list(result.keys())
+            for rows in result.partitions():
+                yield pd.DataFrame(rows, columns=columns)
@@ -0,0 +1,204 @@
+"""
+리포지토리 쿼리 플랜 점검
+- 각 조회 메서드를 대표 인자로 실행하면서 SQL 을 수집 → EXPLAIN QUERY PLAN
+- 의도한 인덱스를 쓰지 않거나 projects / work_logs 를 전체 스캔하면 실패로 보고
+- python -m cli audit-plans 로 실행 (실패가 있으면 종료 코드 1 → 배포 전 회귀 확인용)
+"""
+
+import re
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Generator, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ..database.connection import db_manager
+from .export_repository import ExportRepository
+from .project_repository import ProjectRepository
+from .work_log_repository import WorkLogRepository
+
+# UNIQUE(project_id, work_date) 자동 인덱스 - 프로젝트별 조회용
+WORK_LOG_PROJECT_INDEX = "sqlite_autoindex_work_logs_1"
+WORK_LOG_DATE_INDEX = "ix_work_logs_date_project"
+PROJECT_STATUS_INDEX = "ix_projects_status"
+# 보관소 work_logs 는 WITHOUT ROWID - (project_id, work_date) 기본키가 곧 테이블
+ARCHIVE_PROJECT_INDEX = "PRIMARY KEY"
+ARCHIVE_DATE_INDEX = "ix_archived_work_logs_date_project"
+
+AUDITED_TABLES = ("projects", "work_logs", "archived_work_logs")
+
+# "SCAN work_logs" / "SCAN work_logs_1" 처럼 USING 없는 SCAN = 테이블 전체 스캔
+_TABLE_SCAN = re.compile(r"^SCAN (\w+?)(?:_\d+)?$")
+
+
+@dataclass(frozen=True)
+class PlanCase:
+    """점검 대상 1건 - 실행할 호출과 기대 인덱스"""
+
+    name: str
+    call: Callable[[], Any]
+    expected_indexes: Tuple[str, ...]
+    allowed_scans: Tuple[str, ...] = ()     # 의도된 전체 스캔 (전체 목록 / 전체 내보내기)
+
+
+@dataclass
+class PlanAuditResult:
+    """점검 결과 1건"""
+
+    name: str
+    plans: List[List[str]] = field(default_factory=list)     # 수집한 SQL 별 플랜 (detail 줄 목록)
+    problems: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.problems
+
+
+def build_cases() -> List[PlanCase]:
+    """리포지토리 조회 메서드별 점검 케이스 (쓰기 메서드는 제외, 보관소가 있으면 UNION 케이스 추가)"""
+    project_repo = ProjectRepository()
+    work_log_repo = WorkLogRepository()
+    export_repo = ExportRepository()
+
+    today = date.today()
+    start = today - timedelta(days=90)
+    project_ids = [project_id for project_id, _, _ in project_repo.find_identities()][:5] or [1]
+
+    cases = [
+        # ProjectRepository
+        PlanCase("project.find_by_id", lambda: project_repo.find_by_id(project_ids[0]), ()),
+        PlanCase("project.find_by_notion_id", lambda: project_repo.find_by_notion_id("audit"),
+                 ("sqlite_autoindex_projects_1",)),
+        PlanCase("project.find_by_status", lambda: project_repo.find_by_status("진행 중"), (PROJECT_STATUS_INDEX,)),
+        PlanCase("project.find_records_by_status", lambda: project_repo.find_records_by_status("진행 중"),
+                 (PROJECT_STATUS_INDEX, WORK_LOG_PROJECT_INDEX)),
+        PlanCase("project.find_records_excluding_status", lambda: project_repo.find_records_excluding_status("완료"),
+                 (WORK_LOG_PROJECT_INDEX,), allowed_scans=("projects",)),
+        PlanCase("project.find_all", project_repo.find_all, (), allowed_scans=("projects",)),
+        PlanCase("project.find_identities", project_repo.find_identities, (), allowed_scans=("projects",)),
+        PlanCase("project.count_by_status", project_repo.count_by_status, (PROJECT_STATUS_INDEX,)),
+
+        # WorkLogRepository - 날짜 기준
+        PlanCase("work_log.find_by_date", lambda: work_log_repo.find_by_date(today), (WORK_LOG_DATE_INDEX,)),
+        PlanCase("work_log.find_records_by_date", lambda: work_log_repo.find_records_by_date(today),
+                 (WORK_LOG_DATE_INDEX,)),
+        PlanCase("work_log.find_frame_by_date_range", lambda: work_log_repo.find_frame_by_date_range(start, today),
+                 (WORK_LOG_DATE_INDEX,)),
+        PlanCase("work_log.find_frame_page",
+                 lambda: work_log_repo.find_frame_page(start, today, 100, (today, project_ids[0])),
+                 (WORK_LOG_DATE_INDEX,)),
+        PlanCase("work_log.find_dense_frame_page",
+                 lambda: work_log_repo.find_dense_frame_page(start, today, 100, (today, project_ids[0])),
+                 (PROJECT_STATUS_INDEX, WORK_LOG_DATE_INDEX)),
+        PlanCase("work_log.aggregate_hours_by_period",
+                 lambda: work_log_repo.aggregate_hours_by_period(start, today, "week"), (WORK_LOG_DATE_INDEX,)),
+        PlanCase("work_log.aggregate_daily_hours", lambda: work_log_repo.aggregate_daily_hours(start, today),
+                 (WORK_LOG_DATE_INDEX,)),
+        PlanCase("work_log.get_range_summary", lambda: work_log_repo.get_range_summary(start, today),
+                 (WORK_LOG_DATE_INDEX,)),
+
+        # WorkLogRepository - 메모 검색 (FTS MATCH → rowid 로 로그 조회, LIKE 전체 스캔 없음)
+        PlanCase("work_log.search_memos",
+                 lambda: work_log_repo.search_memos('"memo"*', 20, 0, start, today, project_ids), ()),
+        PlanCase("work_log.count_memo_matches",
+                 lambda: work_log_repo.count_memo_matches('"memo"*', start, today), ()),
+
+        # WorkLogRepository - 프로젝트 기준
+        PlanCase("work_log.find_burnup_by_project", lambda: work_log_repo.find_burnup_by_project(project_ids[0]),
+                 (WORK_LOG_PROJECT_INDEX,)),
+        PlanCase("work_log.get_efficiency_stats_by_projects",
+                 lambda: work_log_repo.get_efficiency_stats_by_projects(project_ids), (WORK_LOG_PROJECT_INDEX,)),
+        PlanCase("work_log.get_rolling_stats_by_projects",
+                 lambda: work_log_repo.get_rolling_stats_by_projects(project_ids, today, (7, 14, 30)),
+                 (WORK_LOG_PROJECT_INDEX,)),
+        PlanCase("work_log.get_log_fingerprints", lambda: work_log_repo.get_log_fingerprints(project_ids),
+                 (WORK_LOG_PROJECT_INDEX,)),
+        PlanCase("work_log.find_history_by_projects", lambda: work_log_repo.find_history_by_projects(project_ids),
+                 (WORK_LOG_PROJECT_INDEX,)),
+
+        # ExportRepository - 기간 지정 내보내기는 인덱스, 프로젝트 통계는 전체 대상
+        PlanCase("export.stream_work_logs", lambda: list(export_repo.stream_work_logs(1000, start, today)),
+                 (WORK_LOG_DATE_INDEX,)),
+        PlanCase("export.stream_project_stats", lambda: list(export_repo.stream_project_stats(1000)),
+                 (WORK_LOG_PROJECT_INDEX,), allowed_scans=("projects",)),
+    ]
+
+    # 보관소 UNION - 전체 기간 조회는 양쪽 인덱스를 모두 써야 함
+    if db_manager.archive_attached:
+        cases += [
+            PlanCase("archive.find_frame_page",
+                     lambda: work_log_repo.find_frame_page(date.min, today, 100, (today, project_ids[0])),
+                     (WORK_LOG_DATE_INDEX, ARCHIVE_DATE_INDEX)),
+            PlanCase("archive.get_range_summary", lambda: work_log_repo.get_range_summary(date.min, today),
+                     (WORK_LOG_DATE_INDEX, ARCHIVE_DATE_INDEX)),
+            PlanCase("archive.search_memos",
+                     lambda: work_log_repo.search_memos('"memo"*', 20, 0, date.min, today),
+                     (ARCHIVE_PROJECT_INDEX,)),
+            PlanCase("archive.find_burnup_by_project",
+                     lambda: work_log_repo.find_burnup_by_project(project_ids[0]),
+                     (WORK_LOG_PROJECT_INDEX, ARCHIVE_PROJECT_INDEX)),
+            PlanCase("archive.find_history_by_projects",
+                     lambda: work_log_repo.find_history_by_projects(project_ids),
+                     (WORK_LOG_PROJECT_INDEX, ARCHIVE_PROJECT_INDEX)),
+        ]
+    return cases
+
+
+def run_plan_audit() -> List[PlanAuditResult]:
+    """모든 케이스 점검"""
+    results = []
+    for case in build_cases():
+        result = PlanAuditResult(case.name)
+        with _capture_statements() as statements:
+            case.call()
+
+        if not statements:
+            result.problems.append("실행된 쿼리 없음")
+
+        for statement, parameters in statements:
+            plan = _explain(statement, parameters)
+            result.plans.append(plan)
+            for line in plan:
+                match = _TABLE_SCAN.match(line)
+                if match and match.group(1) in AUDITED_TABLES and match.group(1) not in case.allowed_scans:
+                    result.problems.append(f"전체 스캔: {line}")
+
+        used = "\n".join(line for plan in result.plans for line in plan)
+        for index_name in case.expected_indexes:
+            # "USING [COVERING] INDEX 이름" / WITHOUT ROWID 테이블은 "USING PRIMARY KEY"
+            if f"INDEX {index_name}" not in used and f"USING {index_name}" not in used:
+                result.problems.append(f"인덱스 미사용: {index_name}")
+
+        results.append(result)
+    return results
+
+
+# ===== 내부 헬퍼 =====
+@contextmanager
+def _capture_statements() -> Generator[list, None, None]:
+    """블록 안에서 실행된 SELECT 수집 (모든 엔진 - 읽기 전용 연결 포함)"""
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((statement, parameters))
+
+    event.listen(Engine, "before_cursor_execute", _capture)
+    try:
+        yield captured
+    finally:
+        event.remove(Engine, "before_cursor_execute", _capture)
+
+
+def _explain(statement: str, parameters) -> List[str]:
+    """EXPLAIN QUERY PLAN → detail 줄 목록"""
+    conn = sqlite3.connect(f"file:{db_manager.db_path}?mode=ro", uri=True)
+    try:
+        db_manager.attach_archive(conn, readonly=True)
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ()).fetchall()
+    finally:
+        conn.close()
+    return [row[3] for row in rows]
@@ -1,9 +1,13 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func, select
 
 from ..database.connection import db_manager
+from ..entities.archived_work_log import archived_work_log_rollups
 from ..entities.project import Project
+from ..entities.work_log import WorkLog
+from ..dto.records import ProjectRecord, format_d_day
 
 class ProjectRepository:
     """프로젝트 데이터 액세스 객체 - 딕셔너리 반환"""
@@ -43,6 +47,86 @@ class ProjectRepository:
 
             return result
 
+    # ===== 조회 메서드들 (경량 레코드 반환) =====
+    def find_records_by_status(self, status: str) -> List[ProjectRecord]:
+        """상태별 프로젝트 조회 - ProjectRecord 리스트 반환"""
+        return self._find_records(Project.status == status)
+
+    def find_records_excluding_status(self, status: str) -> List[ProjectRecord]:
+        """특정 상태를 제외한 프로젝트 조회 - ProjectRecord 리스트 반환"""
+        return self._find_records(Project.status != status)
+
+    def find_identities(self) -> List[Tuple[int, Optional[str], str]]:
+        """모든 프로젝트 식별 정보 (id, notion_page_id, name) - 가져오기용 인메모리 인덱스 구성"""
+        stmt = select(Project.id, Project.notion_page_id, Project.name).order_by(Project.id)
+        with db_manager.get_session_context() as session:
+            return [tuple(row) for row in session.execute(stmt).all()]
+
+    def count_by_status(self) -> Dict[str, int]:
+        """상태별 프로젝트 수"""
+        stmt = select(Project.status, func.count(Project.id)).group_by(Project.status)
+        with db_manager.get_session_context() as session:
+            return {status: count for status, count in session.execute(stmt).all()}
+
+    def _find_records(self, condition) -> List[ProjectRecord]:
+        """
+        프로젝트 목록 경량 조회
+        - 엔티티 / work_logs 지연 로딩 없이 Core select 1회
+        - 현재 진행도는 프로젝트별 작업로그 합계 서브쿼리로 집계 (+ 보관 로그 집계값, 보관 로그는 읽지 않음)
+        - 파생 필드(D-Day 등)는 배치당 한 번 구한 오늘 날짜 기준으로 계산
+        """
+        logged_progress = (
+            select(func.coalesce(func.sum(WorkLog.progress_added), 0))
+            .where(WorkLog.project_id == Project.id)
+            .scalar_subquery()
+        )
+        current_progress = Project.initial_progress + logged_progress
+        if db_manager.archive_attached:
+            rollups = archived_work_log_rollups.c
+            archived_progress = (
+                select(rollups.progress_sum)
+                .where(rollups.project_id == Project.id)
+                .scalar_subquery()
+            )
+            current_progress = current_progress + func.coalesce(archived_progress, 0)
+
+        stmt = (
+            select(
+                Project.id,
+                Project.notion_page_id,
+                Project.name,
+                Project.status,
+                Project.start_date,
+                Project.end_date,
+                Project.target_value,
+                Project.initial_progress,
+                current_progress.label('current_progress')
+            )
+            .where(condition)
+        )
+
+        with db_manager.get_session_context() as session:
+            rows = session.execute(stmt).all()
+
+        today = date.today()
+        records = []
+        for row in rows:
+            days = (row.end_date - today).days
+            records.append(ProjectRecord(
+                id=row.id,
+                notion_page_id=row.notion_page_id,
+                name=row.name,
+                status=row.status,
+                start_date=row.start_date,
+                end_date=row.end_date,
+                target_value=row.target_value,
+                initial_progress=row.initial_progress,
+                current_progress=int(row.current_progress),
+                days_until_deadline=days,
+                d_day_display=format_d_day(days)
+            ))
+        return records
+
     def find_by_notion_id(self, notion_page_id: str) -> Optional[Dict[str, Any]]:
         """노션 페이지 ID로 프로젝트 조회 - Dict 반환"""
         with db_manager.get_session_context() as session:
@@ -1,11 +1,21 @@
-from typing import List, Optional, Dict, Any
-from datetime import date
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, Float
+from sqlalchemy import and_, case, delete, func, literal, literal_column, select, tuple_, union, union_all, Date, Float
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+import pandas as pd
 
 from ..database.connection import db_manager
+from ..database import archive
+from ..database.search_index import HIGHLIGHT_END, HIGHLIGHT_START, SNIPPET_ELLIPSIS, SNIPPET_TOKENS
 from ..entities.work_log import WorkLog
 from ..entities.project import Project
+from ..entities.archived_work_log import archived_work_logs
+from ..entities.work_log_search import ARCHIVED_WORK_LOG_FTS, WORK_LOG_FTS, archived_work_log_fts, work_log_fts
+from ..dto.records import WorkLogRecord
+
+# 편집 칸을 만드는 프로젝트 상태 (오늘 작업 화면과 같은 기준)
+ACTIVE_STATUS = "진행 중"
 
 
 class WorkLogRepository:
@@ -16,30 +26,384 @@ class WorkLogRepository:
 
     # ===== 조회 메서드들 (Dict 반환) =====
     def find_by_date(self, work_date: date) -> List[Dict[str, Any]]:
-        """특정 날짜의 작업 로그 조회 (JOIN 없음)"""
+        """특정 날짜의 작업 로그 조회 (JOIN 없음, 메인 테이블만 - 보관 로그 제외)"""
         with db_manager.get_session_context() as session:
             work_logs = session.query(WorkLog).filter(
                 WorkLog.work_date == work_date
             ).all()
             return [log.to_dict() for log in work_logs]
 
-    def find_by_date_range(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
-        """기간별 작업 로그 + 프로젝트 정보 JOIN 조회"""
+    def find_records_by_date(self, work_date: date) -> List[WorkLogRecord]:
+        """특정 날짜의 작업 로그 조회 - WorkLogRecord 리스트 반환 (엔티티 생성 없음)"""
+        def on_date(table):
+            return [table.c.work_date == work_date]
+
+        with db_manager.get_session_context() as session:
+            logs = archive.work_logs_source(session, on_date, start_date=work_date)
+            stmt = select(
+                logs.c.id,
+                logs.c.project_id,
+                logs.c.work_date,
+                logs.c.progress_added,
+                logs.c.hours_spent,
+                logs.c.memo
+            ).where(*on_date(logs))
+            return [WorkLogRecord(*row) for row in session.execute(stmt)]
+
+    def find_frame_by_date_range(self, start_date: date, end_date: date) -> pd.DataFrame:
+        """
+        기간별 작업 로그 + 프로젝트명 JOIN 조회 - DataFrame 반환 (컬럼 단위)
+        - ORM 엔티티 / to_dict() 없이 쿼리 결과를 바로 DataFrame으로 적재
+        - 정렬: 최신 날짜 → 프로젝트 ID
+
+        Returns:
+            DataFrame[project_id, work_date, project_name, progress_added, hours_spent, memo]
+        """
+        def in_range(table):
+            return [table.c.work_date.between(start_date, end_date)]
+
+        with db_manager.get_session_context() as session:
+            logs = archive.work_logs_source(session, in_range, start_date=start_date)
+            stmt = (
+                select(
+                    logs.c.project_id,
+                    logs.c.work_date,
+                    Project.name.label('project_name'),
+                    logs.c.progress_added,
+                    logs.c.hours_spent,
+                    logs.c.memo
+                )
+                .join(Project, logs.c.project_id == Project.id)
+                .where(*in_range(logs))
+                .order_by(logs.c.work_date.desc(), logs.c.project_id)
+            )
+            result = session.execute(stmt)
+            return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    def find_frame_page(self, start_date: date, end_date: date, limit: int,
+                        after: Optional[Tuple[date, int]] = None) -> pd.DataFrame:
+        """
+        기간별 작업 로그 키셋 페이지 조회 - DataFrame 반환
+        - 정렬: (work_date, project_id) 내림차순 → ix_work_logs_date_project 역순 스캔, OFFSET 없음
+        - after: 이전 페이지 마지막 행의 (work_date, project_id), 그보다 작은 키부터 조회
+
+        Returns:
+            DataFrame[project_id, work_date, project_name, progress_added, hours_spent, memo]
+        """
+        def in_page(table):
+            conditions = [table.c.work_date.between(start_date, end_date)]
+            if after is not None:
+                conditions.append(tuple_(table.c.work_date, table.c.project_id) < tuple_(*after))
+            return conditions
+
+        with db_manager.get_session_context() as session:
+            logs = archive.work_logs_source(session, in_page, start_date=start_date)
+            stmt = (
+                select(
+                    logs.c.project_id,
+                    logs.c.work_date,
+                    Project.name.label('project_name'),
+                    logs.c.progress_added,
+                    logs.c.hours_spent,
+                    logs.c.memo
+                )
+                .join(Project, logs.c.project_id == Project.id)
+                .where(*in_page(logs))
+                .order_by(logs.c.work_date.desc(), logs.c.project_id.desc())
+                .limit(limit)
+            )
+            result = session.execute(stmt)
+            return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    # ===== 조회 메서드들 (sparse 모드 - 저장 안 된 빈 날 포함) =====
+    def find_dense_frame_page(self, start_date: date, end_date: date, limit: int,
+                              after: Optional[Tuple[date, int]] = None) -> pd.DataFrame:
+        """
+        기간별 편집 칸 키셋 페이지 조회 - 저장하지 않은 빈 날은 진행량 0 / 작업시간 0 / 빈 메모 행으로 채움
+        - 칸 = 진행 중 프로젝트 × 시작일 이후 모든 날짜 (재귀 CTE) ∪ 실제 로그가 있는 (날짜, 프로젝트)
+        - 정렬 / after 는 find_frame_page 와 동일
+
+        Returns:
+            DataFrame[project_id, work_date, project_name, progress_added, hours_spent, memo]
+        """
+        with db_manager.get_session_context() as session:
+            slots, logs = self._slot_keys(session, start_date, end_date)
+            stmt = (
+                select(
+                    slots.c.project_id,
+                    slots.c.work_date,
+                    Project.name.label('project_name'),
+                    func.coalesce(logs.c.progress_added, 0).label('progress_added'),
+                    func.coalesce(logs.c.hours_spent, 0.0).label('hours_spent'),
+                    func.coalesce(logs.c.memo, "").label('memo')
+                )
+                .select_from(slots)
+                .join(Project, slots.c.project_id == Project.id)
+                .outerjoin(logs, and_(logs.c.project_id == slots.c.project_id, logs.c.work_date == slots.c.work_date))
+            )
+            if after is not None:
+                stmt = stmt.where(tuple_(slots.c.work_date, slots.c.project_id) < tuple_(*after))
+            stmt = stmt.order_by(slots.c.work_date.desc(), slots.c.project_id.desc()).limit(limit)
+
+            result = session.execute(stmt)
+            return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    def count_dense_slots(self, start_date: date, end_date: date) -> int:
+        """기간 내 편집 칸 수 (find_dense_frame_page 전체 행 수 - 페이지 수 계산용)"""
+        with db_manager.get_session_context() as session:
+            slots, _ = self._slot_keys(session, start_date, end_date)
+            return int(session.execute(select(func.count()).select_from(slots)).scalar())
+
+    def _slot_keys(self, session: Session, start_date: date, end_date: date):
+        """
+        편집 칸 (work_date, project_id) 서브쿼리 + 기간 로그 FROM 절
+
+        Returns:
+            (slots 서브쿼리, 로그 FROM 절 - 보관소에 닿으면 UNION)
+        """
+        def in_range(table):
+            return [table.c.work_date.between(start_date, end_date)]
+
+        logs = archive.work_logs_source(session, in_range, start_date=start_date)
+
+        # 1: 종료일부터 하루씩 거슬러 올라가는 날짜 목록 (날짜 테이블 없이 재귀 CTE)
+        days = select(literal(end_date, Date).label('work_date')).cte('days', recursive=True)
+        days = days.union_all(
+            select(func.date(days.c.work_date, '-1 day', type_=Date)).where(days.c.work_date > start_date)
+        )
+
+        # 2: 진행 중 프로젝트 × 시작일 이후 날짜 ∪ 실제 로그 키 (UNION 으로 중복 제거)
+        grid = (
+            select(days.c.work_date, Project.id.label('project_id'))
+            .select_from(days)
+            .join(Project, and_(Project.status == ACTIVE_STATUS, Project.start_date <= days.c.work_date))
+        )
+        logged = select(logs.c.work_date, logs.c.project_id).where(*in_range(logs))
+        return union(grid, logged).subquery('slots'), logs
+
+    # ===== 조회 메서드들 (메모 전문 검색) =====
+    def search_memos(self, match: str, limit: int, offset: int = 0,
+                     start_date: Optional[date] = None, end_date: Optional[date] = None,
+                     project_ids: Optional[List[int]] = None) -> pd.DataFrame:
+        """
+        메모 전문 검색 한 페이지 - bm25 순위순 (같은 순위는 최신순)
+        - 메인 / 보관소 FTS 인덱스를 각각 MATCH 한 뒤 UNION ALL (보관소는 범위에 닿을 때만)
+        - 두 인덱스의 bm25 는 문서 수 / 평균 길이가 달라 직접 비교할 수 없으므로 각자 0~1 로 정규화 후 병합
+          (인덱스 안 최고 점수 = 0, 최저 = 1 - 인덱스 간 상대 순위는 근사값)
+
+        Args:
+            match: FTS5 MATCH 식 (search_index.to_match_query 결과)
+            start_date, end_date, project_ids: None 이면 조건 없음
+
+        Returns:
+            DataFrame[project_id, work_date, project_name, progress_added, hours_spent, memo, snippet, rank]
+            - snippet: 일치 부분을 HIGHLIGHT_START / HIGHLIGHT_END 로 감싼 메모 발췌
+        """
+        with db_manager.get_session_context() as session:
+            matches = self._memo_matches(session, match, start_date, end_date, project_ids)
+            stmt = (
+                select(
+                    matches.c.project_id,
+                    matches.c.work_date,
+                    Project.name.label('project_name'),
+                    matches.c.progress_added,
+                    matches.c.hours_spent,
+                    matches.c.memo,
+                    matches.c.snippet,
+                    matches.c.rank
+                )
+                .join(Project, matches.c.project_id == Project.id)
+                .order_by(matches.c.rank, matches.c.work_date.desc(), matches.c.project_id.desc())
+                .limit(limit)
+                .offset(offset)
+            )
+            result = session.execute(stmt)
+            return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    def count_memo_matches(self, match: str, start_date: Optional[date] = None, end_date: Optional[date] = None,
+                           project_ids: Optional[List[int]] = None) -> int:
+        """메모 검색 결과 전체 수 (search_memos 와 같은 조건 - 페이지 수 계산용)"""
+        with db_manager.get_session_context() as session:
+            matches = self._memo_matches(session, match, start_date, end_date, project_ids)
+            return int(session.execute(select(func.count()).select_from(matches)).scalar())
+
+    def _memo_matches(self, session: Session, match: str, start_date: Optional[date], end_date: Optional[date],
+                      project_ids: Optional[List[int]]):
+        """검색 조건에 맞는 로그 + 발췌 + 순위 서브쿼리"""
+        def in_scope(table):
+            conditions = []
+            if start_date is not None:
+                conditions.append(table.c.work_date >= start_date)
+            if end_date is not None:
+                conditions.append(table.c.work_date <= end_date)
+            if project_ids is not None:
+                conditions.append(table.c.project_id.in_(project_ids))
+            return conditions
+
+        # 1: 메인 - 외부 콘텐츠 인덱스 rowid = work_logs.id
+        logs = WorkLog.__table__
+        arms = [self._memo_match_arm(work_log_fts, WORK_LOG_FTS, logs,
+                                     logs.c.id == work_log_fts.c.rowid, match, in_scope)]
+
+        # 2: 보관소 - 인덱스에 함께 저장한 (project_id, work_date) 로 기본키 조회
+        if archive.archive_reaches(session, start_date, project_ids):
+            on_key = and_(archived_work_logs.c.project_id == archived_work_log_fts.c.project_id,
+                          archived_work_logs.c.work_date == archived_work_log_fts.c.work_date)
+            arms.append(self._memo_match_arm(archived_work_log_fts, ARCHIVED_WORK_LOG_FTS, archived_work_logs,
+                                             on_key, match, in_scope))
+
+        if len(arms) == 1:
+            return arms[0].subquery('memo_matches')
+        return union_all(*(self._normalize_rank(arm) for arm in arms)).subquery('memo_matches')
+
+    @staticmethod
+    def _normalize_rank(arm):
+        """한 인덱스의 bm25 를 그 결과 안의 최소 / 최대로 0~1 정규화 (모두 같으면 0 → 최신순)"""
+        arm = arm.subquery()
+        best = func.min(arm.c.rank).over()
+        spread = func.max(arm.c.rank).over() - best
+        rank = func.coalesce((arm.c.rank - best) / func.nullif(spread, 0), 0.0)
+        return select(*(column for column in arm.c if column.name != 'rank'), rank.label('rank'))
+
+    @staticmethod
+    def _memo_match_arm(fts, fts_name: str, logs, on_clause, match: str, filters):
+        """FTS 테이블 하나에 대한 MATCH + 로그 조인 SELECT (bm25 / snippet 은 테이블 이름을 인자로 받음)"""
+        fts_table = literal_column(fts_name)
+        return (
+            select(
+                logs.c.project_id,
+                logs.c.work_date,
+                logs.c.progress_added,
+                logs.c.hours_spent,
+                logs.c.memo,
+                func.snippet(fts_table, 0, HIGHLIGHT_START, HIGHLIGHT_END, SNIPPET_ELLIPSIS,
+                             SNIPPET_TOKENS).label('snippet'),
+                func.bm25(fts_table).label('rank')
+            )
+            .select_from(fts)
+            .join(logs, on_clause)
+            .where(fts_table.op('MATCH')(match), *filters(logs))
+        )
+
+    def aggregate_hours_by_period(self, start_date: date, end_date: date, granularity: str) -> pd.DataFrame:
+        """
+        기간별 작업시간을 일/주/월 구간 × 프로젝트로 SQL에서 집계
+        - day: work_date / week: 해당 주 월요일 / month: 해당 월 1일
+        - 작업시간 0 인 로그는 제외 (차트에 의미 없는 점 제거)
+
+        Returns:
+            DataFrame[bucket (YYYY-MM-DD 문자열), project_name, hours] - 구간순
+        """
+        if granularity not in ('day', 'week', 'month'):
+            raise ValueError(f"지원하지 않는 집계 단위: {granularity}")
+
+        def in_range(table):
+            return [table.c.work_date.between(start_date, end_date), table.c.hours_spent > 0]
+
+        with db_manager.get_session_context() as session:
+            logs = archive.work_logs_source(session, in_range, start_date=start_date)
+            if granularity == 'day':
+                bucket = func.date(logs.c.work_date)
+            elif granularity == 'week':
+                bucket = func.date(logs.c.work_date, 'weekday 0', '-6 days')
+            else:
+                bucket = func.date(logs.c.work_date, 'start of month')
+
+            bucket = bucket.label('bucket')
+            stmt = (
+                select(
+                    bucket,
+                    Project.name.label('project_name'),
+                    func.sum(logs.c.hours_spent).label('hours')
+                )
+                .join(Project, logs.c.project_id == Project.id)
+                .where(*in_range(logs))
+                .group_by(bucket, logs.c.project_id)
+                .order_by(bucket, logs.c.project_id)
+            )
+            result = session.execute(stmt)
+            return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    def aggregate_daily_hours(self, start_date: date, end_date: date) -> pd.DataFrame:
+        """
+        기간 내 일별 × 프로젝트 작업시간 집계 (GROUP BY 1회, 작업시간 0 제외)
+
+        Returns:
+            DataFrame[work_date, project_id, hours] - 날짜순
+        """
+        def in_range(table):
+            return [table.c.work_date.between(start_date, end_date), table.c.hours_spent > 0]
+
+        with db_manager.get_session_context() as session:
+            logs = archive.work_logs_source(session, in_range, start_date=start_date)
+            stmt = (
+                select(
+                    logs.c.work_date,
+                    logs.c.project_id,
+                    func.sum(logs.c.hours_spent).label('hours')
+                )
+                .where(*in_range(logs))
+                .group_by(logs.c.work_date, logs.c.project_id)
+                .order_by(logs.c.work_date)
+            )
+            result = session.execute(stmt)
+            return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    def find_burnup_by_project(self, project_id: int) -> pd.DataFrame:
+        """
+        프로젝트 번업/번다운 이력 - 윈도우 함수로 누적값 계산 (쿼리 1회)
+        - project_id = ? 조건 + work_date 정렬 → (project_id, work_date) 인덱스 순서 그대로 스캔
+        - 누적 진행도 = 초기 진행도 + 날짜순 progress_added 누적합
+
+        Returns:
+            DataFrame[work_date, progress_added, hours_spent, cumulative_progress,
+                      cumulative_hours, remaining_work, target_value] - 날짜순
+        """
+        def of_project(table):
+            return [table.c.project_id == project_id]
+
         with db_manager.get_session_context() as session:
-            # 1: WorkLog + Project JOIN 쿼리
-            query_result = session.query(WorkLog, Project)\
-                .join(Project, WorkLog.project_id == Project.id)\
-                .filter(WorkLog.work_date.between(start_date, end_date))\
-                .all()
+            logs = archive.work_logs_source(session, of_project, project_ids=[project_id])
+            running = dict(order_by=logs.c.work_date, rows=(None, 0))
+            cumulative_progress = Project.initial_progress + func.sum(logs.c.progress_added).over(**running)
 
-            # 2: Entity의 to_dict() 활용 + JOIN 데이터 추가
-            result = []
-            for work_log, project in query_result:
-                log_dict = work_log.to_dict()
-                log_dict['project_name'] = project.name  # JOIN으로 가져온 프로젝트명 추가
-                result.append(log_dict)
+            stmt = (
+                select(
+                    logs.c.work_date,
+                    logs.c.progress_added,
+                    logs.c.hours_spent,
+                    cumulative_progress.label('cumulative_progress'),
+                    func.sum(logs.c.hours_spent).over(**running).label('cumulative_hours'),
+                    (Project.target_value - cumulative_progress).label('remaining_work'),
+                    Project.target_value
+                )
+                .join(Project, logs.c.project_id == Project.id)
+                .where(*of_project(logs))
+                .order_by(logs.c.work_date)
+            )
+            result = session.execute(stmt)
+            return pd.DataFrame(result.all(), columns=list(result.keys()))
 
-            return result
+    def get_range_summary(self, start_date: date, end_date: date) -> Dict[str, Any]:
+        """기간별 작업 로그 집계 (행 수, 작업일수, 총 작업시간, 프로젝트 수) - 쿼리 1회"""
+        def in_range(table):
+            return [table.c.work_date.between(start_date, end_date)]
+
+        with db_manager.get_session_context() as session:
+            logs = archive.work_logs_source(session, in_range, start_date=start_date)
+            stmt = select(
+                func.count().label('total_count'),
+                func.count(func.distinct(logs.c.work_date)).label('work_days'),
+                func.coalesce(func.sum(logs.c.hours_spent), 0.0).label('total_hours'),
+                func.count(func.distinct(logs.c.project_id)).label('project_count')
+            ).where(*in_range(logs))
+            row = session.execute(stmt).one()
+            return {
+                'total_count': row.total_count,
+                'work_days': row.work_days,
+                'total_hours': float(row.total_hours),
+                'project_count': row.project_count
+            }
 
     # ===== 생성 메서드들 (성공 여부 반환) =====
     def bulk_insert(self, work_logs: List[WorkLog]) -> int:
@@ -51,14 +415,59 @@ class WorkLogRepository:
             session.add_all(work_logs)
             return len(work_logs)
 
+    def bulk_upsert(self, rows: List[Dict]) -> int:
+        """
+        여러 작업 로그 일괄 upsert - 한 트랜잭션
+        - (project_id, work_date) 가 이미 있으면 진행량/작업시간/메모를 덮어씀
+        - 보관소에 같은 날짜가 있으면 보관 로그 삭제 (새 값이 메인에 들어가므로)
+        """
+        if not rows:
+            return 0
+
+        stmt = sqlite_insert(WorkLog)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WorkLog.project_id, WorkLog.work_date],
+            set_={
+                'progress_added': stmt.excluded.progress_added,
+                'hours_spent': stmt.excluded.hours_spent,
+                'memo': stmt.excluded.memo
+            }
+        )
+
+        with db_manager.get_session_context() as session:
+            session.execute(stmt, rows)
+
+        # 메인 커밋 후 별도 트랜잭션 (보관소를 먼저 지우고 멈추면 값이 사라지므로)
+        with db_manager.get_session_context() as session:
+            archive.remove_overwritten(session, [(row['project_id'], row['work_date']) for row in rows])
+        return len(rows)
+
+    # ===== 삭제 메서드들 =====
+    def delete_by_keys(self, keys: List[Tuple[int, date]]) -> int:
+        """(project_id, work_date) 목록의 작업 로그 삭제 - 보관 로그 포함 (sparse 모드에서 비운 날)"""
+        if not keys:
+            return 0
+
+        def by_keys(table):
+            return [tuple_(table.c.project_id, table.c.work_date).in_(keys)]
+
+        logs = WorkLog.__table__
+        with db_manager.get_session_context() as session:
+            deleted_count = session.execute(delete(logs).where(*by_keys(logs))).rowcount
+
+        with db_manager.get_session_context() as session:
+            deleted_count += archive.remove_archived(session, by_keys)
+        return deleted_count
+
     # ===== 수정 메서드들 (성공 여부 반환) =====
     def bulk_update(self, updates: List[Dict]) -> int:
-        """여러 WorkLog 일괄 업데이트"""
+        """여러 WorkLog 일괄 업데이트 (메인에 없는 날짜는 보관 로그 수정)"""
         if not updates:
             return 0
 
         with db_manager.get_session_context() as session:
             updated_count = 0
+            archived_updates = []
 
             for update_data in updates:
                 result = session.query(WorkLog).filter(
@@ -72,16 +481,23 @@ class WorkLogRepository:
                     'memo': update_data['memo']
                 })
                 updated_count += result
+                if not result:
+                    archived_updates.append(update_data)
 
+            updated_count += archive.update_archived_logs(session, archived_updates)
             return updated_count
 
 
     # ===== 효율성 통계 메서드들 (dashboard 용) =====
     def get_efficiency_stats_by_projects(self, project_ids: List[int]) -> Dict[int, Dict]:
         """
+        전체 기간 효율성 통계 - 메인 로그 집계 + 보관 로그 집계(rollup) 합산 (보관 로그는 읽지 않음)
+
         Returns:
             Dict[project_id, {
                 'avg_efficiency': float,                    # 평균 효율성 (진행량/시간)
+                'efficiency_std': float,                    # 로그별 효율성 표준편차 (표본)
+                'efficiency_count': int,                    # 효율성 계산에 사용된 로그 수 (작업시간 > 0)
                 'worked_hours': float,                       # 총 작업시간
                 'avg_hours_per_day': float                  # 현실적 일평균 작업시간 (작업 못한 날 포함)
             }]
@@ -89,28 +505,43 @@ class WorkLogRepository:
         if not project_ids:
             return {}
 
+        # 로그별 효율성 (작업시간 0인 로그는 NULL → 집계에서 제외)
+        efficiency = func.cast(WorkLog.progress_added, Float) / func.nullif(WorkLog.hours_spent, 0)
+
         with db_manager.get_session_context() as session:
             result = session.query(
                 WorkLog.project_id,
-                func.avg(
-                    func.cast(WorkLog.progress_added, Float) /
-                    func.nullif(WorkLog.hours_spent, 0)
-                ).label('avg_efficiency'),
+                func.coalesce(func.sum(efficiency), 0.0).label('efficiency_sum'),
+                func.coalesce(func.sum(efficiency * efficiency), 0.0).label('efficiency_sq_sum'),
+                func.count(efficiency).label('efficiency_count'),
                 func.sum(WorkLog.hours_spent).label('worked_hours'),
                 func.min(WorkLog.work_date).label('first_work_date'),
                 func.max(WorkLog.work_date).label('last_work_date')
             ).filter(
                 WorkLog.project_id.in_(project_ids)
             ).group_by(WorkLog.project_id).all()
+            rollups = archive.get_rollups(session, project_ids)
+
+            # 메인 집계 + 보관 집계 병합 (보관 로그만 있는 프로젝트 포함)
+            totals = {
+                project_id: [rollup.efficiency_sum, rollup.efficiency_sq_sum, rollup.efficiency_count,
+                             rollup.hours_sum, rollup.first_work_date, rollup.last_work_date]
+                for project_id, rollup in rollups.items()
+            }
+            for row in result:
+                main = [row.efficiency_sum, row.efficiency_sq_sum, row.efficiency_count or 0,
+                        row.worked_hours or 0, row.first_work_date, row.last_work_date]
+                archived = totals.get(row.project_id)
+                totals[row.project_id] = main if archived is None else [
+                    main[0] + archived[0], main[1] + archived[1], main[2] + archived[2], main[3] + archived[3],
+                    min(archived[4], main[4]), max(archived[5], main[5])
+                ]
 
             # 결과를 딕셔너리로 변환
             stats_dict = {}
-            for row in result:
-                project_id = row.project_id
-                avg_efficiency = row.avg_efficiency or 0
-                worked_hours = row.worked_hours or 0
-                first_work_date = row.first_work_date
-                last_work_date = row.last_work_date
+            for project_id, (efficiency_sum, efficiency_sq_sum, efficiency_count,
+                             worked_hours, first_work_date, last_work_date) in totals.items():
+                avg_efficiency = efficiency_sum / efficiency_count if efficiency_count else 0
 
                 # 현실적 일 평균 작업시간 계산 (전체 기간 기준)
                 if first_work_date and last_work_date:
@@ -119,10 +550,164 @@ class WorkLogRepository:
                 else:
                     avg_hours_per_day = 0
 
+                # 효율성 표본 표준편차 (E[x²] - E[x]², 표본 보정)
+                if efficiency_count > 1:
+                    avg_efficiency_sq = efficiency_sq_sum / efficiency_count
+                    variance = (avg_efficiency_sq - avg_efficiency ** 2) * efficiency_count / (efficiency_count - 1)
+                    efficiency_std = max(variance, 0.0) ** 0.5
+                else:
+                    efficiency_std = 0.0
+
                 stats_dict[project_id] = {
                     'avg_efficiency': float(avg_efficiency),
+                    'efficiency_std': float(efficiency_std),
+                    'efficiency_count': int(efficiency_count),
                     'worked_hours': float(worked_hours),
                     'avg_hours_per_day': float(avg_hours_per_day)
                 }
 
-            return stats_dict
\ No newline at end of file
+            return stats_dict
+
+    def get_rolling_stats_by_projects(self, project_ids: List[int], today: date,
+                                      windows: Tuple[int, ...]) -> Dict[int, Dict[int, Dict]]:
+        """
+        최근 N일 구간별 속도/효율성 통계 - 모든 프로젝트 × 모든 구간을 쿼리 1회로 집계
+        - 가장 긴 구간의 시작일 이후 로그만 읽음 (work_date 인덱스 범위 스캔 → 전체 이력 길이와 무관)
+        - 구간별 값은 CASE 조건부 집계로 한 번에 계산
+        - 일평균은 구간 중 프로젝트가 있던 일수로 나눔 (구간보다 짧은 프로젝트의 속도를 낮춰 잡지 않도록)
+          시작일 = min(프로젝트 시작일, 첫 작업일)
+
+        Returns:
+            Dict[project_id, Dict[window, {
+                'velocity': float,              # 일평균 진행량 (작업 안 한 날 포함)
+                'avg_hours_per_day': float,     # 일평균 작업시간 (작업 안 한 날 포함)
+                'avg_efficiency': float,        # 로그별 효율성 평균 (진행량/시간)
+                'efficiency_std': float,        # 로그별 효율성 표준편차 (표본)
+                'efficiency_count': int         # 효율성 표본 수 (작업시간 > 0 로그)
+            }]]
+        """
+        if not project_ids or not windows:
+            return {}
+
+        window_starts = {window: today - timedelta(days=window - 1) for window in windows}
+        first_start = min(window_starts.values())
+
+        def in_windows(table):
+            return [table.c.project_id.in_(project_ids), table.c.work_date.between(first_start, today)]
+
+        with db_manager.get_session_context() as session:
+            logs = archive.work_logs_source(session, in_windows, start_date=first_start, project_ids=project_ids)
+
+            # 로그별 효율성 (작업시간 0인 로그는 NULL → 집계에서 제외)
+            efficiency = func.cast(logs.c.progress_added, Float) / func.nullif(logs.c.hours_spent, 0)
+
+            columns = [logs.c.project_id, func.min(logs.c.work_date).label('first_work_date')]
+            for window, start in window_starts.items():
+                in_window = logs.c.work_date >= start
+                columns += [
+                    func.sum(case((in_window, logs.c.progress_added), else_=0)).label(f'progress_{window}'),
+                    func.sum(case((in_window, logs.c.hours_spent), else_=0.0)).label(f'hours_{window}'),
+                    func.avg(case((in_window, efficiency))).label(f'eff_{window}'),
+                    func.avg(case((in_window, efficiency * efficiency))).label(f'eff_sq_{window}'),
+                    func.count(case((in_window, efficiency))).label(f'eff_count_{window}')
+                ]
+
+            stmt = select(*columns).where(*in_windows(logs)).group_by(logs.c.project_id)
+            rows = session.execute(stmt).mappings().all()
+            start_dates = dict(session.execute(
+                select(Project.id, Project.start_date).where(Project.id.in_([row['project_id'] for row in rows]))
+            ).all())
+
+        stats_dict = {}
+        for row in rows:
+            project_start = min(filter(None, (start_dates.get(row['project_id']), row['first_work_date'])))
+            project_stats = {}
+            for window in windows:
+                covered_days = (today - max(window_starts[window], project_start)).days + 1
+                avg_efficiency = row[f'eff_{window}'] or 0.0
+                efficiency_count = row[f'eff_count_{window}'] or 0
+
+                # 효율성 표본 표준편차 (E[x²] - E[x]², 표본 보정)
+                if efficiency_count > 1:
+                    variance = (row[f'eff_sq_{window}'] - avg_efficiency ** 2) * efficiency_count / (efficiency_count - 1)
+                    efficiency_std = max(variance, 0.0) ** 0.5
+                else:
+                    efficiency_std = 0.0
+
+                project_stats[window] = {
+                    'velocity': float(row[f'progress_{window}'] or 0) / covered_days,
+                    'avg_hours_per_day': float(row[f'hours_{window}'] or 0.0) / covered_days,
+                    'avg_efficiency': float(avg_efficiency),
+                    'efficiency_std': float(efficiency_std),
+                    'efficiency_count': int(efficiency_count)
+                }
+            stats_dict[row['project_id']] = project_stats
+
+        return stats_dict
+
+    # ===== 시뮬레이션용 메서드들 (dashboard 용) =====
+    def get_log_fingerprints(self, project_ids: List[int]) -> Dict[int, tuple]:
+        """
+        프로젝트별 작업 로그 지문 (로그 변경 감지용 가벼운 집계, 보관 로그는 집계 테이블로 합산)
+
+        Returns:
+            Dict[project_id, (로그 수, 진행량 합, 작업시간 합, 진행량×작업시간 합, 첫 작업일, 마지막 작업일)]
+        """
+        if not project_ids:
+            return {}
+
+        with db_manager.get_session_context() as session:
+            rows = session.query(
+                WorkLog.project_id,
+                func.count(WorkLog.id),
+                func.sum(WorkLog.progress_added),
+                func.sum(WorkLog.hours_spent),
+                func.sum(WorkLog.progress_added * WorkLog.hours_spent),
+                func.min(WorkLog.work_date),
+                func.max(WorkLog.work_date)
+            ).filter(
+                WorkLog.project_id.in_(project_ids)
+            ).group_by(WorkLog.project_id).all()
+            rollups = archive.get_rollups(session, project_ids)
+
+        fingerprints = {
+            project_id: (rollup.log_count, rollup.progress_sum, rollup.hours_sum, rollup.progress_hours_sum,
+                         rollup.first_work_date, rollup.last_work_date)
+            for project_id, rollup in rollups.items()
+        }
+        for row in rows:
+            main = tuple(row[1:])
+            archived = fingerprints.get(row[0])
+            fingerprints[row[0]] = main if archived is None else (
+                main[0] + archived[0], main[1] + archived[1], main[2] + archived[2], main[3] + archived[3],
+                min(archived[4], main[4]), max(archived[5], main[5])
+            )
+        return fingerprints
+
+    def find_history_by_projects(self, project_ids: List[int]) -> List[tuple]:
+        """
+        여러 프로젝트의 작업 로그 이력 조회 (시뮬레이션 표본용, 필요한 컬럼만)
+
+        Returns:
+            List[(project_id, work_date, progress_added, hours_spent)] - 프로젝트/날짜순
+        """
+        if not project_ids:
+            return []
+
+        def of_projects(table):
+            return [table.c.project_id.in_(project_ids)]
+
+        with db_manager.get_session_context() as session:
+            logs = archive.work_logs_source(session, of_projects, project_ids=project_ids)
+            rows = session.execute(
+                select(
+                    logs.c.project_id,
+                    logs.c.work_date,
+                    logs.c.progress_added,
+                    logs.c.hours_spent
+                )
+                .where(*of_projects(logs))
+                .order_by(logs.c.project_id, logs.c.work_date)
+            ).all()
+
+            return [tuple(row) for row in rows]
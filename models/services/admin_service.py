@@ -0,0 +1,127 @@
+"""
+AdminService - 운영 작업 (통계 조회, 인덱스/통계 재구성, VACUUM, 작업 로그 보관 / 빈 로그 정리)
+CLI 등 Streamlit 밖에서 호출하는 관리용 서비스
+"""
+
+from typing import Any, Dict, Optional
+from datetime import date, timedelta
+import logging
+import time
+
+import config
+from ..database import archive, compaction
+from ..database.connection import db_manager
+from ..repositories.project_repository import ProjectRepository
+from ..repositories.work_log_repository import WorkLogRepository
+
+
+class AdminService:
+    """관리 서비스"""
+
+    def __init__(self):
+        self.project_repo = ProjectRepository()
+        self.work_log_repo = WorkLogRepository()
+        self.logger = logging.getLogger(__name__)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        데이터 / 저장소 현황
+
+        Returns:
+            {'projects': {상태: 개수}, 'work_logs': get_range_summary 결과 (보관 로그 포함),
+             'storage': get_storage_stats 결과, 'archive': 보관소 현황}
+        """
+        try:
+            return {
+                'projects': self.project_repo.count_by_status(),
+                'work_logs': self.work_log_repo.get_range_summary(date.min, date.max),
+                'storage': db_manager.get_storage_stats(),
+                'archive': archive.get_summary()
+            }
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ 통계 조회 실패: {str(e)}")
+
+    def rebuild(self) -> float:
+        """
+        파생 구조 재구성 - 누락 인덱스/트리거 생성 → 메모 검색 인덱스 재구성 → REINDEX → ANALYZE
+        (집계값은 모두 조회 시점에 계산하므로 인덱스와 플래너 통계가 재구성 대상)
+
+        Returns:
+            소요 시간 (초)
+        """
+        try:
+            started = time.perf_counter()
+            db_manager.create_tables()
+            db_manager.rebuild_search_index()
+            db_manager.reindex()
+            db_manager.analyze()
+
+            elapsed = time.perf_counter() - started
+            self.logger.info(f"⚙️✅ 인덱스/통계 재구성 완료 ({elapsed:.2f}s)")
+            return elapsed
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ 인덱스/통계 재구성 실패: {str(e)}")
+
+    def vacuum(self, analyze: bool = True) -> Dict[str, int]:
+        """
+        VACUUM (+ ANALYZE) - 빈 페이지 회수
+
+        Returns:
+            {'before_bytes', 'after_bytes'}
+        """
+        try:
+            before = db_manager.get_storage_stats()['db_bytes']
+            db_manager.vacuum()
+            if analyze:
+                db_manager.analyze()
+            after = db_manager.get_storage_stats()['db_bytes']
+
+            self.logger.info(f"⚙️✅ VACUUM 완료: {before:,} → {after:,} bytes")
+            return {'before_bytes': before, 'after_bytes': after}
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ VACUUM 실패: {str(e)}")
+
+    def archive(self, after_months: Optional[int] = None, include_completed: Optional[bool] = None,
+                dry_run: bool = False) -> archive.ArchiveResult:
+        """
+        보관 정책대로 오래된 / 완료 프로젝트 작업 로그를 보관소로 이동
+
+        Args:
+            after_months, include_completed: None 이면 config 의 보관 정책 사용
+            dry_run: True 면 옮길 로그 수만 계산
+        """
+        try:
+            result = archive.run_archive(after_months, include_completed, dry_run=dry_run)
+            if not dry_run:
+                self.logger.info(f"⚙️✅ 작업 로그 보관 완료: {result.moved_count:,}건")
+            return result
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ 작업 로그 보관 실패: {str(e)}")
+
+    def compact(self, after_days: Optional[int] = None, dry_run: bool = False) -> compaction.CompactionResult:
+        """
+        지난 날짜의 빈 작업 로그(진행량 0, 작업시간 0, 메모 없음) 정리
+
+        Args:
+            after_days: 오늘로부터 이 일수보다 지난 로그만 대상 (None 이면 config.WORK_LOG_COMPACT_AFTER_DAYS)
+            dry_run: True 면 지울 로그 수만 계산
+        """
+        try:
+            if after_days is None:
+                after_days = getattr(config, "WORK_LOG_COMPACT_AFTER_DAYS", compaction.DEFAULT_AFTER_DAYS)
+            if after_days < 0:
+                raise ValueError("⚙️❌ 정리 기준 일수는 0 이상이어야 합니다")
+
+            result = compaction.compact_placeholders(date.today() - timedelta(days=after_days), dry_run=dry_run)
+            if not dry_run:
+                self.logger.info(f"⚙️✅ 빈 작업 로그 정리 완료: {result.removed_count + result.archived_removed_count:,}건")
+            return result
+
+        except ValueError as e:
+            raise e
+        except Exception as e:
+            raise Exception(f"⚙️❌ 빈 작업 로그 정리 실패: {str(e)}")
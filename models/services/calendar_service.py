@@ -0,0 +1,114 @@
+"""
+CalendarService - 작업 캘린더 히트맵
+일별 집계 1회 조회 → 데이터 버전 기준 캐시 → 프로젝트 필터/그리드 배치는 메모리에서 처리
+"""
+
+from typing import Dict, List, Optional, Tuple
+from datetime import date
+import logging
+import threading
+
+import numpy as np
+import pandas as pd
+
+from ..analytics.calendar import build_calendar_grid, longest_streak
+from ..database.connection import db_manager
+from ..dto.calendar_heatmap import CalendarHeatmap
+from ..dto.records import ProjectRecord
+from ..services.project_service import ProjectService
+from ..services.work_log_service import WorkLogService
+from utils import metrics
+
+# 캐시에 보관할 최대 기간 수 (기간 선택지 수만큼이면 충분)
+MAX_CACHED_RANGES = 8
+
+
+class CalendarService:
+    """캘린더 서비스 - 일별 작업시간 히트맵 데이터"""
+
+    # 일별 집계 캐시 (프로세스 공유): (data_version, start_date, end_date) → DataFrame[work_date, project_id, hours]
+    _daily_cache: Dict[Tuple[int, date, date], pd.DataFrame] = {}
+    _daily_lock = threading.Lock()
+
+    def __init__(self):
+        self.project_service = ProjectService()
+        self.work_log_service = WorkLogService()
+        self.logger = logging.getLogger(__name__)
+
+    def get_calendar_heatmap(self, start_date: date, end_date: date,
+                             project_ids: Optional[List[int]] = None) -> CalendarHeatmap:
+        """
+        기간별 캘린더 히트맵 데이터
+
+        Args:
+            project_ids: 포함할 프로젝트 ID (None 이면 전체)
+        """
+        try:
+            # +: 날짜 유효성 검증
+            if start_date > end_date:
+                raise ValueError("⚙️❌ 시작일이 종료일보다 늦을 수 없습니다")
+
+            # 1: 일별 × 프로젝트 집계 (데이터 버전이 같으면 캐시 재사용)
+            daily = self._get_daily_hours(start_date, end_date)
+
+            # 2: 프로젝트 필터 (메모리에서 처리 - 필터를 바꿔도 재조회 없음)
+            if project_ids is not None:
+                daily = daily[daily['project_id'].isin(project_ids)]
+
+            # 3: 요일 × 주 그리드 배치
+            grid = build_calendar_grid(
+                pd.to_datetime(daily['work_date']).to_numpy(dtype='datetime64[D]'),
+                daily['hours'].to_numpy(dtype=np.float64),
+                start_date,
+                end_date
+            )
+
+            return CalendarHeatmap(
+                hours=grid.hours,
+                dates=grid.dates,
+                week_starts=[week.astype(object) for week in grid.week_starts],
+                start_date=start_date,
+                end_date=end_date,
+                total_hours=float(grid.daily_hours.sum()),
+                active_days=int((grid.daily_hours > 0).sum()),
+                longest_streak=longest_streak(grid.daily_hours),
+                max_daily_hours=float(grid.daily_hours.max()) if len(grid.daily_hours) else 0.0
+            )
+
+        except ValueError as e:
+            raise e
+        except Exception as e:
+            raise Exception(f"⚙️❌ 캘린더 데이터 생성 실패: {str(e)}")
+
+    def _get_daily_hours(self, start_date: date, end_date: date) -> pd.DataFrame:
+        """일별 집계 조회 - (데이터 버전, 기간) 캐시"""
+        cache_key = (db_manager.get_data_version(), start_date, end_date)
+
+        with CalendarService._daily_lock:
+            cached = CalendarService._daily_cache.get(cache_key)
+        metrics.record_cache_lookup("calendar_daily_hours", cached is not None)
+        if cached is not None:
+            return cached
+
+        daily = self.work_log_service.get_daily_hours(start_date, end_date)
+
+        with CalendarService._daily_lock:
+            # 이전 데이터 버전 항목 정리 + 개수 제한 (오래된 것부터)
+            cache = CalendarService._daily_cache
+            for key in [key for key in cache if key[0] != cache_key[0]]:
+                del cache[key]
+                metrics.record_cache_eviction("calendar_daily_hours")
+            while len(cache) >= MAX_CACHED_RANGES:
+                del cache[next(iter(cache))]
+                metrics.record_cache_eviction("calendar_daily_hours")
+            cache[cache_key] = daily
+
+        return daily
+
+    def get_project_options(self) -> List[ProjectRecord]:
+        """필터용 프로젝트 목록 (진행 중 → 아카이브 순)"""
+        try:
+            return self.project_service.get_active_projects() + self.project_service.get_archived_projects()
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ 프로젝트 목록 조회 실패: {str(e)}")
@@ -3,17 +3,43 @@ DashboardService - 완전 구현
 Controller에서 호출하는 4개 메서드 구현
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import date, datetime, timedelta
 import logging
-
+import threading
+
+import numpy as np
+
+from ..analytics.forecasting import forecast_completion
+from ..analytics.simulation import simulate_completion
+from ..analytics.timeline import AUTO, build_timeline_matrix, resolve_granularity
+from ..database.connection import db_manager
+from ..dto.deadline_risk import DeadlineRisk
+from ..dto.project_summary import ProjectSummary
+from ..dto.records import ProjectRecord
+from ..dto.timeline import TimelineData
 from ..services.project_service import ProjectService
-from ..services.work_log_service import WorkLogService
+from ..services.work_log_service import ROLLING_WINDOWS, WorkLogService
+from utils import metrics
+import config
+
+# 예측에 사용할 최근 구간 기본값 (config 미설정 시)
+DEFAULT_FORECAST_WINDOW_DAYS = 30
+DEFAULT_FORECAST_MIN_WINDOW_SAMPLES = 5
 
 
 class DashboardService:
     """대시보드 서비스 - 비즈니스 로직 및 데이터 처리"""
 
+    # 프로젝트 요약 캐시 (프로세스 공유): ((data_version, date), List[ProjectSummary])
+    _summary_cache: Optional[Tuple[Tuple[int, date], List[ProjectSummary]]] = None
+    _summary_lock = threading.Lock()
+
+    # 마감 리스크 캐시 (프로젝트별): project_id → (캐시 키, DeadlineRisk)
+    # 캐시 키 = (로그 지문, 남은 작업량, 마감일, 오늘) → 해당 프로젝트 로그가 바뀔 때만 재계산
+    _risk_cache: Dict[int, Tuple[tuple, DeadlineRisk]] = {}
+    _risk_lock = threading.Lock()
+
     def __init__(self):
         self.project_service = ProjectService()
         self.work_log_service = WorkLogService()
@@ -45,7 +71,7 @@ class DashboardService:
 
             # 2: today_delta 계산
             yesterday_logs = self.work_log_service.get_past_work_data(yesterday, yesterday)
-            yesterday_hours = sum(log['작업시간'] for log in yesterday_logs)
+            yesterday_hours = float(yesterday_logs['작업시간'].sum())
             today_delta = today_hours - yesterday_hours
 
             # 3: week_avg_hours 계산
@@ -54,7 +80,7 @@ class DashboardService:
             this_week_end = today
 
             this_week_logs = self.work_log_service.get_past_work_data(this_week_start, this_week_end)
-            week_total_hours = sum(log['작업시간'] for log in this_week_logs)
+            week_total_hours = float(this_week_logs['작업시간'].sum())
 
             week_avg_hours = week_total_hours / (days_since_monday + 1)
 
@@ -63,7 +89,7 @@ class DashboardService:
             last_week_end = this_week_start - timedelta(days=1)
 
             last_week_logs = self.work_log_service.get_past_work_data(last_week_start, last_week_end)
-            last_week_total_hours = sum(log['작업시간'] for log in last_week_logs)
+            last_week_total_hours = float(last_week_logs['작업시간'].sum())
 
             last_week_avg_hours = last_week_total_hours / ((last_week_end - last_week_start).days + 1)
             week_avg_delta = week_avg_hours - last_week_avg_hours
@@ -79,153 +105,278 @@ class DashboardService:
         except Exception as e:
             raise Exception(f"⚙️❌ 작업로그 요약 데이터 생성 실패: {str(e)}")
 
-    def get_projects_summary(self) -> List[Dict[str, Any]]:
+    def get_projects_summary(self) -> List[ProjectSummary]:
         """
-        프로젝트 현황 테이블 데이터 생성
+        프로젝트 현황 테이블 데이터 생성 (데이터 버전 + 날짜 기준 캐시)
 
         Returns:
-            List[Dict]: [
-                {
-                    'project_id': int,
-                    '프로젝트명': str,
-                    'D-Day': str,
-                    '목표치': int,
-                    '현재값': int,
-                    '진행률': str,          # "75.0%"
-                    '작업시간': float,   # "10.0"
-                    '필요시간': str,        # "40.0h" 또는 "None"
-                    '예상 마감일': date     # 예상 완료 날짜 또는 None
-                }
-            ]
+            List[ProjectSummary]: 마감일순 프로젝트 요약 (숫자 값 그대로)
         """
         try:
-            # 1: 활성 프로젝트 조회 (Project Service 매서드)
-            active_projects = self.project_service.get_active_projects()
+            # 1: 캐시 키 = (데이터 버전, 오늘 날짜) - D-Day/예상 마감일이 날짜에 의존
+            cache_key = (db_manager.get_data_version(), date.today())
 
-            if not active_projects:
-                return []
+            with DashboardService._summary_lock:
+                cached = DashboardService._summary_cache
+                if cached is not None and cached[0] == cache_key:
+                    metrics.record_cache_lookup("project_summaries", True)
+                    return cached[1]
 
-            # 2: 모든 프로젝트의 효율성 통계를 한 번에 조회 (Work Log Service 메서드)
-            project_ids = [p['id'] for p in active_projects]
-            efficiency_stats = self.work_log_service.get_efficiency_stats_for_projects(project_ids)
+            # 2: 캐시 미스 → 새로 계산 후 저장
+            metrics.record_cache_lookup("project_summaries", False)
+            summaries = self._build_project_summaries()
 
-            # 3: 프로젝트별 예측 계산
-            today = date.today()
-            result = []
-
-            for project in active_projects:
-                # 3-1: 기본 프로젝트 정보
-                project_id = project['id']
-                project_name = project['name']
-                project_d_day = project['d_day_display']
-                target_value = project['target_value']
-                current_progress = project['current_progress']
-
-                # 3-2: 진행률 계산
-                remaining_work = max(0, target_value - current_progress)
-                progress_rate = (current_progress / target_value * 100) if target_value > 0 else 0
-                progress_percentage = f"{progress_rate:.1f}%"  # 진행률 포맷팅
-
-                # 3-3: 효율성 통계 가져오기
-                stats = efficiency_stats.get(project_id, {})
-                avg_efficiency = stats.get('avg_efficiency', 0)
-                worked_hours = stats.get('worked_hours', 0)
-                avg_hours_per_day = stats.get('avg_hours_per_day', 0)
-
-                # 3-4: 예상 필요시간 계산 (남은 작업량 / 평균 효율성)
-                if avg_efficiency > 0 and remaining_work > 0:
-                    estimated_hours = remaining_work / avg_efficiency
-                    required_hours = f"{estimated_hours:.1f}h"
-
-                    # 3-5: 예상 마감일 계산 (남은 작업량 / 평균 하루 작업시간)
-                    if avg_hours_per_day > 0:
-                        estimated_days = estimated_hours / avg_hours_per_day
-                        estimated_completion_date = today + timedelta(days=int(estimated_days))
-                    else:
-                        estimated_completion_date = None
-
-                # 이미 완료된 경우
-                elif remaining_work == 0:
-                    required_hours = "0h"
-                    estimated_completion_date = today
-                # 효율성 데이터가 없는 경우
-                else:
-                    required_hours = None
-                    estimated_completion_date = None
-
-                # 4: 결과 딕셔너리 생성
-                project_summary = {
-                    'project_id': project_id,
-                    '프로젝트명': project_name,
-                    'D-Day': project_d_day,
-                    '목표치': target_value,
-                    '현재값': current_progress,
-                    '진행률': progress_percentage,
-                    '작업시간' : worked_hours,
-                    '필요시간': required_hours,
-                    '예상 마감일': estimated_completion_date
-                }
-
-                result.append(project_summary)
-
-            return result
+            with DashboardService._summary_lock:
+                DashboardService._summary_cache = (cache_key, summaries)
+
+            return summaries
 
         except Exception as e:
             raise Exception(f"⚙️❌ 프로젝트 현황 조회 실패: {str(e)}")
 
-    def get_chart_data(self) -> List[Dict[str, Any]]:
+    def _build_project_summaries(self) -> List[ProjectSummary]:
+        """활성 프로젝트 전체의 진행률 / 필요시간 / 예상 마감일을 배치 계산"""
+        # 1: 활성 프로젝트 조회 (Project Service 매서드)
+        active_projects = self.project_service.get_active_projects()
+
+        if not active_projects:
+            return []
+
+        # 2: 모든 프로젝트의 전체 이력 / 최근 구간 통계를 한 번에 조회 (Work Log Service 메서드)
+        project_ids = [p.id for p in active_projects]
+        efficiency_stats = self.work_log_service.get_efficiency_stats_for_projects(project_ids)
+
+        forecast_window = int(getattr(config, "FORECAST_WINDOW_DAYS", DEFAULT_FORECAST_WINDOW_DAYS) or 0)
+        windows = ROLLING_WINDOWS + ((forecast_window,) if forecast_window > 0 else ())
+        rolling_stats = self.work_log_service.get_rolling_stats_for_projects(project_ids, windows)
+
+        # 3: 예측 엔진 입력 배열 구성
+        stats = [efficiency_stats.get(project_id, {}) for project_id in project_ids]
+        rolling = [rolling_stats.get(project_id, {}) for project_id in project_ids]
+        target_values = np.array([p.target_value for p in active_projects], dtype=np.float64)
+        current_progress = np.array([p.current_progress for p in active_projects], dtype=np.float64)
+        worked_hours = self._stat_array(stats, 'worked_hours')
+
+        # 3-1: 최근 구간 표본이 충분한 프로젝트는 최근 구간 통계로 예측 (페이스 변화 반영)
+        forecast_inputs = {
+            key: self._stat_array(stats, key)
+            for key in ('avg_efficiency', 'efficiency_std', 'efficiency_count', 'avg_hours_per_day')
+        }
+        use_recent = np.zeros(len(project_ids), dtype=bool)
+        if forecast_window > 0:
+            recent = [r.get(forecast_window, {}) for r in rolling]
+            min_samples = int(getattr(config, "FORECAST_MIN_WINDOW_SAMPLES", DEFAULT_FORECAST_MIN_WINDOW_SAMPLES))
+            use_recent = self._stat_array(recent, 'efficiency_count') >= max(min_samples, 1)
+            for key in forecast_inputs:
+                forecast_inputs[key] = np.where(use_recent, self._stat_array(recent, key), forecast_inputs[key])
+
+        # 4: 전체 프로젝트 예측 (벡터 연산 1회)
+        forecast = forecast_completion(
+            target_values=target_values,
+            current_progress=current_progress,
+            avg_efficiency=forecast_inputs['avg_efficiency'],
+            efficiency_std=forecast_inputs['efficiency_std'],
+            efficiency_count=forecast_inputs['efficiency_count'],
+            avg_hours_per_day=forecast_inputs['avg_hours_per_day'],
+            today=date.today()
+        )
+
+        # 5: 진행률 계산
+        progress_rates = np.divide(
+            current_progress * 100, target_values,
+            out=np.zeros_like(current_progress), where=target_values > 0
+        )
+
+        # 6: 결과 생성
+        required_hours = forecast.to_floats(forecast.required_hours)
+        required_hours_low = forecast.to_floats(forecast.required_hours_low)
+        required_hours_high = forecast.to_floats(forecast.required_hours_high)
+        completion_dates = forecast.to_dates(forecast.completion_date)
+        completion_dates_low = forecast.to_dates(forecast.completion_date_low)
+        completion_dates_high = forecast.to_dates(forecast.completion_date_high)
+
+        return [
+            ProjectSummary(
+                project_id=project.id,
+                name=project.name,
+                d_day_display=project.d_day_display,
+                target_value=project.target_value,
+                current_progress=project.current_progress,
+                progress_rate=float(progress_rates[i]),
+                worked_hours=float(worked_hours[i]),
+                required_hours=required_hours[i],
+                estimated_completion_date=completion_dates[i],
+                required_hours_low=required_hours_low[i],
+                required_hours_high=required_hours_high[i],
+                completion_date_low=completion_dates_low[i],
+                completion_date_high=completion_dates_high[i],
+                velocity_7d=self._rolling_value(rolling[i], 7, 'velocity'),
+                velocity_14d=self._rolling_value(rolling[i], 14, 'velocity'),
+                velocity_30d=self._rolling_value(rolling[i], 30, 'velocity'),
+                efficiency_7d=self._rolling_value(rolling[i], 7, 'avg_efficiency'),
+                efficiency_14d=self._rolling_value(rolling[i], 14, 'avg_efficiency'),
+                efficiency_30d=self._rolling_value(rolling[i], 30, 'avg_efficiency'),
+                forecast_window_days=forecast_window if use_recent[i] else None
+            )
+            for i, project in enumerate(active_projects)
+        ]
+
+    @staticmethod
+    def _stat_array(stats: List[Dict], key: str) -> np.ndarray:
+        """프로젝트별 통계 딕셔너리 목록 → float 배열 (없으면 0)"""
+        return np.array([s.get(key, 0) for s in stats], dtype=np.float64)
+
+    @staticmethod
+    def _rolling_value(project_rolling: Dict[int, Dict], window: int, key: str) -> Optional[float]:
+        """최근 구간 통계 값 (구간 내 로그 없으면 속도 0, 효율성은 표본 없으면 None)"""
+        window_stats = project_rolling.get(window)
+        if window_stats is None:
+            return 0.0 if key == 'velocity' else None
+        if key == 'avg_efficiency' and window_stats['efficiency_count'] == 0:
+            return None
+        return window_stats[key]
+
+    def get_chart_data(self) -> List[ProjectSummary]:
         """
         프로젝트별 사용시간 vs 필요시간 비교 데이터
+        - 프로젝트 현황과 같은 요약 결과를 재사용 (재계산/문자열 파싱 없음)
 
         Returns:
-            List[Dict]: [
-                {
-                    '프로젝트명': str,
-                    '작업시간': float,         # 현재까지 투입한 총 시간
-                    '필요시간': float          # 앞으로 필요한 시간
-                }
-            ]
+            List[ProjectSummary]: worked_hours / required_hours 사용
         """
         try:
-            # 1: 프로젝트 현황 데이터 재사용
-            projects_summary = self.get_projects_summary()
+            return self.get_projects_summary()
 
-            if not projects_summary:
-                return []
+        except Exception as e:
+            raise Exception(f"⚙️❌ 프로젝트 시각화 차트 데이터 조회 실패: {str(e)}")
 
-            result = []
-            for project in projects_summary:
-                # 2: 필요시간에서 숫자만 추출
-                required_hours_str = project['필요시간']
-                if required_hours_str == None:
-                    required_hours = 0
-                else:
-                    required_hours = float(required_hours_str.replace('h', ''))
+    def get_deadline_risks(self) -> List[DeadlineRisk]:
+        """
+        프로젝트별 몬테카를로 마감 리스크 (P50/P90 완료일, 마감 초과 확률)
+        - 로그가 바뀐 프로젝트만 모아서 한 번에 재시뮬레이션
 
-                # 3: 결과 딕셔너리 생성
-                result.append({
-                    '프로젝트명': project['프로젝트명'],
-                    '작업시간': project['작업시간'],
-                    '필요시간': float(required_hours)
-                })
+        Returns:
+            List[DeadlineRisk]: 마감일순 프로젝트별 리스크
+        """
+        try:
+            # 1: 활성 프로젝트 + 로그 지문 조회
+            active_projects = self.project_service.get_active_projects()
+            if not active_projects:
+                return []
 
-            return result
+            today = date.today()
+            project_ids = [p.id for p in active_projects]
+            fingerprints = self.work_log_service.get_log_fingerprints(project_ids)
+
+            # 2: 프로젝트별 캐시 확인
+            cache_keys = {}
+            risks = {}
+            with DashboardService._risk_lock:
+                for project in active_projects:
+                    remaining = max(0, project.target_value - project.current_progress)
+                    cache_key = (fingerprints.get(project.id), remaining, project.end_date, today)
+                    cache_keys[project.id] = cache_key
+
+                    cached = DashboardService._risk_cache.get(project.id)
+                    if cached is not None and cached[0] == cache_key:
+                        risks[project.id] = cached[1]
+
+            hit_count = len(risks)
+            metrics.cache_requests_total.inc(hit_count, cache="deadline_risks", result="hit")
+            metrics.cache_requests_total.inc(len(project_ids) - hit_count, cache="deadline_risks", result="miss")
+
+            # 3: 캐시 미스 프로젝트만 한 번에 시뮬레이션
+            stale_projects = [p for p in active_projects if p.id not in risks]
+            if stale_projects:
+                simulated = self._simulate_deadline_risks(stale_projects, today)
+                with DashboardService._risk_lock:
+                    for risk in simulated:
+                        DashboardService._risk_cache[risk.project_id] = (cache_keys[risk.project_id], risk)
+                        risks[risk.project_id] = risk
+
+            return [risks[project_id] for project_id in project_ids]
 
         except Exception as e:
-            raise Exception(f"⚙️❌ 프로젝트 시각화 차트 데이터 조회 실패: {str(e)}")
-
-    def get_timeline_data(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+            raise Exception(f"⚙️❌ 마감 리스크 시뮬레이션 실패: {str(e)}")
+
+    def _simulate_deadline_risks(self, projects: List[ProjectRecord], today: date) -> List[DeadlineRisk]:
+        """과거 로그 표본으로 프로젝트 완료 시점 시뮬레이션"""
+        # 1: 대상 프로젝트 로그 이력 조회 → 프로젝트별 표본 구성
+        history = self.work_log_service.get_history_for_projects([p.id for p in projects])
+        daily_hours_samples, efficiency_samples = self._build_sample_pools(
+            [p.id for p in projects], history
+        )
+
+        # 2: 전체 프로젝트 × 시행 시뮬레이션
+        result = simulate_completion(
+            remaining_work=[max(0, p.target_value - p.current_progress) for p in projects],
+            days_until_deadline=[(p.end_date - today).days for p in projects],
+            daily_hours_samples=daily_hours_samples,
+            efficiency_samples=efficiency_samples
+        )
+
+        # 3: 일수 → 날짜 변환
+        def to_date(days: float) -> Optional[date]:
+            return None if np.isnan(days) else today + timedelta(days=int(days))
+
+        return [
+            DeadlineRisk(
+                project_id=project.id,
+                name=project.name,
+                end_date=project.end_date,
+                p50_date=to_date(result.p50_days[i]),
+                p90_date=to_date(result.p90_days[i]),
+                miss_probability=None if np.isnan(result.miss_probability[i]) else float(result.miss_probability[i]),
+                trials=result.trials
+            )
+            for i, project in enumerate(projects)
+        ]
+
+    @staticmethod
+    def _build_sample_pools(project_ids: List[int], history: List[tuple]) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        로그 이력 → 프로젝트별 표본
+        - 일일 작업시간: 첫 작업일~마지막 작업일 모든 날짜 (기록 없는 날 0)
+        - 효율성: 작업시간 > 0 인 로그의 진행량/작업시간
+        """
+        rows_by_project: Dict[int, List[tuple]] = {project_id: [] for project_id in project_ids}
+        for row in history:
+            rows_by_project[row[0]].append(row)
+
+        daily_hours_samples = []
+        efficiency_samples = []
+        for project_id in project_ids:
+            rows = rows_by_project[project_id]
+            if not rows:
+                daily_hours_samples.append(np.empty(0))
+                efficiency_samples.append(np.empty(0))
+                continue
+
+            dates = np.array([row[1] for row in rows], dtype='datetime64[D]')
+            progress = np.array([row[2] for row in rows], dtype=np.float64)
+            hours = np.array([row[3] for row in rows], dtype=np.float64)
+
+            day_index = (dates - dates.min()).astype(np.int64)
+            daily_hours = np.zeros(day_index.max() + 1)
+            daily_hours[day_index] = hours
+
+            worked = hours > 0
+            daily_hours_samples.append(daily_hours)
+            efficiency_samples.append(progress[worked] / hours[worked])
+
+        return daily_hours_samples, efficiency_samples
+
+    def get_timeline_data(self, start_date: date, end_date: date, granularity: str = AUTO) -> TimelineData:
         """
-        기간별 프로젝트 투입시간 추이 데이터
+        기간별 프로젝트 투입시간 추이 데이터 (SQL 구간 집계 + 밀집 행렬)
+        - 집계 단위: 기간 길이로 자동 선택 또는 사용자 지정
+        - 시리즈당 포인트가 상한을 넘으면 더 큰 단위로 올려 차트 크기 제한
 
         Returns:
-            List[Dict]: [
-                {
-                    '날짜': date,              # 작업 날짜
-                    '프로젝트명': str,         # 프로젝트 이름
-                    '작업시간': float          # 해당일 투입 시간
-                }
-            ]
+            TimelineData(
+                matrix=DataFrame[구간 시작일 × 프로젝트명] - 작업시간, 기록 없는 구간 0,
+                granularity=실제 적용 단위
+            )
         """
         try:
             # 1. 날짜 유효성 검증
@@ -234,26 +385,26 @@ class DashboardService:
             if end_date > date.today():
                 raise ValueError("⚙️❌ 미래 날짜는 조회할 수 없습니다")
 
-            # 2. Work Log Service를 통한 기간별 작업 로그 조회
-            work_logs = self.work_log_service.get_past_work_data(start_date, end_date)
+            # 2. 집계 단위 결정
+            resolved = resolve_granularity(start_date, end_date, granularity)
 
-            # 3. 차트용 데이터 구조로 변환
-            result = []
-            for log in work_logs:
-                timeline_entry = {
-                    '날짜': log['work_date'],
-                    '프로젝트명': log['프로젝트명'],    # get_past_work_data에서 이미 변환됨
-                    '작업시간': log['작업시간']        # get_past_work_data에서 이미 변환됨
-                }
-                result.append(timeline_entry)
+            # 3. 구간 × 프로젝트 작업시간 집계 (정렬은 쿼리에서 처리)
+            aggregated = self.work_log_service.get_hours_by_period(start_date, end_date, resolved)
 
-            # 4. 날짜순 정렬 (오래된 날짜부터)
-            result.sort(key=lambda x: x['날짜'])
+            # 4. 구간 × 프로젝트 밀집 행렬 (빈 구간 0 채움)
+            matrix = build_timeline_matrix(
+                aggregated['bucket'],
+                aggregated['project_name'],
+                aggregated['hours'],
+                start_date,
+                end_date,
+                resolved
+            )
 
-            return result
+            return TimelineData(matrix=matrix, granularity=resolved, start_date=start_date, end_date=end_date)
 
         except ValueError as e:
             # 날짜 유효성 에러는 그대로 전파
             raise e
         except Exception as e:
-            raise Exception(f"⚙️❌ 타임라인 데이터 조회 실패: {str(e)}")
\ No newline at end of file
+            raise Exception(f"⚙️❌ 타임라인 데이터 조회 실패: {str(e)}")
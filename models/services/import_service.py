@@ -0,0 +1,196 @@
+"""
+ImportService - 과거 작업 로그 일괄 가져오기 (CSV, Parquet)
+파일을 청크 단위로 읽어 컬럼 단위로 검증하고, 청크마다 한 트랜잭션으로 upsert
+"""
+
+from typing import Dict, Iterator, Optional, Tuple
+from datetime import date
+import logging
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from ..entities.work_log import MEMO_MAX_LENGTH
+from ..repositories.project_repository import ProjectRepository
+from ..repositories.work_log_repository import WorkLogRepository
+from ..dto.import_result import ImportResult
+
+IMPORT_FORMATS = ("csv", "parquet")
+DEFAULT_CHUNK_SIZE = 5000
+
+# 필수 값 컬럼 (memo 는 없으면 빈 문자열)
+REQUIRED_COLUMNS = ("work_date", "progress_added", "hours_spent")
+# 프로젝트 식별 컬럼 (하나 이상 필요, notion_page_id 우선)
+PROJECT_KEY_COLUMNS = ("notion_page_id", "project_name")
+
+_EXTENSION_FORMATS = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet"}
+
+
+class ImportService:
+    """작업 로그 가져오기 서비스"""
+
+    def __init__(self):
+        self.project_repo = ProjectRepository()
+        self.work_log_repo = WorkLogRepository()
+        self.logger = logging.getLogger(__name__)
+
+    def import_work_logs(self, path: str, fmt: Optional[str] = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE, dry_run: bool = False) -> ImportResult:
+        """
+        작업 로그 파일 가져오기
+
+        Args:
+            path: CSV / Parquet 파일 경로
+                  (컬럼: work_date, progress_added, hours_spent, [memo], notion_page_id 또는 project_name)
+            fmt: csv / parquet (None 이면 확장자로 판단)
+            chunk_size: 한 번에 읽고 upsert 할 행 수
+            dry_run: True 면 검증만 하고 쓰지 않음
+
+        Returns:
+            ImportResult (가져온 / 건너뛴 행 수, 처리량)
+        """
+        try:
+            # +: 입력 검증
+            fmt = fmt or _EXTENSION_FORMATS.get(os.path.splitext(path)[1].lower())
+            if fmt not in IMPORT_FORMATS:
+                raise ValueError(f"⚙️❌ 지원하지 않는 형식: {fmt or path}")
+            if chunk_size <= 0:
+                raise ValueError("⚙️❌ 청크 크기는 1 이상이어야 합니다")
+            if not os.path.isfile(path):
+                raise ValueError(f"⚙️❌ 파일을 찾을 수 없습니다: {path}")
+
+            # 1: 프로젝트 인메모리 인덱스 (notion_page_id / 이름 → id)
+            notion_index, name_index = self._build_project_index()
+
+            # 2: 청크별 검증 → 프로젝트 매핑 → upsert (청크당 트랜잭션 1개)
+            started = time.perf_counter()
+            total_rows = imported_rows = invalid_rows = unresolved_rows = chunk_count = 0
+            for chunk in self._read_chunks(path, fmt, chunk_size):
+                chunk_started = time.perf_counter()
+                rows, invalid_count, unresolved_count = self._prepare_chunk(chunk, notion_index, name_index)
+
+                if not dry_run:
+                    imported_rows += self.work_log_repo.bulk_upsert(rows.to_dict('records'))
+
+                chunk_count += 1
+                total_rows += len(chunk)
+                invalid_rows += invalid_count
+                unresolved_rows += unresolved_count
+
+                chunk_elapsed = time.perf_counter() - chunk_started
+                self.logger.debug(
+                    f"⚙️ 청크 {chunk_count}: {len(chunk)}행 "
+                    f"({len(chunk) / chunk_elapsed if chunk_elapsed > 0 else 0:,.0f} rows/s)"
+                )
+
+            result = ImportResult(
+                total_rows=total_rows,
+                imported_rows=imported_rows,
+                invalid_rows=invalid_rows,
+                unresolved_rows=unresolved_rows,
+                chunk_count=chunk_count,
+                elapsed_seconds=time.perf_counter() - started,
+                dry_run=dry_run
+            )
+            self.logger.info(
+                f"⚙️✅ 작업 로그 가져오기{' (dry-run)' if dry_run else ''}: "
+                f"{result.imported_rows}/{result.total_rows}행, 건너뜀 {result.skipped_rows}행 "
+                f"({result.rows_per_second:,.0f} rows/s)"
+            )
+            return result
+
+        except ValueError as e:
+            raise e
+        except Exception as e:
+            raise Exception(f"⚙️❌ 작업 로그 가져오기 실패: {str(e)}")
+
+    # ===== Private 헬퍼 메서드 =====
+    def _build_project_index(self) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """notion_page_id → id, 이름 → id (이름이 중복된 프로젝트는 모호하므로 이름 인덱스에서 제외)"""
+        identities = self.project_repo.find_identities()
+
+        notion_index = {notion_page_id: project_id for project_id, notion_page_id, _ in identities}
+
+        names = pd.Series([name for _, _, name in identities], dtype=object)
+        duplicated = set(names[names.duplicated()])
+        name_index = {
+            name: project_id for project_id, _, name in identities
+            if name not in duplicated
+        }
+        return notion_index, name_index
+
+    @staticmethod
+    def _read_chunks(path: str, fmt: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """파일을 chunk_size 행씩 DataFrame 으로 읽기 (전체 파일을 메모리에 올리지 않음)"""
+        if fmt == "csv":
+            # 모든 값을 문자열로 읽고 검증 단계에서 변환 (빈 칸 → "", "NA" 등도 문자열 그대로)
+            with pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False,
+                             encoding="utf-8-sig") as reader:
+                for chunk in reader:
+                    yield chunk
+            return
+
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise Exception("⚙️❌ Parquet 가져오기에는 pyarrow 패키지가 필요합니다 (pip install pyarrow)")
+
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+
+    @staticmethod
+    def _prepare_chunk(chunk: pd.DataFrame, notion_index: Dict[str, int],
+                       name_index: Dict[str, int]) -> Tuple[pd.DataFrame, int, int]:
+        """
+        청크 검증 + 프로젝트 매핑 (work_log_service.normalize_work_log 와 같은 규칙을 컬럼 단위로 적용)
+
+        Returns:
+            (upsert 할 행 DataFrame[project_id, work_date, progress_added, hours_spent, memo],
+             검증 실패 행 수, 프로젝트 미확인 행 수)
+        """
+        # +: 컬럼 구성 확인
+        missing = [column for column in REQUIRED_COLUMNS if column not in chunk.columns]
+        if missing:
+            raise ValueError(f"⚙️❌ 필수 컬럼이 없습니다: {', '.join(missing)}")
+        if not any(column in chunk.columns for column in PROJECT_KEY_COLUMNS):
+            raise ValueError(f"⚙️❌ 프로젝트 식별 컬럼이 필요합니다: {' 또는 '.join(PROJECT_KEY_COLUMNS)}")
+
+        # 1: 타입 변환 (변환 불가 값은 NaN / NaT)
+        work_date = pd.to_datetime(chunk['work_date'].astype(str), format="ISO8601", errors='coerce')
+        progress = pd.to_numeric(chunk['progress_added'], errors='coerce').astype(np.float64)
+        hours = pd.to_numeric(chunk['hours_spent'], errors='coerce').astype(np.float64)
+        if 'memo' in chunk.columns:
+            memo = chunk['memo'].fillna("").astype(str)
+        else:
+            memo = pd.Series("", index=chunk.index)
+
+        # 2: 값 규칙 (진행량: 0 이상 정수 / 작업시간: 0 이상 / 작업일: 오늘 이전 / 메모: 100자 이내)
+        today = pd.Timestamp(date.today())
+        valid = (
+            work_date.notna() & (work_date <= today)
+            & progress.notna() & (progress >= 0) & (progress % 1 == 0)
+            & np.isfinite(hours) & (hours >= 0)
+            & (memo.str.len() <= MEMO_MAX_LENGTH)
+        )
+
+        # 3: 프로젝트 매핑 (notion_page_id 우선, 없으면 이름)
+        project_id = pd.Series(np.nan, index=chunk.index)
+        if 'notion_page_id' in chunk.columns:
+            project_id = chunk['notion_page_id'].astype(str).str.strip().map(notion_index)
+        if 'project_name' in chunk.columns:
+            project_id = project_id.fillna(chunk['project_name'].astype(str).str.strip().map(name_index))
+        resolved = project_id.notna()
+
+        # 4: 유효 + 매핑된 행만 DB 타입으로 정리
+        keep = valid & resolved
+        rows = pd.DataFrame({
+            'project_id': project_id[keep].astype(np.int64),
+            'work_date': work_date[keep].dt.date,
+            'progress_added': progress[keep].astype(np.int64),
+            'hours_spent': hours[keep],
+            'memo': memo[keep]
+        })
+        return rows, int((~valid).sum()), int((valid & ~resolved).sum())
@@ -4,6 +4,7 @@ import logging
 
 from ..repositories.project_repository import ProjectRepository
 from ..entities.project import Project
+from ..dto.records import ProjectRecord
 
 # 노션 API 클라이언트 import
 from notion_client import Client
@@ -20,16 +21,16 @@ class ProjectService:
         self.logger = logging.getLogger(__name__)
 
     # ===== 1. 프로젝트 목록 조회 및 정렬 =====
-    def get_active_projects(self) -> List[Dict[str, Any]]:
+    def get_active_projects(self) -> List[ProjectRecord]:
         """진행 중 프로젝트 목록 반환"""
         try:
-            # 1: Repository에서 진행 중 프로젝트만 조회
-            active_projects = self.project_repo.find_by_status("진행 중")
+            # 1: Repository에서 진행 중 프로젝트만 조회 (경량 레코드)
+            active_projects = self.project_repo.find_records_by_status("진행 중")
 
             # 2: 마감일순으로 정렬
             sorted_projects = sorted(
                 active_projects,
-                key=lambda x: x['days_until_deadline']
+                key=lambda x: x.days_until_deadline
             )
 
             return sorted_projects
@@ -38,17 +39,11 @@ class ProjectService:
         except Exception as e:
             raise e
 
-    def get_archived_projects(self) -> List[Dict[str, Any]]:
+    def get_archived_projects(self) -> List[ProjectRecord]:
         """아카이브 프로젝트 목록 반환 (진행 중이 아닌 모든 프로젝트)"""
         try:
-            # 1: Repository에서 모든 프로젝트 조회
-            all_projects = self.project_repo.find_all()
-
-            # 2: 진행 중이 아닌 프로젝트만 필터링
-            archived_projects = [
-                project for project in all_projects
-                if project['status'] != '진행 중'
-            ]
+            # 1-2: Repository에서 진행 중이 아닌 프로젝트만 조회 (필터링은 쿼리에서 처리)
+            archived_projects = self.project_repo.find_records_excluding_status('진행 중')
 
             # 3: 상태별 우선순위 + 마감일순으로 정렬
             status_priority = {
@@ -60,8 +55,8 @@ class ProjectService:
             sorted_projects = sorted(
                 archived_projects,
                 key=lambda x: (
-                    status_priority.get(x['status'], 99),
-                    x['days_until_deadline']
+                    status_priority.get(x.status, 99),
+                    x.days_until_deadline
                 )
             )
 
@@ -1,16 +1,81 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import date, datetime
+import html
 import logging
+import math
+import numbers
 
+import pandas as pd
+
+import config
+from ..database.search_index import HIGHLIGHT_END, HIGHLIGHT_START, to_match_query
+from ..repositories.project_repository import ProjectRepository
 from ..repositories.work_log_repository import WorkLogRepository
-from ..entities.work_log import WorkLog
+from ..entities.work_log import MEMO_MAX_LENGTH, WorkLog
 from ..services.project_service import ProjectService
+from ..dto.records import ProjectRecord
+from ..dto.work_log_page import WorkLogPage
+from ..dto.memo_search_page import MemoSearchPage
+
+
+WEEKDAYS_KR = ['월', '화', '수', '목', '금', '토', '일']
+
+# 최근 속도/효율성 집계 구간 (일)
+ROLLING_WINDOWS = (7, 14, 30)
+
+WORK_LOG_FIELDS = ('project_id', 'work_date', 'progress_added', 'hours_spent', 'memo')
+
+
+def normalize_work_log(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    작업 로그 한 행 검증 + 저장 형식으로 정리 (편집 화면 저장 / API upsert 공통)
+    - ImportService 는 같은 규칙을 컬럼 단위로 적용
+    - project_id: 1 이상 정수 / work_date: 오늘 이전 / progress_added: 0 이상 정수 (3.0 은 3 으로)
+    - hours_spent: 0 이상 유한한 수 / memo: MEMO_MAX_LENGTH 자 이내 문자열
+    - bool 은 int 의 하위 타입이지만 숫자로 받지 않음 (JSON true → 1 저장 방지)
+
+    Returns:
+        저장 필드만 담은 dict (규칙 위반이면 None)
+    """
+    # 1: 필수 필드 체크
+    if not all(field in data for field in WORK_LOG_FIELDS):
+        return None
+    project_id, work_date, progress, hours, memo = (data[field] for field in WORK_LOG_FIELDS)
+
+    # 2: 타입 체크
+    if any(isinstance(value, bool) for value in (project_id, progress, hours)):
+        return None
+    if not isinstance(project_id, numbers.Integral) or not isinstance(work_date, date):
+        return None
+    if not isinstance(progress, numbers.Real) or not isinstance(hours, numbers.Real):
+        return None
+    if not isinstance(memo, str):
+        return None
+
+    # 3: 비즈니스 규칙 체크
+    if project_id <= 0 or work_date > date.today():
+        return None
+    if not math.isfinite(progress) or progress < 0 or progress % 1 != 0:
+        return None
+    if not math.isfinite(hours) or hours < 0:
+        return None
+    if len(memo) > MEMO_MAX_LENGTH:
+        return None
+
+    return {
+        'project_id': int(project_id),
+        'work_date': work_date,
+        'progress_added': int(progress),
+        'hours_spent': float(hours),
+        'memo': memo
+    }
 
 
 class WorkLogService:
     def __init__(self):
         self.work_log_repo = WorkLogRepository()
         self.project_service = ProjectService()  # Project 정보 활용
+        self.project_repo = ProjectRepository()  # 프로젝트 존재 확인 (일괄 upsert)
         self.logger = logging.getLogger(__name__)
 
     def get_today_work_data(self) -> List[Dict[str, Any]]:
@@ -21,33 +86,34 @@ class WorkLogService:
             # 1: 진행 중 프로젝트 목록 조회 (ProjectService 활용)
             active_projects = self.project_service.get_active_projects()
 
-            # 2: 오늘 log 자동 생성
-            self._ensure_today_logs_exist(active_projects, today)
+            # 2: 오늘 log 자동 생성 (sparse 모드는 빈 날을 저장하지 않음 - 아래 5에서 기본값으로 채움)
+            if not self._sparse_mode():
+                self._ensure_today_logs_exist(active_projects, today)
 
             # 3. DB에서 오늘 작업 로그 조회
-            today_logs = self.work_log_repo.find_by_date(today)
+            today_logs = self.work_log_repo.find_records_by_date(today)
 
             # 4: 프로젝트별 로그 매핑 (빠른 조회용 딕셔너리)
-            log_by_project = {log['project_id']: log for log in today_logs}
+            log_by_project = {log.project_id: log for log in today_logs}
 
             # 5: 동적 조합 (LEFT JOIN 효과)
             result = []
             for project in active_projects:
-                project_id = project['id']
+                project_id = project.id
                 existing_log = log_by_project.get(project_id)
 
                 # 6: fd에서 인식 가능하도록 파싱
                 row = {
                     'project_id': project_id,
                     'work_date': today,
-                    '프로젝트명': project['name'],
-                    'D-Day': project['d_day_display'],
-                    '목표치': project['target_value'],
-                    '현재값': project['current_progress'],
+                    '프로젝트명': project.name,
+                    'D-Day': project.d_day_display,
+                    '목표치': project.target_value,
+                    '현재값': project.current_progress,
                     # 기존 로그가 있으면 실제 값, 없으면 기본값 0
-                    '진행량': existing_log['progress_added'] if existing_log else 0,
-                    '작업시간': existing_log['hours_spent'] if existing_log else 0.0,
-                    '메모': existing_log['memo'] if existing_log else ""
+                    '진행량': existing_log.progress_added if existing_log else 0,
+                    '작업시간': existing_log.hours_spent if existing_log else 0.0,
+                    '메모': existing_log.memo if existing_log else ""
                 }
                 result.append(row)
 
@@ -56,16 +122,16 @@ class WorkLogService:
         except Exception as e:
             raise e
 
-    def _ensure_today_logs_exist(self, active_projects: List[Dict], today: date):
+    def _ensure_today_logs_exist(self, active_projects: List[ProjectRecord], today: date):
         """오늘 날짜 로그가 없는 진행 중 프로젝트들의 로그 자동 생성"""
         # 1: 기존 오늘 로그 조회
-        existing_logs = self.work_log_repo.find_by_date(today)
-        existing_project_ids = {log['project_id'] for log in existing_logs}
+        existing_logs = self.work_log_repo.find_records_by_date(today)
+        existing_project_ids = {log.project_id for log in existing_logs}
 
         # 2: 로그가 없는 프로젝트들 찾기
         missing_projects = [
             project for project in active_projects
-            if project['id'] not in existing_project_ids
+            if project.id not in existing_project_ids
         ]
 
         # 3: 없는 프로젝트들에 대해 기본값 로그 생성
@@ -73,7 +139,7 @@ class WorkLogService:
             new_logs = []
             for project in missing_projects:
                 new_log = WorkLog(
-                    project_id=project['id'],
+                    project_id=project.id,
                     work_date=today,
                     progress_added=0,    # 기본값
                     hours_spent=0.0,     # 기본값
@@ -85,54 +151,203 @@ class WorkLogService:
             if new_logs:
                 self.work_log_repo.bulk_insert(new_logs)
 
-    def get_past_work_data(self, start_date: date, end_date: date) -> List[Dict[str, Any]]:
-        """과거 작업 로그 조회 - 실제 기록된 데이터만 반환"""
+    def get_past_work_data(self, start_date: date, end_date: date) -> pd.DataFrame:
+        """과거 작업 로그 조회 - 실제 기록된 데이터만 반환 (DataFrame, 최신순)"""
         try:
             # +: 날짜 유효성 검사
-            if start_date > end_date:
-                raise ValueError("⚙️❌ 시작일이 종료일보다 늦을 수 없습니다")
-            if end_date > date.today():
-                raise ValueError("⚙️❌ 미래 날짜는 조회할 수 없습니다")
+            self._validate_past_range(start_date, end_date)
 
-            # 1: 기간별 작업 로그 + 프로젝트 정보 조회
-            work_logs = self.work_log_repo.find_by_date_range(start_date, end_date)
+            # 1: 기간별 작업 로그 + 프로젝트명 조회 (정렬은 쿼리에서 처리)
+            work_logs = self.work_log_repo.find_frame_by_date_range(start_date, end_date)
 
-            # 2: View 친화적 구조로 변환
-            result = []
-            for log in work_logs:
-                # 요일 계산
-                weekdays = ['월', '화', '수', '목', '금', '토', '일']
-                weekday = weekdays[log['work_date'].weekday()]
+            # 2: View 친화적 구조로 변환 (컬럼 단위 벡터 연산)
+            return self._to_past_work_frame(work_logs)
 
-                row = {
-                    'project_id': log['project_id'],
-                    'work_date': log['work_date'],
-                    '날짜': f"{log['work_date'].strftime('%Y-%m-%d')} ({weekday})",
-                    '프로젝트명': log['project_name'],  # Repository에서 JOIN으로 가져온 프로젝트명
-                    '진행량': log['progress_added'],
-                    '작업시간': log['hours_spent'],
-                    '메모': log['memo']
-                }
-                result.append(row)
+        except Exception as e:
+            raise e
+
+    def get_past_work_page(self, start_date: date, end_date: date, page_size: int,
+                           cursor: Optional[Tuple[date, int]] = None) -> WorkLogPage:
+        """
+        과거 작업 로그 한 페이지 조회 - (work_date, project_id) 키셋 기준, 최신순
+        - sparse 모드: 저장 안 된 빈 날도 진행 중 프로젝트별 빈 칸으로 포함 (편집해서 기록 가능)
+        """
+        try:
+            # +: 조회 조건 유효성 검사
+            self._validate_past_range(start_date, end_date)
+            if page_size <= 0:
+                raise ValueError("⚙️❌ 페이지 크기는 1 이상이어야 합니다")
+
+            # 1: 다음 페이지 존재 여부 확인을 위해 1행 더 조회
+            find_page = (self.work_log_repo.find_dense_frame_page if self._sparse_mode()
+                         else self.work_log_repo.find_frame_page)
+            work_logs = find_page(start_date, end_date, page_size + 1, cursor)
+            has_next = len(work_logs) > page_size
+            work_logs = work_logs.iloc[:page_size]
+
+            # 2: 다음 페이지 커서 = 이 페이지 마지막 행의 키
+            next_cursor = None
+            if has_next:
+                last_row = work_logs.iloc[-1]
+                next_cursor = (last_row['work_date'], int(last_row['project_id']))
+
+            return WorkLogPage(frame=self._to_past_work_frame(work_logs), next_cursor=next_cursor)
 
-            # 3: 날짜순 정렬 (최신순)
-            result.sort(key=lambda x: x['work_date'], reverse=True)
+        except Exception as e:
+            raise e
 
-            return result
+    def get_past_work_summary(self, start_date: date, end_date: date) -> Dict[str, Any]:
+        """
+        과거 작업 로그 기간 집계 (전체 행 수 / 작업일수 / 총 작업시간 / 프로젝트 수)
+        - sparse 모드: 전체 행 수 = 빈 칸 포함 편집 칸 수 (페이지 수 계산이 get_past_work_page 와 맞도록)
+        """
+        try:
+            self._validate_past_range(start_date, end_date)
+            summary = self.work_log_repo.get_range_summary(start_date, end_date)
+            if self._sparse_mode():
+                summary['total_count'] = self.work_log_repo.count_dense_slots(start_date, end_date)
+            return summary
 
         except Exception as e:
             raise e
 
+    def get_hours_by_period(self, start_date: date, end_date: date, granularity: str) -> pd.DataFrame:
+        """기간별 작업시간 구간 집계 (일/주/월 × 프로젝트, SQL 집계)"""
+        try:
+            return self.work_log_repo.aggregate_hours_by_period(start_date, end_date, granularity)
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ 구간별 작업시간 집계 실패: {str(e)}")
+
+    def get_project_burnup(self, project_id: int) -> pd.DataFrame:
+        """
+        프로젝트 번업/번다운 이력 (누적값은 SQL 윈도우 함수로 계산)
+
+        Returns:
+            DataFrame[work_date, progress_added, hours_spent, cumulative_progress,
+                      cumulative_hours, remaining_work, target_value] - 날짜순
+        """
+        try:
+            if project_id <= 0:
+                raise ValueError("⚙️❌ 잘못된 프로젝트 ID입니다")
+
+            return self.work_log_repo.find_burnup_by_project(project_id)
+
+        except ValueError as e:
+            raise e
+        except Exception as e:
+            raise Exception(f"⚙️❌ 프로젝트 번업 이력 조회 실패: {str(e)}")
+
+    def get_daily_hours(self, start_date: date, end_date: date) -> pd.DataFrame:
+        """기간 내 일별 × 프로젝트 작업시간 집계 (캘린더 히트맵용)"""
+        try:
+            return self.work_log_repo.aggregate_daily_hours(start_date, end_date)
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ 일별 작업시간 집계 실패: {str(e)}")
+
+    def search_memos(self, text: str, page: int = 1, page_size: int = 20,
+                     start_date: Optional[date] = None, end_date: Optional[date] = None,
+                     project_ids: Optional[List[int]] = None) -> MemoSearchPage:
+        """
+        메모 전문 검색 (FTS5, 관련도순) - 검색어의 모든 단어를 접두어로 포함한 메모
+
+        Args:
+            text: 사용자 검색어 (공백으로 단어 구분)
+            page: 1부터 시작하는 페이지 번호
+            start_date, end_date, project_ids: 검색 범위 (None 이면 전체)
+        """
+        try:
+            # +: 검색 조건 유효성 검사
+            match = to_match_query(text)
+            if not match:
+                raise ValueError("⚙️❌ 검색어를 입력해주세요")
+            if page < 1 or page_size <= 0:
+                raise ValueError("⚙️❌ 페이지 번호와 크기는 1 이상이어야 합니다")
+            if start_date and end_date and start_date > end_date:
+                raise ValueError("⚙️❌ 시작일이 종료일보다 늦을 수 없습니다")
+
+            # 1: 전체 결과 수 + 현재 페이지
+            total_count = self.work_log_repo.count_memo_matches(match, start_date, end_date, project_ids)
+            matches = self.work_log_repo.search_memos(
+                match, page_size, (page - 1) * page_size, start_date, end_date, project_ids
+            )
+
+            # 2: View 친화적 구조로 변환
+            return MemoSearchPage(
+                frame=self._to_memo_search_frame(matches),
+                total_count=total_count,
+                page=page,
+                page_size=page_size
+            )
+
+        except ValueError as e:
+            raise e
+        except Exception as e:
+            raise Exception(f"⚙️❌ 메모 검색 실패: {str(e)}")
+
+    @staticmethod
+    def _to_memo_search_frame(matches: pd.DataFrame) -> pd.DataFrame:
+        """검색 결과 → 표시용 컬럼 (일치 부분은 HTML 이스케이프 후 <mark> 로 강조)"""
+        work_dates = pd.to_datetime(matches['work_date'])
+        weekdays = work_dates.dt.dayofweek.map(dict(enumerate(WEEKDAYS_KR)))
+        date_labels = work_dates.dt.strftime('%Y-%m-%d') + ' (' + weekdays + ')'
+
+        highlighted = [
+            html.escape(snippet or "").replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+            for snippet in matches['snippet']
+        ]
+        return pd.DataFrame({
+            'project_id': matches['project_id'],
+            'work_date': matches['work_date'],
+            '날짜': date_labels,
+            '프로젝트명': matches['project_name'],
+            '진행량': matches['progress_added'],
+            '작업시간': matches['hours_spent'],
+            '메모': highlighted
+        })
+
+    @staticmethod
+    def _validate_past_range(start_date: date, end_date: date):
+        """과거 조회 기간 유효성 검사"""
+        if start_date > end_date:
+            raise ValueError("⚙️❌ 시작일이 종료일보다 늦을 수 없습니다")
+        if end_date > date.today():
+            raise ValueError("⚙️❌ 미래 날짜는 조회할 수 없습니다")
+
+    @staticmethod
+    def _to_past_work_frame(work_logs: pd.DataFrame) -> pd.DataFrame:
+        """Repository DataFrame → 표시용 컬럼 매핑 (날짜 문자열 + 한글 컬럼명)"""
+        # 1: 요일 포함 날짜 문자열 - "2025-01-01 (수)"
+        work_dates = pd.to_datetime(work_logs['work_date'])
+        weekdays = work_dates.dt.dayofweek.map(dict(enumerate(WEEKDAYS_KR)))
+        date_labels = work_dates.dt.strftime('%Y-%m-%d') + ' (' + weekdays + ')'
+
+        # 2: 표시용 컬럼 구성 (work_date는 date 객체 그대로 유지 - 저장 시 키로 사용)
+        return pd.DataFrame({
+            'project_id': work_logs['project_id'],
+            'work_date': work_logs['work_date'],
+            '날짜': date_labels,
+            '프로젝트명': work_logs['project_name'],
+            '진행량': work_logs['progress_added'],
+            '작업시간': work_logs['hours_spent'],
+            '메모': work_logs['memo']
+        })
+
     def update_work_logs(self, changes: List[Dict[str, Any]]) -> int:
-        """작업 로그 업데이트 (INSERT는 get_today_work_data에서 이미 처리됨)"""
+        """
+        작업 로그 업데이트 (INSERT는 get_today_work_data에서 이미 처리됨)
+        - sparse 모드: 값이 있는 칸은 upsert, 모두 비운 칸은 삭제 (빈 날은 저장하지 않음)
+        """
         try:
             # 1: 데이터 검증
             validated_changes = []
             invalid_count = 0
 
             for change in changes:
-                if self._validate_work_log_data(change):
-                    validated_changes.append(change)
+                normalized = normalize_work_log(change)
+                if normalized is not None:
+                    validated_changes.append(normalized)
                 else:
                     invalid_count += 1
 
@@ -143,6 +358,10 @@ class WorkLogService:
             if invalid_count > 0:
                 raise ValueError(f"⚙️❌ 잘못된 작업 로그 데이터 {invalid_count}개가 발견되었습니다")
 
+            # +: sparse 모드 - 저장 안 된 칸일 수 있으므로 upsert / 비운 칸은 삭제
+            if self._sparse_mode():
+                return self._save_sparse(validated_changes)
+
             # 3: 단순 업데이트만 수행 (로그는 이미 존재함이 보장됨)
             updated_count = self.work_log_repo.bulk_update(validated_changes)
 
@@ -151,41 +370,57 @@ class WorkLogService:
         except Exception as e:
             raise e
 
-    # ===== Private 헬퍼 메서드 =====
-    def _validate_work_log_data(self, data: Dict) -> bool:
-        """작업 로그 데이터 검증"""
+    def upsert_work_logs(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        작업 로그 일괄 upsert (외부 자동화 / API 용) - 없는 (프로젝트, 날짜) 는 만들고 있으면 덮어씀
+        - 한 행이라도 잘못되면 아무것도 저장하지 않음
+        - sparse 모드: 모두 비운 행은 삭제
+        """
         try:
-            # 1: 필수 필드 체크
-            required_fields = ['project_id', 'work_date', 'progress_added', 'hours_spent', 'memo']
-            if not all(field in data for field in required_fields):
-                return False
-
-            # 2: 타입 체크
-            if not isinstance(data['project_id'], int):
-                return False
-            if not isinstance(data['work_date'], date):
-                return False
-            if not isinstance(data['progress_added'], (int, float)):
-                return False
-            if not isinstance(data['hours_spent'], (int, float)):
-                return False
-            if not isinstance(data['memo'], str):
-                return False
-
-            # 3: 비즈니스 규칙 체크
-            if data['project_id'] <= 0:
-                return False
-            if data['progress_added'] < 0:
-                return False
-            if data['hours_spent'] < 0:
-                return False
-            if data['work_date'] > date.today():
-                return False
-
-            return True
-
-        except Exception:
-            return False
+            # 1: 데이터 검증 (저장 필드만 추림)
+            if not rows:
+                raise ValueError("⚙️❌ 유효한 작업 로그 데이터가 없습니다")
+
+            normalized_rows = [normalize_work_log(row) for row in rows]
+            invalid_count = sum(row is None for row in normalized_rows)
+            if invalid_count > 0:
+                raise ValueError(f"⚙️❌ 잘못된 작업 로그 데이터 {invalid_count}개가 발견되었습니다")
+            validated_rows = normalized_rows
+
+            # 2: 없는 프로젝트 검사 (FK 오류 대신 입력 오류로 보고)
+            known_ids = {project_id for project_id, _, _ in self.project_repo.find_identities()}
+            unknown_ids = sorted({row['project_id'] for row in validated_rows} - known_ids)
+            if unknown_ids:
+                raise ValueError(f"⚙️❌ 존재하지 않는 프로젝트 ID: {unknown_ids}")
+
+            # 3: 저장
+            if self._sparse_mode():
+                return self._save_sparse(validated_rows)
+            return self.work_log_repo.bulk_upsert(validated_rows)
+
+        except ValueError as e:
+            raise e
+        except Exception as e:
+            raise Exception(f"⚙️❌ 작업 로그 일괄 저장 실패: {str(e)}")
+
+    # ===== Private 헬퍼 메서드 =====
+    def _save_sparse(self, rows: List[Dict[str, Any]]) -> int:
+        """sparse 모드 저장 - 값이 있는 행은 upsert, 모두 비운 행은 삭제"""
+        filled = [row for row in rows if not self._is_empty_log(row)]
+        emptied = [(row['project_id'], row['work_date']) for row in rows if self._is_empty_log(row)]
+        self.work_log_repo.bulk_upsert(filled)
+        self.work_log_repo.delete_by_keys(emptied)
+        return len(rows)
+
+    @staticmethod
+    def _sparse_mode() -> bool:
+        """빈 날을 저장하지 않는 sparse 저장 모드 여부 (config.WORK_LOG_SPARSE)"""
+        return bool(getattr(config, "WORK_LOG_SPARSE", False))
+
+    @staticmethod
+    def _is_empty_log(data: Dict) -> bool:
+        """진행량 0, 작업시간 0, 메모 없음 - compaction 의 자리 표시용 로그 기준과 동일"""
+        return data['progress_added'] == 0 and data['hours_spent'] == 0 and not data['memo'].strip()
 
     # ===== 효율성 통계 메서드들 (dashboard 용) ====
     def get_efficiency_stats_for_projects(self, project_ids: List[int]) -> Dict[int, Dict]:
@@ -198,7 +433,9 @@ class WorkLogService:
         Returns:
             Dict[project_id, {
                 'avg_efficiency': float,      # 평균 효율성
-                'total_hours': float,         # 작업시간
+                'efficiency_std': float,      # 로그별 효율성 표준편차
+                'efficiency_count': int,      # 효율성 표본 수
+                'worked_hours': float,        # 작업시간
                 'avg_hours_per_day': float    # 일 평균 작업시간
             }]
         """
@@ -209,4 +446,40 @@ class WorkLogService:
             return self.work_log_repo.get_efficiency_stats_by_projects(project_ids)
 
         except Exception as e:
-            raise Exception(f"⚙️❌ 프로젝트 효율성 통계 조회 실패: {str(e)}")
\ No newline at end of file
+            raise Exception(f"⚙️❌ 프로젝트 효율성 통계 조회 실패: {str(e)}")
+
+    def get_rolling_stats_for_projects(self, project_ids: List[int], windows: Tuple[int, ...] = ROLLING_WINDOWS,
+                                       today: Optional[date] = None) -> Dict[int, Dict[int, Dict]]:
+        """
+        여러 프로젝트의 최근 N일 속도/효율성 통계를 한 번에 조회
+
+        Returns:
+            Dict[project_id, Dict[window, {'velocity', 'avg_hours_per_day', 'avg_efficiency',
+                                           'efficiency_std', 'efficiency_count'}]]
+        """
+        try:
+            if not project_ids:
+                return {}
+
+            return self.work_log_repo.get_rolling_stats_by_projects(
+                project_ids, today or date.today(), tuple(sorted(set(windows)))
+            )
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ 최근 구간 통계 조회 실패: {str(e)}")
+
+    def get_log_fingerprints(self, project_ids: List[int]) -> Dict[int, tuple]:
+        """프로젝트별 작업 로그 지문 조회 (시뮬레이션 캐시 무효화용)"""
+        try:
+            return self.work_log_repo.get_log_fingerprints(project_ids)
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ 작업 로그 지문 조회 실패: {str(e)}")
+
+    def get_history_for_projects(self, project_ids: List[int]) -> List[tuple]:
+        """여러 프로젝트의 작업 로그 이력 조회 (시뮬레이션용)"""
+        try:
+            return self.work_log_repo.find_history_by_projects(project_ids)
+
+        except Exception as e:
+            raise Exception(f"⚙️❌ 작업 로그 이력 조회 실패: {str(e)}")
@@ -0,0 +1,64 @@
+"""
+테스트 공통 설정
+- config.example.py 를 config 모듈로 불러와 DB / 보관소 경로만 임시 디렉토리로 바꿈 (실제 data/ 는 건드리지 않음)
+- db_manager 는 프로세스당 싱글톤 → 첫 import 전에 config 를 등록해야 하므로 모듈 로드 시점에 처리
+"""
+
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+from datetime import date, timedelta
+
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+TEST_DATA_DIR = tempfile.mkdtemp(prefix="project-tracker-test-")
+
+sys.path.insert(0, ROOT_DIR)
+
+_spec = importlib.util.spec_from_file_location("config", os.path.join(ROOT_DIR, "config.example.py"))
+config = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(config)
+config.DATABASE_PATH = os.path.join(TEST_DATA_DIR, "ProjectTracker.db")
+config.ARCHIVE_ENABLED = True
+config.ARCHIVE_PATH = os.path.join(TEST_DATA_DIR, "ProjectTracker-archive.db")
+sys.modules["config"] = config
+
+
+@pytest.fixture(scope="session")
+def seeded_db():
+    """프로젝트 6개 + 400일치 작업 로그 (일부는 보관소로 이동)"""
+    from models.database import archive
+    from models.database.connection import db_manager
+    from models.entities.project import Project
+    from models.entities.work_log import WorkLog
+
+    rng = random.Random(1)
+    today = date.today()
+    with db_manager.get_session_context() as session:
+        projects = [
+            Project(
+                name=f"프로젝트 {index}", notion_page_id=f"test-{index}",
+                status="진행 중" if index < 4 else "완료",
+                start_date=today - timedelta(days=400), end_date=today + timedelta(days=60),
+                target_value=1000, initial_progress=0
+            )
+            for index in range(6)
+        ]
+        session.add_all(projects)
+        session.flush()
+        session.add_all(
+            WorkLog(
+                project_id=project.id, work_date=today - timedelta(days=days_ago),
+                progress_added=rng.randint(0, 5), hours_spent=round(rng.random() * 3, 1),
+                memo=rng.choice(["", "리팩터링 작업", "버그 수정", "회의록 정리"])
+            )
+            for project in projects
+            for days_ago in range(400)
+            if rng.random() < 0.6
+        )
+
+    archive.run_archive(after_months=6)
+    return db_manager
@@ -0,0 +1,68 @@
+"""작업 로그 보관 - 메인 삭제 실패 시 중복 집계 방지"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, select, text
+
+from models.database import archive
+from models.entities.archived_work_log import archived_work_logs
+from models.entities.project import Project
+from models.entities.work_log import WorkLog
+from models.repositories.project_repository import ProjectRepository
+
+
+@pytest.fixture
+def project_with_old_logs(seeded_db):
+    """보관 기준보다 오래된 로그 10개를 가진 프로젝트"""
+    today = date.today()
+    with seeded_db.get_session_context() as session:
+        project = Project(
+            name="보관 실패 프로젝트", notion_page_id="test-archive-failure", status="진행 중",
+            start_date=today - timedelta(days=400), end_date=today + timedelta(days=60),
+            target_value=1000, initial_progress=0
+        )
+        session.add(project)
+        session.flush()
+        session.add_all(
+            WorkLog(project_id=project.id, work_date=today - timedelta(days=300 + offset),
+                    progress_added=offset + 1, hours_spent=1.0, memo="")
+            for offset in range(10)
+        )
+        project_id = project.id
+
+    yield project_id
+
+    with seeded_db.get_session_context() as session:
+        session.execute(text("DROP TRIGGER IF EXISTS test_block_work_log_delete"))
+        session.delete(session.get(Project, project_id))
+
+
+def _current_progress(project_id):
+    records = ProjectRepository().find_records_excluding_status("")
+    return next(record.current_progress for record in records if record.id == project_id)
+
+
+def test_failed_main_delete_leaves_progress_unchanged(seeded_db, project_with_old_logs):
+    progress_before = _current_progress(project_with_old_logs)
+
+    # 메인 삭제 단계만 실패 (잠금 대기 초과 등과 같은 상황)
+    with seeded_db.get_session_context() as session:
+        session.execute(text(
+            "CREATE TRIGGER test_block_work_log_delete BEFORE DELETE ON work_logs "
+            "BEGIN SELECT RAISE(ABORT, 'database is locked'); END"
+        ))
+
+    with pytest.raises(Exception):
+        archive.run_archive(after_months=6, include_completed=False)
+
+    assert _current_progress(project_with_old_logs) == progress_before
+    with seeded_db.get_session_context() as session:
+        archived_count = session.execute(
+            select(func.count()).where(archived_work_logs.c.project_id == project_with_old_logs)
+        ).scalar()
+        main_count = session.execute(
+            select(func.count()).where(WorkLog.project_id == project_with_old_logs)
+        ).scalar()
+    assert archived_count == 0
+    assert main_count == 10
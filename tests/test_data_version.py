@@ -0,0 +1,67 @@
+"""데이터 버전 - 쓰기 트랜잭션 커밋마다 1 증가"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import select, text
+
+from models.entities.project import Project
+from models.entities.work_log import WorkLog
+from models.repositories.work_log_repository import WorkLogRepository
+
+
+@pytest.fixture
+def project_id(seeded_db):
+    today = date.today()
+    with seeded_db.get_session_context() as session:
+        project = Project(
+            name="버전 프로젝트", notion_page_id="test-data-version", status="진행 중",
+            start_date=today - timedelta(days=400), end_date=today + timedelta(days=60),
+            target_value=1000, initial_progress=0
+        )
+        session.add(project)
+        session.flush()
+        project_id = project.id
+
+    yield project_id
+
+    with seeded_db.get_session_context() as session:
+        session.delete(session.get(Project, project_id))
+
+
+def test_bulk_write_bumps_version_once(seeded_db, project_id):
+    today = date.today()
+    rows = [
+        {'project_id': project_id, 'work_date': today - timedelta(days=days_ago),
+         'progress_added': 1, 'hours_spent': 1.0, 'memo': ""}
+        for days_ago in range(200)
+    ]
+    before = seeded_db.get_data_version()
+
+    WorkLogRepository().bulk_upsert(rows)
+
+    assert seeded_db.get_data_version() == before + 1
+
+
+def test_read_and_rolled_back_write_keep_version(seeded_db, project_id):
+    before = seeded_db.get_data_version()
+
+    with seeded_db.get_session_context() as session:
+        session.execute(select(WorkLog.id).where(WorkLog.project_id == project_id)).all()
+    with pytest.raises(Exception):
+        with seeded_db.get_session_context() as session:
+            session.add(WorkLog(project_id=project_id, work_date=date.today(), progress_added=1,
+                                hours_spent=1.0, memo=""))
+            session.flush()
+            raise RuntimeError("롤백")
+
+    assert seeded_db.get_data_version() == before
+
+
+def test_archive_only_write_bumps_version(seeded_db):
+    before = seeded_db.get_data_version()
+
+    with seeded_db.get_session_context() as session:
+        session.execute(text("UPDATE archive.work_log_rollups SET log_count = log_count"))
+
+    assert seeded_db.get_data_version() == before + 1
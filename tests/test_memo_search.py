@@ -0,0 +1,21 @@
+"""메모 전문 검색 - 메인 / 보관소 인덱스 병합 순위"""
+
+from datetime import date, timedelta
+
+from models.database.search_index import to_match_query
+from models.repositories.work_log_repository import WorkLogRepository
+
+
+def test_identical_memos_are_newest_first_across_archive(seeded_db):
+    repo = WorkLogRepository()
+    match = to_match_query("회의")
+    total = repo.count_memo_matches(match)
+
+    results = repo.search_memos(match, total)
+    work_dates = list(results['work_date'])
+
+    # 메인(최근 6개월)과 보관소 결과가 모두 있어야 병합 순위를 확인할 수 있음
+    archive_cutoff = date.today() - timedelta(days=183)
+    assert min(work_dates) < archive_cutoff < max(work_dates)
+    assert set(results['memo']) == {"회의록 정리"}
+    assert work_dates == sorted(work_dates, reverse=True)
@@ -0,0 +1,45 @@
+"""쿼리 플랜 점검 + 스키마 마이그레이션 원자성"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine
+
+from models.database import migrations
+from models.database.base import Base
+from models.repositories.plan_audit import run_plan_audit
+
+
+def test_plan_audit_all_cases_ok(seeded_db):
+    assert seeded_db.archive_attached
+
+    results = run_plan_audit()
+
+    assert results
+    problems = {result.name: result.problems for result in results if not result.ok}
+    assert not problems
+
+
+def test_failed_migration_keeps_schema_version(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_path, 'migration.db')}")
+    Base.metadata.create_all(bind=engine)
+    migrations.run_migrations(engine)
+
+    def failing_step(conn):
+        conn.exec_driver_sql("CREATE TABLE migration_probe (id INTEGER)")
+        conn.exec_driver_sql("DROP INDEX ix_work_logs_date_project")
+        raise RuntimeError("마이그레이션 실패")
+
+    failing_version = migrations.LATEST_VERSION + 1
+    monkeypatch.setattr(migrations, "MIGRATIONS", [*migrations.MIGRATIONS, (failing_version, "실패", failing_step)])
+    monkeypatch.setattr(migrations, "LATEST_VERSION", failing_version)
+
+    with pytest.raises(RuntimeError):
+        migrations.run_migrations(engine)
+
+    with engine.connect() as conn:
+        assert migrations.get_schema_version(conn) == failing_version - 1
+        names = {row[0] for row in conn.exec_driver_sql("SELECT name FROM sqlite_master")}
+    assert "migration_probe" not in names
+    assert "ix_work_logs_date_project" in names
+    engine.dispose()
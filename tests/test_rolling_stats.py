@@ -0,0 +1,60 @@
+"""최근 N일 속도 / 작업시간 통계 (구간보다 짧은 프로젝트)"""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from models.entities.project import Project
+from models.entities.work_log import WorkLog
+from models.repositories.work_log_repository import WorkLogRepository
+
+WINDOWS = (7, 30)
+
+
+@pytest.fixture
+def young_project(seeded_db):
+    """6일 전 시작해 매일 3시간 / 진행량 2 를 기록한 프로젝트"""
+    today = date.today()
+    with seeded_db.get_session_context() as session:
+        project = Project(
+            name="새 프로젝트", notion_page_id="test-young", status="진행 중",
+            start_date=today - timedelta(days=5), end_date=today + timedelta(days=60),
+            target_value=100, initial_progress=0
+        )
+        session.add(project)
+        session.flush()
+        session.add_all(
+            WorkLog(project_id=project.id, work_date=today - timedelta(days=days_ago),
+                    progress_added=2, hours_spent=3.0, memo="")
+            for days_ago in range(6)
+        )
+        project_id = project.id
+
+    yield project_id
+
+    with seeded_db.get_session_context() as session:
+        session.delete(session.get(Project, project_id))
+
+
+def test_young_project_divides_by_days_since_start(young_project):
+    stats = WorkLogRepository().get_rolling_stats_by_projects([young_project], date.today(), WINDOWS)
+
+    for window in WINDOWS:
+        assert stats[young_project][window]['avg_hours_per_day'] == pytest.approx(3.0)
+        assert stats[young_project][window]['velocity'] == pytest.approx(2.0)
+
+
+def test_older_project_divides_by_full_window(seeded_db):
+    today = date.today()
+    start = today - timedelta(days=29)
+    with seeded_db.get_session_context() as session:
+        project_id = session.execute(select(Project.id).where(Project.notion_page_id == "test-0")).scalar()
+        hours = session.execute(
+            select(func.sum(WorkLog.hours_spent))
+            .where(WorkLog.project_id == project_id, WorkLog.work_date.between(start, today))
+        ).scalar()
+
+    stats = WorkLogRepository().get_rolling_stats_by_projects([project_id], today, (30,))
+
+    assert stats[project_id][30]['avg_hours_per_day'] == pytest.approx(hours / 30)
@@ -0,0 +1,49 @@
+"""작업 로그 행 검증 (편집 화면 저장 / API upsert 공통 규칙)"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from models.entities.work_log import MEMO_MAX_LENGTH
+from models.services.work_log_service import normalize_work_log
+
+
+def _row(**overrides):
+    row = {'project_id': 1, 'work_date': date.today(), 'progress_added': 2, 'hours_spent': 1.5, 'memo': "메모"}
+    row.update(overrides)
+    return row
+
+
+def test_valid_row_is_normalized():
+    normalized = normalize_work_log(_row(project_id=np.int64(3), progress_added=3.0, extra="무시"))
+
+    assert normalized == {
+        'project_id': 3, 'work_date': date.today(), 'progress_added': 3, 'hours_spent': 1.5, 'memo': "메모"
+    }
+    assert type(normalized['progress_added']) is int
+
+
+@pytest.mark.parametrize("overrides", [
+    {'project_id': True},
+    {'project_id': "1"},
+    {'project_id': 0},
+    {'progress_added': True},
+    {'progress_added': 1.5},
+    {'progress_added': -1},
+    {'hours_spent': False},
+    {'hours_spent': float("nan")},
+    {'hours_spent': -0.5},
+    {'work_date': date.today() + timedelta(days=1)},
+    {'work_date': "2024-01-01"},
+    {'memo': None},
+    {'memo': "가" * (MEMO_MAX_LENGTH + 1)},
+])
+def test_invalid_row_is_rejected(overrides):
+    assert normalize_work_log(_row(**overrides)) is None
+
+
+def test_missing_field_is_rejected():
+    row = _row()
+    del row['hours_spent']
+    assert normalize_work_log(row) is None
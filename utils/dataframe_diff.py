@@ -0,0 +1,56 @@
+"""
+data_editor 변경 감지 - 행 단위 반복 없이 컬럼 단위 벡터 비교
+- 숫자 컬럼: float64로 정규화 후 비교 (3 == 3.0, NaN == NaN)
+- 문자 컬럼: None/NaN → "" 로 정규화 후 비교
+- 에디터의 edited_rows 델타가 있으면 해당 행만 비교
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+
+def find_changed_rows(
+    original_df: pd.DataFrame,
+    edited_df: pd.DataFrame,
+    value_columns: Iterable[str],
+    edited_rows: Optional[Dict] = None
+) -> pd.DataFrame:
+    """
+    편집 가능한 컬럼 값이 실제로 바뀐 행만 반환 (edited_df 기준, 원래 순서 유지)
+
+    Args:
+        original_df: 에디터에 전달한 원본 DataFrame
+        edited_df: 에디터가 반환한 DataFrame (행 순서/개수 동일)
+        value_columns: 비교할 편집 가능 컬럼
+        edited_rows: st.session_state[editor_key]['edited_rows'] (행 위치 → 변경 셀)
+    """
+    # 1: 비교 대상 행 (델타가 있으면 편집된 행 위치만)
+    if edited_rows is not None:
+        positions = sorted(int(position) for position in edited_rows if int(position) < len(edited_df))
+        if not positions:
+            return edited_df.iloc[0:0]
+        original_df = original_df.iloc[positions]
+        edited_df = edited_df.iloc[positions]
+
+    # 2: 컬럼별 차이 마스크 OR 결합 (인덱스 정렬 없이 위치 기준 비교)
+    changed = np.zeros(len(edited_df), dtype=bool)
+    for column in value_columns:
+        changed |= _column_differs(original_df[column], edited_df[column])
+
+    return edited_df[changed]
+
+
+def _column_differs(original: pd.Series, edited: pd.Series) -> np.ndarray:
+    """컬럼 값 비교 (타입 정규화 + NaN 안전)"""
+    if is_numeric_dtype(original) or is_numeric_dtype(edited):
+        before = pd.to_numeric(original, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        after = pd.to_numeric(edited, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        both_missing = np.isnan(before) & np.isnan(after)
+        return (before != after) & ~both_missing
+
+    before = original.fillna("").astype(str).to_numpy()
+    after = edited.fillna("").astype(str).to_numpy()
+    return before != after
@@ -0,0 +1,375 @@
+"""
+메트릭 수집 및 Prometheus 텍스트 포맷 노출
+- 외부 의존성 없이 Counter / Histogram / Gauge 제공
+- Streamlit 서버와 같은 프로세스에서 로컬 포트로 /metrics 서빙
+"""
+
+import functools
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape_label_value(value) -> str:
+    """라벨 값 이스케이프 (역슬래시, 큰따옴표, 줄바꿈)"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Metric:
+    """메트릭 공통 기능 - 이름, 설명, 라벨 관리"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _label_key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        """라벨 딕셔너리를 정해진 순서의 튜플로 변환"""
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def _format_labels(self, key: Tuple[str, ...], extra: Optional[Dict[str, str]] = None) -> str:
+        """Prometheus 라벨 문자열 생성 - {a="1",b="2"}"""
+        pairs = list(zip(self.label_names, key))
+        if extra:
+            pairs.extend(extra.items())
+        if not pairs:
+            return ""
+        escaped = [f'{name}="{_escape_label_value(value)}"' for name, value in pairs]
+        return "{" + ",".join(escaped) + "}"
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{self._format_labels(key)} {value}")
+        return lines
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (지연 시간 측정용)"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # key → [버킷별 카운트..., 합계, 전체 카운트]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._label_key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = [0.0] * (len(self.buckets) + 2)
+                self._values[key] = state
+            for i, upper in enumerate(self.buckets):
+                if value <= upper:
+                    state[i] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def time(self, **labels):
+        """with 문으로 구간 시간 측정"""
+        return _Timer(self, labels)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        for key, state in items:
+            for i, upper in enumerate(self.buckets):
+                lines.append(f"{self.name}_bucket{self._format_labels(key, {'le': repr(upper)})} {state[i]}")
+            lines.append(f"{self.name}_bucket{self._format_labels(key, {'le': '+Inf'})} {state[-1]}")
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {state[-2]}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {state[-1]}")
+        return lines
+
+
+class Gauge(_Metric):
+    """현재값 게이지 - 직접 설정하거나 수집 시점 콜백으로 계산"""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._callbacks: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def set_function(self, func: Callable[[], float], **labels) -> None:
+        """수집(scrape) 시점에 호출될 콜백 등록"""
+        key = self._label_key(labels)
+        with self._lock:
+            self._callbacks[key] = func
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            values = dict(self._values)
+            callbacks = list(self._callbacks.items())
+        for key, func in callbacks:
+            try:
+                values[key] = float(func())
+            except Exception:
+                continue
+        for key, value in values.items():
+            lines.append(f"{self.name}{self._format_labels(key)} {value}")
+        return lines
+
+
+class _Timer:
+    """Histogram.time() 컨텍스트 매니저"""
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 전체 렌더링"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    def gauge(self, name: str, documentation: str, label_names: Tuple[str, ...] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, label_names))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷(0.0.4) 생성"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# =============================================================================
+# 전역 레지스트리 및 애플리케이션 메트릭
+# =============================================================================
+
+registry = MetricsRegistry()
+
+page_render_seconds = registry.histogram(
+    "projecttracker_page_render_seconds",
+    "Streamlit 페이지 렌더링(rerun) 소요 시간",
+    ("page",)
+)
+controller_latency_seconds = registry.histogram(
+    "projecttracker_controller_latency_seconds",
+    "컨트롤러 메서드 처리 시간",
+    ("controller", "method")
+)
+controller_errors_total = registry.counter(
+    "projecttracker_controller_errors_total",
+    "컨트롤러 메서드 실패 횟수",
+    ("controller", "method")
+)
+sql_queries_total = registry.counter(
+    "projecttracker_sql_queries_total",
+    "실행된 SQL 문 수 (종류별)",
+    ("statement",)
+)
+cache_requests_total = registry.counter(
+    "projecttracker_cache_requests_total",
+    "캐시 조회 결과 (hit/miss)",
+    ("cache", "result")
+)
+cache_evictions_total = registry.counter(
+    "projecttracker_cache_evictions_total",
+    "캐시 무효화(삭제) 횟수",
+    ("cache",)
+)
+notion_sync_seconds = registry.histogram(
+    "projecttracker_notion_sync_seconds",
+    "노션 동기화 소요 시간",
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+)
+notion_sync_total = registry.counter(
+    "projecttracker_notion_sync_total",
+    "노션 동기화 실행 횟수 (결과별)",
+    ("result",)
+)
+notion_sync_projects_total = registry.counter(
+    "projecttracker_notion_sync_projects_total",
+    "노션 동기화로 변경된 프로젝트 수",
+    ("action",)
+)
+db_file_bytes = registry.gauge(
+    "projecttracker_db_file_bytes",
+    "SQLite 파일 크기 (main/wal)",
+    ("file",)
+)
+backup_seconds = registry.histogram(
+    "projecttracker_backup_seconds",
+    "온라인 백업 소요 시간",
+    buckets=(0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0)
+)
+backup_total = registry.counter(
+    "projecttracker_backup_total",
+    "온라인 백업 실행 횟수 (결과별)",
+    ("result",)
+)
+backup_last_success_timestamp = registry.gauge(
+    "projecttracker_backup_last_success_timestamp_seconds",
+    "마지막 백업 성공 시각 (Unix time)"
+)
+maintenance_seconds = registry.histogram(
+    "projecttracker_maintenance_seconds",
+    "DB 유지보수 작업 소요 시간",
+    ("task",)
+)
+maintenance_total = registry.counter(
+    "projecttracker_maintenance_total",
+    "DB 유지보수 작업 실행 횟수 (작업/결과별)",
+    ("task", "result")
+)
+
+
+# =============================================================================
+# 헬퍼
+# =============================================================================
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """세션 캐시 조회 결과 기록"""
+    cache_requests_total.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_cache_eviction(cache: str) -> None:
+    """세션 캐시 삭제 기록"""
+    cache_evictions_total.inc(cache=cache)
+
+
+def track_controller(func):
+    """컨트롤러 메서드 지연 시간/실패 횟수 측정 데코레이터"""
+    controller, _, method = func.__qualname__.rpartition(".")
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            controller_errors_total.inc(controller=controller, method=method)
+            raise
+        finally:
+            controller_latency_seconds.observe(
+                time.perf_counter() - start,
+                controller=controller,
+                method=method
+            )
+
+    return wrapper
+
+
+# =============================================================================
+# HTTP 익스포터
+# =============================================================================
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics 요청 처리"""
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+
+        body = registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 스크레이프 요청마다 로그가 쌓이지 않도록 무시
+        pass
+
+
+def start_metrics_server(host: str = "127.0.0.1", port: int = 9464) -> Optional[ThreadingHTTPServer]:
+    """메트릭 HTTP 서버를 데몬 스레드로 시작 (프로세스당 1회)"""
+    global _server
+    logger = logging.getLogger(__name__)
+
+    with _server_lock:
+        if _server is not None:
+            return _server
+
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            _server.daemon_threads = True
+        except OSError as e:
+            logger.error(f"📈❌ 메트릭 서버 시작 실패 ({host}:{port}): {str(e)}")
+            return None
+
+        thread = threading.Thread(target=_server.serve_forever, name="metrics-exporter", daemon=True)
+        thread.start()
+        logger.info(f"📈✅ 메트릭 서버 시작: http://{host}:{port}/metrics")
+        return _server
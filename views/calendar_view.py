@@ -0,0 +1,135 @@
+import streamlit as st
+import plotly.graph_objects as go
+from datetime import date, timedelta
+
+from controllers.calendar_controller import CalendarController
+from models.dto import CalendarHeatmap
+from utils import metrics
+
+WEEKDAYS_KR = ['월', '화', '수', '목', '금', '토', '일']
+
+# 기간 선택지 (일수)
+PERIOD_OPTIONS = {
+    "최근 1년": 365,
+    "최근 2년": 730,
+    "최근 3년": 1095
+}
+
+
+class CalendarView:
+    def __init__(self):
+        from config import get_logger
+        self.logger = get_logger(__name__)
+        self.controller = CalendarController()
+
+    def render(self):
+        """작업 캘린더 페이지 메인 렌더링"""
+        st.title("🗓️ 작업 캘린더")
+        st.markdown("---")
+
+        # +: 다른 페이지 변경 감지 (프로젝트 목록 캐시 무효화)
+        self._check_auto_refresh()
+
+        self._render_calendar_section()
+
+    def _check_auto_refresh(self):
+        """프로젝트 동기화/수정 시 필터용 프로젝트 목록 캐시 삭제"""
+        if hasattr(st.session_state, 'project_updated_calendar'):
+            self._clear_project_options_cache()
+            del st.session_state.project_updated_calendar
+
+    def _render_calendar_section(self):
+        """캘린더 히트맵 섹션 (일별 작업시간 - 데이터 버전 기준 서버 캐시)"""
+        try:
+            col1, col2 = st.columns([1, 3])
+
+            # 1: 기간 선택
+            with col1:
+                selected_period = st.selectbox(
+                    "📅 기간 선택",
+                    options=list(PERIOD_OPTIONS.keys()),
+                    index=0,
+                    label_visibility="collapsed"
+                )
+            end_date = date.today()
+            start_date = end_date - timedelta(days=PERIOD_OPTIONS[selected_period] - 1)
+
+            # 2: 프로젝트 필터 (목록은 세션 캐시)
+            cache_key = 'calendar_projects'
+            cache_hit = cache_key in st.session_state
+            metrics.record_cache_lookup(cache_key, cache_hit)
+            if not cache_hit:
+                st.session_state[cache_key] = self.controller.get_project_options()
+            projects = st.session_state[cache_key]
+
+            project_names = {project.id: project.name for project in projects}
+            with col2:
+                selected_ids = st.multiselect(
+                    "프로젝트 필터",
+                    options=list(project_names.keys()),
+                    format_func=lambda project_id: project_names[project_id],
+                    placeholder="전체 프로젝트",
+                    label_visibility="collapsed",
+                    key="calendar_project_filter"
+                )
+
+            # 3: 히트맵 데이터 조회 (선택 없음 = 전체)
+            heatmap = self.controller.get_calendar_heatmap(start_date, end_date, selected_ids or None)
+
+            # 4: 히트맵 + 요약
+            st.plotly_chart(self._build_heatmap_figure(heatmap), use_container_width=True)
+            self._render_summary(heatmap)
+
+            self.logger.debug("✅ 캘린더 섹션 렌더링 성공")
+
+        except Exception as e:
+            self.logger.error(f"❌ 캘린더 섹션 렌더링 실패: {str(e)}")
+            st.error("작업 캘린더를 불러오는데 실패했습니다.")
+
+    @staticmethod
+    def _build_heatmap_figure(heatmap: CalendarHeatmap) -> go.Figure:
+        """요일 × 주 히트맵 (GitHub 잔디 형태, 기간 밖 칸은 빈 칸)"""
+        date_labels = heatmap.dates.astype(str)
+
+        fig = go.Figure(go.Heatmap(
+            z=heatmap.hours,
+            x=heatmap.week_starts,
+            y=WEEKDAYS_KR,
+            customdata=date_labels,
+            colorscale="Greens",
+            zmin=0,
+            xgap=2,
+            ygap=2,
+            hoverongaps=False,
+            colorbar=dict(title="시간"),
+            hovertemplate="%{customdata}<br>%{z:.1f}h<extra></extra>"
+        ))
+
+        fig.update_layout(
+            height=260,
+            margin=dict(l=40, r=20, t=20, b=30),
+            plot_bgcolor="rgba(0,0,0,0)"
+        )
+        fig.update_yaxes(autorange="reversed", showgrid=False)
+        fig.update_xaxes(tickformat="%Y-%m", showgrid=False)
+        return fig
+
+    @staticmethod
+    def _render_summary(heatmap: CalendarHeatmap):
+        """기간 요약 표시"""
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("총 작업시간", f"{heatmap.total_hours:.1f}h")
+        with col2:
+            st.metric("작업한 날", f"{heatmap.active_days}일")
+        with col3:
+            st.metric("최장 연속 작업", f"{heatmap.longest_streak}일")
+        with col4:
+            st.metric("하루 최대", f"{heatmap.max_daily_hours:.1f}h")
+
+    def _clear_project_options_cache(self):
+        """필터용 프로젝트 목록 캐시 무효화"""
+        if 'calendar_projects' in st.session_state:
+            del st.session_state['calendar_projects']
+            metrics.record_cache_eviction('calendar_projects')
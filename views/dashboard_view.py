@@ -5,6 +5,19 @@ from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Any
 
 from controllers.dashboard_controller import DashboardController
+from utils import metrics
+
+# 타임라인 집계 단위 (표시명 → 요청값)
+GRANULARITY_OPTIONS = {"자동": "auto", "일별": "day", "주별": "week", "월별": "month"}
+GRANULARITY_LABELS = {"day": "일별", "week": "주별", "month": "월별"}
+
+# 타임라인 차트 종류
+TIMELINE_CHART_TYPES = ["선", "누적 영역", "히트맵", "누적 합계"]
+
+# 전체 포인트가 이보다 많으면 WebGL(scattergl)로 렌더링
+WEBGL_POINT_THRESHOLD = 1000
+# 시리즈당 포인트(구간 수)가 이 이하일 때만 마커 표시
+MARKER_POINT_LIMIT = 60
 
 
 class DashboardView:
@@ -31,6 +44,7 @@ class DashboardView:
         self._render_work_log_summary()
         self._render_projects_table()
         self._render_projects_chart()
+        self._render_deadline_risk_section()
         self._render_timeline_section()
 
         # 5: 렌더링 완료 로그
@@ -99,7 +113,9 @@ class DashboardView:
             cache_key = f'dashboard_work_logs_{today.strftime("%Y-%m-%d")}'
 
             # 2: 캐싱된 데이터 로드
-            if cache_key not in st.session_state:
+            cache_hit = cache_key in st.session_state
+            metrics.record_cache_lookup("dashboard_work_logs", cache_hit)
+            if not cache_hit:
                 summary = self.controller.get_work_log_summary()
                 st.session_state[cache_key] = summary
             else:
@@ -150,7 +166,7 @@ class DashboardView:
     def _render_projects_table(self):
         """
         프로젝트 현황 테이블 렌더링
-        - project_id, 프로젝트명, D-Day, 목표치, 현재값, 진행도, 작업시간, 필요시간, 예상 마감일
+        - project_id, 프로젝트명, D-Day, 목표치, 현재값, 진행률, 작업시간, 필요시간, 예상 마감일 (+ 신뢰구간)
 
         캐시: dashboard_projects_YYYY-MM-DD
         """
@@ -163,7 +179,9 @@ class DashboardView:
             cache_key = f'dashboard_projects_{today.strftime("%Y-%m-%d")}'
 
             # 2: 캐싱된 데이터 로드
-            if cache_key not in st.session_state:
+            cache_hit = cache_key in st.session_state
+            metrics.record_cache_lookup("dashboard_projects", cache_hit)
+            if not cache_hit:
                 projects_data = self.controller.get_projects_summary()
                 st.session_state[cache_key] = projects_data
             else:
@@ -174,20 +192,45 @@ class DashboardView:
                 st.info("진행 중인 프로젝트가 없습니다.")
                 return
 
-            # 프로젝트 테이블 표시
-            df = pd.DataFrame(projects_data)
+            # 프로젝트 테이블 표시 (숫자 → 표시 포맷은 column_config에서 처리)
+            df = pd.DataFrame([
+                {
+                    'project_id': summary.project_id,
+                    '프로젝트명': summary.name,
+                    'D-Day': summary.d_day_display,
+                    '목표치': summary.target_value,
+                    '현재값': summary.current_progress,
+                    '진행률': summary.progress_rate,
+                    '작업시간': summary.worked_hours,
+                    '필요시간': summary.required_hours,
+                    '예상 마감일': summary.estimated_completion_date,
+                    '빠른 마감': summary.completion_date_low,
+                    '늦은 마감': summary.completion_date_high,
+                    '속도(7일)': summary.velocity_7d,
+                    '속도(30일)': summary.velocity_30d,
+                    '효율(30일)': summary.efficiency_30d,
+                    '예측 기준': f"최근 {summary.forecast_window_days}일" if summary.forecast_window_days else "전체 이력"
+                }
+                for summary in projects_data
+            ])
             st.dataframe(
                 df,
                 column_config={
                     "project_id": None,
                     "프로젝트명": st.column_config.TextColumn(width="medium"),
                     "D-Day": st.column_config.TextColumn(width="small"),
-                    "목표치": st.column_config.TextColumn(width="small"),
-                    "현재값": st.column_config.TextColumn(width="small"),
-                    "진행도": st.column_config.NumberColumn(min_value=0, max_value=100, step=0.1, format="%.1f%%", width="small"),
+                    "목표치": st.column_config.NumberColumn(width="small"),
+                    "현재값": st.column_config.NumberColumn(width="small"),
+                    "진행률": st.column_config.NumberColumn(format="%.1f%%", width="small"),
                     "작업시간" : None,
-                    "필요시간": st.column_config.TextColumn(width="small"),
-                    "예상 마감일": st.column_config.DateColumn(format="YYYY-MM-DD", width="large")
+                    "필요시간": st.column_config.NumberColumn(format="%.1fh", width="small"),
+                    "예상 마감일": st.column_config.DateColumn(format="YYYY-MM-DD", width="medium"),
+                    "빠른 마감": st.column_config.DateColumn(format="YYYY-MM-DD", width="small", help="효율성 95% 신뢰구간 상한 기준"),
+                    "늦은 마감": st.column_config.DateColumn(format="YYYY-MM-DD", width="small", help="효율성 95% 신뢰구간 하한 기준 (비어 있으면 상한 없음)"),
+                    "속도(7일)": st.column_config.NumberColumn(format="%.2f", width="small", help="최근 7일 일평균 진행량"),
+                    "속도(30일)": st.column_config.NumberColumn(format="%.2f", width="small", help="최근 30일 일평균 진행량"),
+                    "효율(30일)": st.column_config.NumberColumn(format="%.2f", width="small", help="최근 30일 시간당 진행량"),
+                    "예측 기준": st.column_config.TextColumn(width="small", help="예상 마감일 계산에 사용한 이력 구간")
                 },
                 use_container_width=True,
                 hide_index=True
@@ -217,7 +260,9 @@ class DashboardView:
             cache_key = f'dashboard_chart_{today.strftime("%Y-%m-%d")}'
 
             # 2: 캐싱된 데이터 로드
-            if cache_key not in st.session_state:
+            cache_hit = cache_key in st.session_state
+            metrics.record_cache_lookup("dashboard_chart", cache_hit)
+            if not cache_hit:
                 chart_data = self.controller.get_chart_data()
                 st.session_state[cache_key] = chart_data
             else:
@@ -229,8 +274,12 @@ class DashboardView:
                 st.info("차트 데이터가 없습니다.")
                 return
 
-            # 데이터프레임 생성
-            df = pd.DataFrame(chart_data)
+            # 데이터프레임 생성 (필요시간 없음 → 0)
+            df = pd.DataFrame({
+                '프로젝트명': [summary.name for summary in chart_data],
+                '작업시간': [summary.worked_hours for summary in chart_data],
+                '필요시간': [summary.required_hours or 0.0 for summary in chart_data]
+            })
 
             # Plotly 누적 막대차트 생성
             fig = px.bar(
@@ -268,12 +317,71 @@ class DashboardView:
             self.logger.error(f"❌ 차트 섹션 렌더링 실패: {str(e)}")
             st.error("차트 데이터를 불러오는데 실패했습니다.")
 
+    def _render_deadline_risk_section(self):
+        """
+        프로젝트별 마감 리스크 렌더링 (몬테카를로 시뮬레이션)
+        - P50 / P90 완료일, 마감일 초과 확률
+
+        캐시: dashboard_risks_YYYY-MM-DD
+        """
+        try:
+            st.markdown("---")
+            st.subheader("마감 리스크")
+
+            # 1: 캐시 키 생성
+            today = date.today()
+            cache_key = f'dashboard_risks_{today.strftime("%Y-%m-%d")}'
+
+            # 2: 캐싱된 데이터 로드
+            cache_hit = cache_key in st.session_state
+            metrics.record_cache_lookup("dashboard_risks", cache_hit)
+            if not cache_hit:
+                risks = self.controller.get_deadline_risks()
+                st.session_state[cache_key] = risks
+            else:
+                risks = st.session_state[cache_key]
+
+            # 3: UI 렌더링
+            if not risks:
+                st.info("진행 중인 프로젝트가 없습니다.")
+                return
+
+            df = pd.DataFrame([
+                {
+                    '프로젝트명': risk.name,
+                    '마감일': risk.end_date,
+                    'P50 완료일': risk.p50_date,
+                    'P90 완료일': risk.p90_date,
+                    '마감 초과 확률': risk.miss_probability * 100 if risk.miss_probability is not None else None
+                }
+                for risk in risks
+            ])
+            st.dataframe(
+                df,
+                column_config={
+                    "프로젝트명": st.column_config.TextColumn(width="medium"),
+                    "마감일": st.column_config.DateColumn(format="YYYY-MM-DD", width="small"),
+                    "P50 완료일": st.column_config.DateColumn(format="YYYY-MM-DD", width="small"),
+                    "P90 완료일": st.column_config.DateColumn(format="YYYY-MM-DD", width="small", help="비어 있으면 시뮬레이션 기간 내 완료 불가 또는 데이터 없음"),
+                    "마감 초과 확률": st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100)
+                },
+                use_container_width=True,
+                hide_index=True
+            )
+            st.caption(f"과거 일일 작업시간 · 로그별 효율성 복원추출, 프로젝트당 {risks[0].trials:,}회 시뮬레이션")
+
+            self.logger.debug("✅ 마감 리스크 섹션 렌더링 성공")
+
+        except Exception as e:
+            self.logger.error(f"❌ 마감 리스크 섹션 렌더링 실패: {str(e)}")
+            st.error("마감 리스크를 불러오는데 실패했습니다.")
+
     def _render_timeline_section(self):
         """
         기간별 투입시간 추이 섹션 렌더링 (수동 로딩)
-        - 기간 선택 (7일/15일/30일/사용자지정)
+        - 기간 선택 (7일/15일/30일/사용자지정) + 집계 단위 (자동/일/주/월)
         - 조회 버튼
-        - Plotly 선차트
+        - Plotly 선 / 누적 영역 / 히트맵 / 누적 합계 (0으로 채운 구간 × 프로젝트 행렬, 포인트가 많으면 WebGL)
 
         캐시: timeline_data
         """
@@ -281,7 +389,7 @@ class DashboardView:
             st.markdown("---")
             st.subheader("기간별 작업시간 추이")
 
-            col1, col2 = st.columns([3, 1])
+            col1, col2, col3 = st.columns([3, 1, 1])
 
             with col1:
                 period_options = {
@@ -312,7 +420,6 @@ class DashboardView:
                         value=date.today(),             # 오늘까지
                         key="timeline_end_date"
                     )
-                days = (end_date - start_date).days + 1
 
             else:
                 days = period_options[selected_period]
@@ -320,58 +427,52 @@ class DashboardView:
                 start_date = end_date - timedelta(days=days-1)
 
             with col2:
+                granularity_label = st.selectbox(
+                    "집계 단위",
+                    options=list(GRANULARITY_OPTIONS.keys()),
+                    index=0,
+                    label_visibility="collapsed",
+                    key="timeline_granularity"
+                )
+
+            with col3:
                 search_button = st.button("🔍 조회", type="primary", use_container_width=True)
 
-            # 2: 타임라인 데이터 가져오기
+            # 2: 타임라인 데이터 가져오기 (SQL 구간 집계)
             if search_button:
-                timeline_data = self.controller.get_timeline_data(start_date, end_date)
+                timeline_data = self.controller.get_timeline_data(
+                    start_date, end_date, GRANULARITY_OPTIONS[granularity_label]
+                )
                 st.session_state.timeline_data = timeline_data              # 세션 상태에 저장
             else:
                 timeline_data = st.session_state.get('timeline_data')       # 캐시에서 빠른 로드
 
             # 3: UI 렌더링 (데이터가 있을 때만)
-            if timeline_data:
-                if not timeline_data:
+            if timeline_data is not None:
+                days = timeline_data.days
+                if timeline_data.empty:
                     st.info("선택한 기간에 데이터가 없습니다.")
                     return
 
-                # 데이터프레임 생성
-                df = pd.DataFrame(timeline_data)
-
-                # Plotly 선 그래프 생성
-                fig = px.line(
-                    df,
-                    x='날짜',
-                    y='작업시간',
-                    color='프로젝트명',
-                    title=f"최근 {days}일간 프로젝트별 일일 작업시간",
-                    markers=True,
-                    labels={
-                        '작업시간': '작업시간 (h)',
-                        '날짜': '날짜',
-                        '프로젝트명': '프로젝트'
-                    }
-                )
-
-                # 차트 레이아웃 설정
-                fig.update_layout(
-                    xaxis_title="날짜",
-                    yaxis_title="작업시간 (h)",
-                    legend_title="프로젝트",
-                    hovermode='x unified',
-                    height=500
+                # 차트 종류 선택 (모두 같은 밀집 행렬 사용)
+                chart_type = st.radio(
+                    "차트 종류",
+                    options=TIMELINE_CHART_TYPES,
+                    horizontal=True,
+                    label_visibility="collapsed",
+                    key="timeline_chart_type"
                 )
 
-                # X축 날짜 형식 설정
-                fig.update_xaxes(tickformat='%m-%d')
+                unit_label = GRANULARITY_LABELS[timeline_data.granularity]
+                fig = self._build_timeline_figure(timeline_data, chart_type, unit_label)
 
                 # 차트 표시
                 st.plotly_chart(fig, use_container_width=True)
 
-                # 타임라인 요약 정보
-                worked_hours = sum(item['작업시간'] for item in timeline_data)
-                avg_hours_per_day = worked_hours / days
-                worked_projects = len(set(item['프로젝트명'] for item in timeline_data if item['작업시간'] > 0))
+                # 타임라인 요약 정보 (차트와 같은 행렬 기준, 작업 안 한 날 포함 평균)
+                worked_hours = timeline_data.total_hours
+                avg_hours_per_day = timeline_data.avg_hours_per_day
+                worked_projects = timeline_data.worked_projects
 
                 st.markdown(f"### 📊 최근 {days}일 요약")
 
@@ -385,7 +486,10 @@ class DashboardView:
                     st.metric("총 작업시간", f"{worked_hours:.1f}h")
 
                 # 데이터 로드 시간 표시
-                st.caption(f"📅 데이터 로드 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                st.caption(
+                    f"📅 데이터 로드 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} · "
+                    f"집계 단위: {unit_label}"
+                )
 
             else:
                 st.info("기간을 선택하고 '조회' 버튼을 클릭하세요.")
@@ -396,6 +500,60 @@ class DashboardView:
             self.logger.error(f"❌ 타임라인 섹션 렌더링 실패: {str(e)}")
             st.error("타임라인 섹션을 불러오는데 실패했습니다.")
 
+    @staticmethod
+    def _build_timeline_figure(timeline_data, chart_type: str, unit_label: str):
+        """밀집 행렬(구간 × 프로젝트) → Plotly 차트 (선 / 누적 영역 / 히트맵 / 누적 합계)"""
+        matrix = timeline_data.matrix
+        title = f"최근 {timeline_data.days}일간 프로젝트별 {unit_label} 작업시간"
+        tick_format = '%Y-%m' if timeline_data.granularity == "month" else '%m-%d'
+
+        # 1: 히트맵 (행: 프로젝트, 열: 구간)
+        if chart_type == "히트맵":
+            fig = px.imshow(
+                matrix.T,
+                aspect="auto",
+                color_continuous_scale="Greens",
+                labels={'x': '날짜', 'y': '프로젝트', 'color': '작업시간 (h)'},
+                title=title
+            )
+            fig.update_layout(height=max(300, 40 * matrix.shape[1] + 150))
+            fig.update_xaxes(tickformat=tick_format)
+            return fig
+
+        # 2: 선 / 누적 영역 / 누적 합계 (wide 형태 그대로 전달)
+        # 포인트 수에 따라 렌더링 방식 결정 (많으면 WebGL, 마커 생략)
+        use_webgl = matrix.size > WEBGL_POINT_THRESHOLD
+        show_markers = len(matrix) <= MARKER_POINT_LIMIT
+
+        if chart_type == "누적 영역":
+            fig = px.area(matrix, title=title)
+        elif chart_type == "누적 합계":
+            fig = px.line(
+                timeline_data.cumulative,
+                title=f"최근 {timeline_data.days}일간 프로젝트별 누적 작업시간",
+                render_mode="webgl" if use_webgl else "auto"
+            )
+        else:
+            fig = px.line(
+                matrix,
+                title=title,
+                markers=show_markers,
+                render_mode="webgl" if use_webgl else "auto"
+            )
+
+        # 차트 레이아웃 설정
+        fig.update_layout(
+            xaxis_title="날짜",
+            yaxis_title="작업시간 (h)",
+            legend_title="프로젝트",
+            hovermode='x unified',
+            height=500
+        )
+
+        # X축 날짜 형식 설정 (월 단위는 연-월)
+        fig.update_xaxes(tickformat=tick_format)
+        return fig
+
     # ===== 이벤트 핸들러 =====
     def _handle_refresh_button(self):
         """
@@ -417,35 +575,39 @@ class DashboardView:
     def _clear_worklog_affected_cache(self):
         """
         WorkLog 변경시 영향받는 캐시 삭제
-        삭제 대상: summary, projects, charts (3개)
+        삭제 대상: summary, projects, charts, risks (4개)
         이유: 작업시간 변경 → 모든 통계에 영향
         """
         today = date.today().strftime("%Y-%m-%d")
         keys_to_remove = [
             f'dashboard_work_logs_{today}',
             f'dashboard_projects_{today}',
-            f'dashboard_chart_{today}'
+            f'dashboard_chart_{today}',
+            f'dashboard_risks_{today}'
         ]
 
         for key in keys_to_remove:
             if key in st.session_state:
                 del st.session_state[key]
+                metrics.record_cache_eviction(self._cache_name(key))
 
     def _clear_project_affected_cache(self):
         """
         Project 변경시 영향받는 캐시 삭제
-        삭제 대상: projects, charts (2개)
+        삭제 대상: projects, charts, risks (3개)
         유지 대상: summary (실제 작업시간은 변하지 않음)
         """
         today = date.today().strftime("%Y-%m-%d")
         keys_to_remove = [
             f'dashboard_projects_{today}',
-            f'dashboard_chart_{today}'
+            f'dashboard_chart_{today}',
+            f'dashboard_risks_{today}'
         ]
 
         for key in keys_to_remove:
             if key in st.session_state:
                 del st.session_state[key]
+                metrics.record_cache_eviction(self._cache_name(key))
 
     def _clear_all_dashboard_cache(self):
         """
@@ -467,4 +629,12 @@ class DashboardView:
         # 캐시 삭제
         for key in keys_to_remove:
             if key in st.session_state:
-                del st.session_state[key]
\ No newline at end of file
+                del st.session_state[key]
+                metrics.record_cache_eviction(self._cache_name(key))
+
+    @staticmethod
+    def _cache_name(cache_key: str) -> str:
+        """메트릭 라벨용 캐시 이름 (날짜 접미사 제거)"""
+        if cache_key.startswith('dashboard_'):
+            return cache_key.rsplit('_', 1)[0]
+        return cache_key
\ No newline at end of file
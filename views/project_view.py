@@ -1,10 +1,13 @@
 import streamlit as st
 import pandas as pd
+import plotly.graph_objects as go
 from datetime import date, timedelta
 from typing import Dict, List, Any
 
 from controllers.project_controller import ProjectController
 from models.entities.project import Project
+from utils import metrics
+from utils.dataframe_diff import find_changed_rows
 
 
 class ProjectView:
@@ -41,6 +44,7 @@ class ProjectView:
         self._render_sync_section()
         self._render_active_projects()
         self._render_archived_projects()
+        self._render_project_detail()
 
     def _check_auto_refresh(self):
         """
@@ -81,7 +85,9 @@ class ProjectView:
 
             # 1: 진행 중 프로젝트 데이터 캐싱
             cache_key = 'active_projects'
-            if cache_key not in st.session_state:
+            cache_hit = cache_key in st.session_state
+            metrics.record_cache_lookup(cache_key, cache_hit)
+            if not cache_hit:
                 active_projects = self.controller.get_active_projects()
                 st.session_state[cache_key] = active_projects
             else:
@@ -92,14 +98,14 @@ class ProjectView:
                 table_data = []
                 for project in active_projects:
                     table_data.append({
-                        "ID": project["id"],
-                        "프로젝트명": project["name"],
-                        "시작날짜": str(project["start_date"]),
-                        "종료날짜": str(project["end_date"]),
-                        "D-day": project["d_day_display"],
-                        "초기값": project["initial_progress"],    # 편집 가능
-                        "현재값": project["current_progress"],    # 읽기 전용 (계산값)
-                        "목표치": project["target_value"]         # 편집 가능
+                        "ID": project.id,
+                        "프로젝트명": project.name,
+                        "시작날짜": str(project.start_date),
+                        "종료날짜": str(project.end_date),
+                        "D-day": project.d_day_display,
+                        "초기값": project.initial_progress,    # 편집 가능
+                        "현재값": project.current_progress,    # 읽기 전용 (계산값)
+                        "목표치": project.target_value         # 편집 가능
                     })
 
                 # 3: 데이터프레임 생성
@@ -116,10 +122,18 @@ class ProjectView:
                     key="active_projects_editor"
                 )
 
-                # 4: 데이터 변경 감지 및 저장 버튼
+                # 4: 데이터 변경 감지 (에디터 델타의 편집된 행만 벡터 비교) 및 저장 버튼
+                editor_state = st.session_state.get("active_projects_editor") or {}
+                changed_df = find_changed_rows(
+                    df,
+                    edited_df,
+                    ["초기값", "목표치"],
+                    edited_rows=editor_state.get("edited_rows")
+                )
+                changes_detected = not changed_df.empty
+
                 col1, col2, col3 = st.columns([2, 1, 1])
                 with col2:
-                    changes_detected = not df.equals(edited_df)
                     if changes_detected:
                         st.warning("변경사항이 감지되었습니다!")
 
@@ -134,7 +148,7 @@ class ProjectView:
 
                 # 5: 저장 버튼 처리
                 if save_button and changes_detected:
-                    self._handle_bulk_project_update(df, edited_df)
+                    self._handle_bulk_project_update(changed_df)
 
             else:
                 st.info("진행 중인 프로젝트가 없습니다.")
@@ -153,7 +167,9 @@ class ProjectView:
 
             # 1: 아카이브 프로젝트 데이터 캐싱
             cache_key = 'archived_projects'
-            if cache_key not in st.session_state:
+            cache_hit = cache_key in st.session_state
+            metrics.record_cache_lookup(cache_key, cache_hit)
+            if not cache_hit:
                 archived_projects = self.controller.get_archived_projects()
                 st.session_state[cache_key] = archived_projects
             else:
@@ -164,14 +180,14 @@ class ProjectView:
                 table_data = []
                 for project in archived_projects:
                     table_data.append({
-                        "ID": project["id"],
-                        "프로젝트명": project["name"],
-                        "시작날짜": str(project["start_date"]),
-                        "종료날짜": str(project["end_date"]),
-                        "D-day": project["d_day_display"],
-                        "초기값": project["initial_progress"],
-                        "현재값": project["current_progress"],    # 계산값
-                        "목표치": project["target_value"]
+                        "ID": project.id,
+                        "프로젝트명": project.name,
+                        "시작날짜": str(project.start_date),
+                        "종료날짜": str(project.end_date),
+                        "D-day": project.d_day_display,
+                        "초기값": project.initial_progress,
+                        "현재값": project.current_progress,    # 계산값
+                        "목표치": project.target_value
                     })
 
                 # 3: 데이터프레임 생성 (읽기 전용)
@@ -191,6 +207,115 @@ class ProjectView:
             self.logger.error(f"❌ 아카이브 섹션 렌더링 실패: {str(e)}")
             st.error("아카이브를 불러오는데 실패했습니다.")
 
+    def _render_project_detail(self):
+        """프로젝트 상세 - 번업/번다운 + 누적 작업시간 (프로젝트를 선택했을 때만 조회)"""
+        try:
+            st.markdown("---")
+            st.header("프로젝트 상세")
+
+            # 1: 프로젝트 선택 (위 섹션에서 캐시된 목록 재사용)
+            projects = st.session_state.get('active_projects', []) + st.session_state.get('archived_projects', [])
+            project_by_id = {project.id: project for project in projects}
+            selected_id = st.selectbox(
+                "프로젝트 선택",
+                options=list(project_by_id.keys()),
+                index=None,
+                format_func=lambda project_id: project_by_id[project_id].name,
+                placeholder="상세를 볼 프로젝트를 선택하세요",
+                label_visibility="collapsed",
+                key="project_detail_select"
+            )
+            if selected_id is None:
+                return
+            project = project_by_id[selected_id]
+
+            # 2: 선택한 프로젝트의 누적 이력 조회 (세션 캐시 - 마지막으로 연 프로젝트 1개)
+            cache_key = 'project_burnup'
+            cached = st.session_state.get(cache_key)
+            cache_hit = cached is not None and cached[0] == selected_id
+            metrics.record_cache_lookup(cache_key, cache_hit)
+            if not cache_hit:
+                burnup = self.controller.get_project_burnup(selected_id)
+                st.session_state[cache_key] = (selected_id, burnup)
+            else:
+                burnup = cached[1]
+
+            if burnup.empty:
+                st.info("이 프로젝트에는 작업 로그가 없습니다.")
+                return
+
+            # 3: 번업/번다운 + 누적 작업시간 차트
+            chart_type = st.radio(
+                "차트 종류",
+                options=["번업", "번다운"],
+                horizontal=True,
+                label_visibility="collapsed",
+                key="project_detail_chart"
+            )
+
+            col1, col2 = st.columns(2)
+            with col1:
+                st.plotly_chart(self._build_burn_figure(project, burnup, chart_type), use_container_width=True)
+            with col2:
+                st.plotly_chart(self._build_hours_figure(burnup), use_container_width=True)
+
+            self.logger.debug("✅ 프로젝트 상세 섹션 렌더링 성공")
+
+        except Exception as e:
+            self.logger.error(f"❌ 프로젝트 상세 섹션 렌더링 실패: {str(e)}")
+            st.error("프로젝트 상세를 불러오는데 실패했습니다.")
+
+    @staticmethod
+    def _build_burn_figure(project, burnup: pd.DataFrame, chart_type: str) -> go.Figure:
+        """번업(누적 진행도 vs 목표치) / 번다운(남은 작업량 vs 이상 추세선) 차트"""
+        fig = go.Figure()
+
+        if chart_type == "번업":
+            fig.add_trace(go.Scatter(
+                x=burnup['work_date'], y=burnup['cumulative_progress'],
+                mode='lines', line_shape='hv', name='누적 진행도'
+            ))
+            fig.add_hline(y=project.target_value, line_dash='dash', line_color='red',
+                          annotation_text=f"목표치 {project.target_value}")
+            y_title = "진행도"
+        else:
+            fig.add_trace(go.Scatter(
+                x=burnup['work_date'], y=burnup['remaining_work'],
+                mode='lines', line_shape='hv', name='남은 작업량'
+            ))
+            # 이상 추세선: 시작일 남은 작업량 → 마감일 0
+            fig.add_trace(go.Scatter(
+                x=[project.start_date, project.end_date],
+                y=[project.target_value - project.initial_progress, 0],
+                mode='lines', line=dict(dash='dot'), name='이상 추세'
+            ))
+            y_title = "남은 작업량"
+
+        fig.update_layout(
+            title=f"{project.name} {chart_type}",
+            xaxis_title="날짜",
+            yaxis_title=y_title,
+            hovermode='x unified',
+            height=400
+        )
+        return fig
+
+    @staticmethod
+    def _build_hours_figure(burnup: pd.DataFrame) -> go.Figure:
+        """누적 작업시간 차트"""
+        fig = go.Figure(go.Scatter(
+            x=burnup['work_date'], y=burnup['cumulative_hours'],
+            mode='lines', fill='tozeroy', name='누적 작업시간'
+        ))
+        fig.update_layout(
+            title="누적 작업시간",
+            xaxis_title="날짜",
+            yaxis_title="작업시간 (h)",
+            hovermode='x unified',
+            height=400
+        )
+        return fig
+
     # ===== 이벤트 핸들러 메서드들 =====
     def _handle_sync_button(self):
         """노션 동기화 버튼 처리"""
@@ -212,24 +337,15 @@ class ProjectView:
             st.session_state.error_toast = f"❌ 동기화 실패: {str(e)}"
             st.rerun()
 
-    def _handle_bulk_project_update(self, original_df, edited_df):
+    def _handle_bulk_project_update(self, changed_df: pd.DataFrame):
         """프로젝트 일괄 업데이트 처리"""
         try:
-            # 1: 변경된 값 추적
-            changes = []
-            for idx, (orig_row, edit_row) in enumerate(zip(original_df.itertuples(), edited_df.itertuples())):
-                project_id = orig_row.ID
-                orig_target = orig_row.목표치
-                orig_initial = orig_row.초기값
-                edit_target = edit_row.목표치
-                edit_initial = edit_row.초기값
-
-                if orig_target != edit_target or orig_initial != edit_initial:
-                    changes.append({
-                        'id': project_id,
-                        'target_value': edit_target,
-                        'initial_progress': edit_initial,
-                    })
+            # 1: 변경된 행 → 저장 필드
+            changes = (
+                changed_df[["ID", "목표치", "초기값"]]
+                .rename(columns={"ID": "id", "목표치": "target_value", "초기값": "initial_progress"})
+                .to_dict('records')
+            )
 
             # 2: 변경사항 업데이트
             with st.spinner(f"{len(changes)}개 프로젝트 진행률 업데이트 중..."):
@@ -270,28 +386,40 @@ class ProjectView:
                 # +: dashboard에 영향
                 st.session_state.project_updated_dash= True
                 st.session_state.project_updated_work_log = True
+                st.session_state.project_updated_calendar = True
 
         # 2: 프로젝트 업데이트 결과에 따른 캐시 관리
         elif operation_type == "update":
             updated_count = operation_result.get('updated_count', 0)
             if updated_count > 0:
                 self._clear_active_projects_cache()
+                self._clear_project_detail_cache()    # 초기값/목표치 변경 → 누적 이력 재조회
 
                 # +: dashboard에 영향
                 st.session_state.project_updated_dash= True
                 st.session_state.project_updated_work_log = True
+                st.session_state.project_updated_calendar = True
 
     def _clear_active_projects_cache(self):
         """진행 중 프로젝트 캐시만 무효화"""
         if 'active_projects' in st.session_state:
             del st.session_state['active_projects']
+            metrics.record_cache_eviction('active_projects')
 
     def _clear_archived_projects_cache(self):
         """아카이브 프로젝트 캐시만 무효화"""
         if 'archived_projects' in st.session_state:
             del st.session_state['archived_projects']
+            metrics.record_cache_eviction('archived_projects')
+
+    def _clear_project_detail_cache(self):
+        """프로젝트 상세(누적 이력) 캐시 무효화"""
+        if 'project_burnup' in st.session_state:
+            del st.session_state['project_burnup']
+            metrics.record_cache_eviction('project_burnup')
 
     def _clear_all_project_cache(self):
         """모든 프로젝트 캐시 무효화"""
         self._clear_active_projects_cache()
-        self._clear_archived_projects_cache()
\ No newline at end of file
+        self._clear_archived_projects_cache()
+        self._clear_project_detail_cache()
\ No newline at end of file
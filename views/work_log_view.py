@@ -1,9 +1,30 @@
+import html
+import math
+
 import streamlit as st
 import pandas as pd
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Any
 
+from controllers.export_controller import ExportController
+from controllers.project_controller import ProjectController
 from controllers.work_log_controller import WorkLogController
+from models.dto import MemoSearchPage, WorkLogPage
+from utils import metrics
+from utils.dataframe_diff import find_changed_rows
+
+# 편집 가능 컬럼 → 저장 필드 매핑
+EDITABLE_COLUMNS = {'진행량': 'progress_added', '작업시간': 'hours_spent', '메모': 'memo'}
+
+# 내보내기 데이터셋 (값 → 표시명)
+EXPORT_DATASET_LABELS = {"work_logs": "작업 로그 (조회 기간)", "project_stats": "프로젝트 통계 (전체)"}
+
+# 지난 작업 로그 페이지 크기
+PAGE_SIZE_OPTIONS = [50, 100, 200, 500]
+DEFAULT_PAGE_SIZE = 100
+
+# 메모 검색 결과 페이지 크기
+MEMO_SEARCH_PAGE_SIZE = 20
 
 
 class WorkLogView:
@@ -13,6 +34,8 @@ class WorkLogView:
 
         # TODO: 실제 컨트롤러 연결 필요
         self.controller = WorkLogController()
+        self.export_controller = ExportController()
+        self.project_controller = ProjectController()
 
     def render(self):
         """작업 로그 페이지 메인 렌더링"""
@@ -34,6 +57,7 @@ class WorkLogView:
         # 2: 컴포넌트 렌더링
         self._render_today_work_section()
         self._render_past_work_section()
+        self._render_memo_search_section()
 
     def _check_auto_refresh(self):
         """
@@ -62,7 +86,9 @@ class WorkLogView:
 
             # 2: 캐싱된 오늘 데이터 로드
             cache_key = f'today_work_data_{today.strftime("%Y-%m-%d")}'
-            if cache_key not in st.session_state:
+            cache_hit = cache_key in st.session_state
+            metrics.record_cache_lookup("today_work_data", cache_hit)
+            if not cache_hit:
                 today_work_data = self.controller.get_today_work_data()
                 st.session_state[cache_key] = today_work_data
             else:
@@ -91,7 +117,7 @@ class WorkLogView:
                 )
 
                 # 4: 데이터 변경 감지 및 저장 버튼
-                self._render_save_section(df, edited_df, "today")
+                self._render_save_section(df, edited_df, "today", "today_work_editor")
 
             else:
                 st.info("작업 기록이 없습니다. 진행 중인 프로젝트가 있는지 확인해주세요.")
@@ -108,7 +134,7 @@ class WorkLogView:
             st.markdown("---")
             st.header("지난 작업 로그")
 
-            col1, col2 = st.columns([3, 1])
+            col1, col2, col3 = st.columns([3, 1, 1])
 
             with col1:
                 period_options = {
@@ -145,18 +171,52 @@ class WorkLogView:
                 start_date = end_date - timedelta(days=days-1)
 
             with col2:
+                page_size = st.selectbox(
+                    "페이지 크기",
+                    options=PAGE_SIZE_OPTIONS,
+                    index=PAGE_SIZE_OPTIONS.index(DEFAULT_PAGE_SIZE),
+                    format_func=lambda size: f"{size}행",
+                    label_visibility="collapsed",
+                    key="past_page_size"
+                )
+
+            with col3:
                 search_button = st.button("🔍 조회", type="secondary", use_container_width=True)
 
-            # 2: 과거 작업 데이터 가져오기
-            if search_button or 'past_work_data' not in st.session_state:
-                past_work_data = self.controller.get_past_work_data(start_date, end_date)
-                st.session_state.past_work_data = past_work_data    # 세션 상태에 저장
+            # 2: 조회 조건 확정 (조회 버튼 / 페이지 크기 변경 시 첫 페이지부터 다시 조회)
+            if (search_button or
+                    'past_work_range' not in st.session_state or
+                    st.session_state.get('past_work_page_size') != page_size):
+                st.session_state.past_work_range = (start_date, end_date)
+                st.session_state.past_work_page_size = page_size
+                st.session_state.past_work_cursors = [None]    # 페이지별 시작 커서 스택
+                self._clear_past_work_log_cash()
+
+            range_start, range_end = st.session_state.past_work_range
+            cursors = st.session_state.past_work_cursors
+
+            # 3: 현재 페이지 + 기간 집계 가져오기 (페이지 크기만큼만 세션에 보관)
+            cache_hit = 'past_work_data' in st.session_state
+            metrics.record_cache_lookup("past_work_data", cache_hit)
+            if not cache_hit:
+                past_work_page = self.controller.get_past_work_page(range_start, range_end, page_size, cursors[-1])
+                st.session_state.past_work_data = past_work_page    # 세션 상태에 저장
             else:
-                past_work_data = st.session_state.past_work_data    # 캐시에서 빠른 로드
+                past_work_page = st.session_state.past_work_data    # 캐시에서 빠른 로드
 
-            if past_work_data:
-                # 3: 데이터프레임 생성
-                past_df = pd.DataFrame(past_work_data)
+            cache_hit = 'past_work_summary' in st.session_state
+            metrics.record_cache_lookup("past_work_summary", cache_hit)
+            if not cache_hit:
+                past_work_summary = self.controller.get_past_work_summary(range_start, range_end)
+                st.session_state.past_work_summary = past_work_summary
+            else:
+                past_work_summary = st.session_state.past_work_summary
+
+            past_df = past_work_page.frame
+            if not past_df.empty:
+                # 4: 현재 페이지 편집 (페이지마다 에디터 상태 분리)
+                page_number = len(cursors)
+                editor_key = f"past_work_editor_{page_number}"
                 edited_past_df = st.data_editor(
                     past_df,
                     disabled=["project_id","work_date", "날짜", "프로젝트명"],
@@ -171,14 +231,20 @@ class WorkLogView:
                     },
                     use_container_width=True,
                     hide_index=True,
-                    key="past_work_editor"
+                    key=editor_key
                 )
 
-                # 4: 데이터 변경 감지 및 저장 버튼
-                self._render_save_section(past_df, edited_past_df, "past")
+                # 5: 페이지 이동
+                self._render_page_navigation(past_work_page, past_work_summary, page_size)
 
-                # 5: 기간 요약
-                self._render_period_summary(past_work_data)
+                # 6: 데이터 변경 감지 및 저장 버튼
+                self._render_save_section(past_df, edited_past_df, "past", editor_key)
+
+                # 7: 기간 요약
+                self._render_period_summary(past_work_summary)
+
+                # 8: 조회 기간 내보내기
+                self._render_export_section(range_start, range_end)
 
             else:
                 st.info(f"📝 선택한 기간에 작업 기록이 없습니다.")
@@ -189,14 +255,135 @@ class WorkLogView:
             self.logger.error(f"❌ 지난 작업로그 섹션 렌더링 실패: {str(e)}")
             st.error("지난 작업로그를 불러오는데 실패했습니다.")
 
-    def _render_period_summary(self, past_work_data: List[Dict]):
-        """선택 기간 요약 표시"""
+    def _render_memo_search_section(self):
+        """하단: 메모 전문 검색 섹션 (관련도순, 기간 / 프로젝트 필터)"""
+        try:
+            st.markdown("---")
+            st.header("메모 검색")
+
+            # 1: 검색 조건 입력
+            with st.form("memo_search_form"):
+                col1, col2 = st.columns([3, 2])
+                with col1:
+                    text = st.text_input("검색어", placeholder="메모에 포함된 단어 (공백으로 구분, 모두 포함)",
+                                         key="memo_search_text")
+                with col2:
+                    projects = self.project_controller.get_active_projects() + \
+                        self.project_controller.get_archived_projects()
+                    project_names = {project.id: project.name for project in projects}
+                    selected_ids = st.multiselect("프로젝트", options=list(project_names.keys()),
+                                                  format_func=lambda project_id: project_names[project_id],
+                                                  placeholder="전체 프로젝트", key="memo_search_projects")
+
+                col_start, col_end, col_button = st.columns([2, 2, 1])
+                with col_start:
+                    start_date = st.date_input("시작일", value=None, key="memo_search_start")
+                with col_end:
+                    end_date = st.date_input("종료일", value=None, key="memo_search_end")
+                with col_button:
+                    st.write("")
+                    search_button = st.form_submit_button("🔍 검색", use_container_width=True)
+
+            # 2: 검색 조건 확정 (검색 버튼을 누르면 첫 페이지부터)
+            if search_button:
+                st.session_state.memo_search_criteria = (text, start_date, end_date, selected_ids or None)
+                st.session_state.memo_search_page_number = 1
+                self._clear_memo_search_cash()
+
+            if 'memo_search_criteria' not in st.session_state:
+                return
+
+            # 3: 현재 페이지 가져오기 (세션 캐시)
+            cache_hit = 'memo_search_page' in st.session_state
+            metrics.record_cache_lookup("memo_search_page", cache_hit)
+            if not cache_hit:
+                text, start_date, end_date, project_ids = st.session_state.memo_search_criteria
+                search_page = self.controller.search_memos(
+                    text, st.session_state.memo_search_page_number, MEMO_SEARCH_PAGE_SIZE,
+                    start_date, end_date, project_ids
+                )
+                st.session_state.memo_search_page = search_page
+            else:
+                search_page = st.session_state.memo_search_page
+
+            if search_page.frame.empty:
+                st.info("🔎 검색 결과가 없습니다.")
+                return
+
+            # 4: 결과 목록 (일치 부분 강조 - 서비스에서 이스케이프 완료)
+            for row in search_page.frame.itertuples(index=False):
+                st.markdown(
+                    f"**{row.날짜}** · {html.escape(row.프로젝트명)} · 진행량 {row.진행량} · "
+                    f"{row.작업시간:.1f}시간<br>{row.메모}",
+                    unsafe_allow_html=True
+                )
+
+            # 5: 페이지 이동
+            self._render_memo_search_navigation(search_page)
+
+        except ValueError as e:
+            st.warning(str(e).replace("⚙️❌ ", ""))
+        except Exception as e:
+            self.logger.error(f"❌ 메모 검색 섹션 렌더링 실패: {str(e)}")
+            st.error("메모 검색에 실패했습니다.")
+
+    def _render_memo_search_navigation(self, search_page: MemoSearchPage):
+        """검색 결과 이전/다음 페이지 이동"""
+        col1, col2, col3 = st.columns([1, 2, 1])
+
+        with col1:
+            prev_button = st.button("◀ 이전", disabled=search_page.page == 1,
+                                    use_container_width=True, key="memo_search_prev_page")
+
+        with col2:
+            st.caption(f"{search_page.page} / {search_page.total_pages} 페이지 · 전체 {search_page.total_count}건")
+
+        with col3:
+            next_button = st.button("다음 ▶", disabled=not search_page.has_next,
+                                    use_container_width=True, key="memo_search_next_page")
+
+        if prev_button or next_button:
+            st.session_state.memo_search_page_number += 1 if next_button else -1
+            self._clear_memo_search_cash()
+            st.rerun()
+
+    def _render_page_navigation(self, past_work_page: WorkLogPage, past_work_summary: Dict[str, Any], page_size: int):
+        """이전/다음 페이지 이동 (커서 스택 push/pop)"""
+        cursors = st.session_state.past_work_cursors
+        page_number = len(cursors)
+        total_pages = max(1, math.ceil(past_work_summary['total_count'] / page_size))
+
+        col1, col2, col3 = st.columns([1, 2, 1])
+
+        with col1:
+            prev_button = st.button("◀ 이전", disabled=page_number == 1,
+                                    use_container_width=True, key="past_prev_page")
+
+        with col2:
+            st.caption(f"{page_number} / {total_pages} 페이지 · 전체 {past_work_summary['total_count']}건")
+
+        with col3:
+            next_button = st.button("다음 ▶", disabled=not past_work_page.has_next,
+                                    use_container_width=True, key="past_next_page")
+
+        if prev_button:
+            cursors.pop()
+            self._clear_past_work_page_cash()
+            st.rerun()
+
+        if next_button:
+            cursors.append(past_work_page.next_cursor)
+            self._clear_past_work_page_cash()
+            st.rerun()
+
+    def _render_period_summary(self, past_work_summary: Dict[str, Any]):
+        """선택 기간 요약 표시 (페이지와 무관하게 기간 전체 집계)"""
         st.markdown("### 📈 요약")
 
-        # 1: 요약 계산
-        total_days = len(set(item['날짜'] for item in past_work_data))
-        total_hours = sum(item['작업시간'] for item in past_work_data)
-        total_projects = len(set(item['프로젝트명'] for item in past_work_data))
+        # 1: 요약 값 (집계 쿼리 결과)
+        total_days = past_work_summary['work_days']
+        total_hours = past_work_summary['total_hours']
+        total_projects = past_work_summary['project_count']
 
         # 2: 메트릭 표시
         col1, col2, col3 = st.columns(3)
@@ -210,13 +397,54 @@ class WorkLogView:
         with col3:
             st.metric("작업한 프로젝트", f"{total_projects}개")
 
-    def _render_save_section(self, original_df: pd.DataFrame, edited_df: pd.DataFrame, update_type: str):
+    def _render_export_section(self, start_date: date, end_date: date):
+        """조회 기간 작업 로그 / 프로젝트 통계 내보내기 (버튼을 눌렀을 때만 파일 생성)"""
+        with st.expander("📤 내보내기"):
+            col1, col2, col3 = st.columns([2, 1, 1])
+
+            with col1:
+                dataset = st.selectbox(
+                    "데이터",
+                    options=list(EXPORT_DATASET_LABELS.keys()),
+                    format_func=lambda key: EXPORT_DATASET_LABELS[key],
+                    key="export_dataset"
+                )
+            with col2:
+                fmt = st.selectbox("형식", options=["csv", "parquet"], key="export_format")
+            with col3:
+                st.write("")
+                build_button = st.button("파일 생성", use_container_width=True, key="export_build")
+
+            if build_button:
+                try:
+                    with st.spinner("내보내는 중..."):
+                        data = self.export_controller.export_bytes(dataset, fmt, start_date, end_date)
+                    st.download_button(
+                        "💾 다운로드",
+                        data=data,
+                        file_name=f"{dataset}_{start_date}_{end_date}.{fmt}",
+                        mime="text/csv" if fmt == "csv" else "application/octet-stream",
+                        key="export_download"
+                    )
+                except Exception as e:
+                    st.error(f"❌ 내보내기 실패: {str(e)}")
+
+    def _render_save_section(self, original_df: pd.DataFrame, edited_df: pd.DataFrame,
+                             update_type: str, editor_key: str):
         """통합된 저장 섹션 렌더링"""
-        # 1: 변경 감지 및 저장 버튼
+        # 1: 변경 감지 (에디터 델타의 편집된 행만 벡터 비교) 및 저장 버튼
+        editor_state = st.session_state.get(editor_key) or {}
+        changed_df = find_changed_rows(
+            original_df,
+            edited_df,
+            EDITABLE_COLUMNS.keys(),
+            edited_rows=editor_state.get("edited_rows")
+        )
+        changes_detected = not changed_df.empty
+
         col1, col2, col3 = st.columns([2, 1, 1])
 
         with col2:
-            changes_detected = not original_df.equals(edited_df)
             if changes_detected:
                 st.warning("변경사항이 감지되었습니다!")
 
@@ -231,39 +459,31 @@ class WorkLogView:
 
         # 2: 저장 처리
         if save_button and changes_detected:
-            self._handle_work_log_update(original_df, edited_df, update_type)
+            self._handle_work_log_update(changed_df, update_type)
 
     # ===== 이벤트 핸들러들 =====
-    def _handle_work_log_update(self, original_df: pd.DataFrame, edited_df: pd.DataFrame, update_type: str):
+    def _handle_work_log_update(self, changed_df: pd.DataFrame, update_type: str):
         """통합된 작업 로그 업데이트 핸들러"""
         try:
-            # 1: 변경된 행들 찾기
-            changes = []
-            for idx, (orig_row, edit_row) in enumerate(zip(original_df.itertuples(), edited_df.itertuples())):
-                # 편집 가능한 3개 열 비교
-                if (orig_row.진행량 != edit_row.진행량 or
-                    orig_row.작업시간 != edit_row.작업시간 or
-                    orig_row.메모 != edit_row.메모):
-
-                    # work_date가 이미 테이블에 포함됨
-                    changes.append({
-                        'project_id': edit_row.project_id,
-                        'work_date': edit_row.work_date,
-                        'progress_added': edit_row.진행량,
-                        'hours_spent': edit_row.작업시간,
-                        'memo': edit_row.메모
-                    })
+            # 1: 변경된 행 → 저장 필드 (work_date가 이미 테이블에 포함됨, 지운 메모는 빈 문자열)
+            changes = (
+                changed_df[['project_id', 'work_date', *EDITABLE_COLUMNS]]
+                .rename(columns=EDITABLE_COLUMNS)
+                .fillna({'memo': ""})
+                .to_dict('records')
+            )
 
             # 2: 컨트롤러 호출
             if changes:
                 with st.spinner(f"{len(changes)}개 작업 로그 저장 중..."):
                     updated_count = self.controller.update_work_logs(changes)  # 통합 메서드
 
-                # 3: 캐시 무효화
+                # 3: 캐시 무효화 (메모가 바뀌었을 수 있으므로 검색 결과도)
                 if update_type == "today":
                     self._clear_today_work_log_cash()
                 else:
                     self._clear_past_work_log_cash()
+                self._clear_memo_search_cash()
 
                 # +: dashboard, projects에 영향
                 st.session_state.work_log_updated = True
@@ -284,13 +504,29 @@ class WorkLogView:
         today_key = f'today_work_data_{date.today().strftime("%Y-%m-%d")}'
         if today_key in st.session_state:
             del st.session_state[today_key]
+            metrics.record_cache_eviction("today_work_data")
 
-    def _clear_past_work_log_cash(self):
-        """과거 작업 로그 캐시 무효화"""
+    def _clear_past_work_page_cash(self):
+        """과거 작업 로그 현재 페이지 캐시 무효화 (페이지 커서는 유지)"""
         if 'past_work_data' in st.session_state:
             del st.session_state['past_work_data']
+            metrics.record_cache_eviction("past_work_data")
+
+    def _clear_past_work_log_cash(self):
+        """과거 작업 로그 캐시 무효화 (현재 페이지 + 기간 집계)"""
+        self._clear_past_work_page_cash()
+        if 'past_work_summary' in st.session_state:
+            del st.session_state['past_work_summary']
+            metrics.record_cache_eviction("past_work_summary")
+
+    def _clear_memo_search_cash(self):
+        """메모 검색 현재 페이지 캐시 무효화 (검색 조건은 유지)"""
+        if 'memo_search_page' in st.session_state:
+            del st.session_state['memo_search_page']
+            metrics.record_cache_eviction("memo_search_page")
 
     def _clear_all_work_log_cash(self):
         """모든 작업 로그 캐시 무효화"""
         self._clear_today_work_log_cash()
-        self._clear_past_work_log_cash()
\ No newline at end of file
+        self._clear_past_work_log_cash()
+        self._clear_memo_search_cash()
\ No newline at end of file